@@ -1,3 +1,38 @@
-from poli_sci_kit import appointment, plot, utils
+from importlib import import_module
+from types import ModuleType
 
 __all__ = ["appointment", "plot", "utils"]
+
+
+def __getattr__(name: str) -> ModuleType:
+    """
+    Import a subpackage on first access.
+
+    Parameters
+    ----------
+    name : str
+        The name of the attribute being accessed.
+
+    Returns
+    -------
+    ModuleType
+        The imported subpackage.
+    """
+    # Subpackages are imported on first access such that plotting dependencies
+    # aren't loaded when only apportionment is used.
+    if name in __all__:
+        return import_module(f"{__name__}.{name}")
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """
+    List the attributes of the package including subpackages that are yet to be imported.
+
+    Returns
+    -------
+    list[str]
+        The sorted names of the attributes and subpackages.
+    """
+    return sorted({*globals(), *__all__})
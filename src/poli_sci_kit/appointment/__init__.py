@@ -1,3 +1,46 @@
-from poli_sci_kit.appointment import checks, methods, metrics
+from importlib import import_module
+from types import ModuleType
 
-__all__ = ["checks", "methods", "metrics"]
+__all__ = [
+    "checks",
+    "districts",
+    "methods",
+    "metrics",
+    "pipeline",
+    "results",
+    "simulation",
+]
+
+
+def __getattr__(name: str) -> ModuleType:
+    """
+    Import a module on first access.
+
+    Parameters
+    ----------
+    name : str
+        The name of the attribute being accessed.
+
+    Returns
+    -------
+    ModuleType
+        The imported module.
+    """
+    # Modules are imported on first access such that importing methods doesn't
+    # load the dependencies of metrics and checks.
+    if name in __all__:
+        return import_module(f"{__name__}.{name}")
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """
+    List the attributes of the package including modules that are yet to be imported.
+
+    Returns
+    -------
+    list[str]
+        The sorted names of the attributes and modules.
+    """
+    return sorted({*globals(), *__all__})
@@ -3,25 +3,33 @@
 Functions to conditionally check appointment methods.
 """
 
-from math import ceil, floor
+from __future__ import annotations
 
-import pandas as pd
+from math import ceil, floor
+from typing import TYPE_CHECKING
 
 from poli_sci_kit.appointment.metrics import ideal_share
+from poli_sci_kit.appointment.results import AllocationResult
+
+# pandas is imported where it's used such that importing checks doesn't load it.
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 def quota_condition(
-    shares: list[float], seats: list[int]
+    shares: list[float] | None = None, seats: list[int] | AllocationResult | None = None
 ) -> bool | dict[int, tuple[int | float, int]]:
     """
     Check whether assignment method results fall within the range of the ideal share rounded down and up.
 
     Parameters
     ----------
-    shares : list[float]
+    shares : list[float] (default=None)
         The proportion of the population or votes for the regions or parties.
 
-    seats : list[int]
+        Note: can be None if seats is an AllocationResult, with the ideal shares of the result being used.
+
+    seats : list[int] | AllocationResult (default=None)
         The share of seats given to the regions or parties.
 
     Returns
@@ -33,20 +41,26 @@ def quota_condition(
     -----
     https://en.wikipedia.org/wiki/Quota_rule
     """
+    assert seats is not None, "'seats' must be provided."
+    if isinstance(seats, AllocationResult) and shares is None:
+        shares = seats.shares.tolist()
+        ideal_shares = seats.ideal_shares.tolist()
+
+    else:
+        assert shares is not None, "'shares' must be provided."
+        ideal_shares = [
+            ideal_share(share=s, total_shares=sum(shares), total_allocation=sum(seats))
+            for s in shares
+        ]
+
     assert len(shares) == len(seats), (
         "The total different shares of a population or vote must equal that of the allocated seats."
     )
 
+    seats = list(seats)
     check_list = [
-        ceil(
-            ideal_share(share=s, total_shares=sum(shares), total_allocation=sum(seats))
-        )
-        >= seats[i]
-        and floor(
-            ideal_share(share=s, total_shares=sum(shares), total_allocation=sum(seats))
-        )
-        <= seats[i]
-        for i, s in enumerate(shares)
+        ceil(ideal_shares[i]) >= seats[i] and floor(ideal_shares[i]) <= seats[i]
+        for i in range(len(shares))
     ]
 
     fail_report = {i: (shares[i], seats[i]) for i, c in enumerate(check_list) if not c}
@@ -216,6 +230,8 @@ def consistency_condition(
         assert df_shares is not None and df_seats is not None, (
             "'df_shares' and 'df_seats' must be provided for share_monotony."
         )
+        import pandas as pd
+
         # The fail report df has share and seat columns alternated.
         df_fail_report = pd.DataFrame()
         col = 0
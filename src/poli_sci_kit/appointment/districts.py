@@ -0,0 +1,230 @@
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Functions to derive allocations for many districts at once.
+
+Contents:
+    district_apportionment
+"""
+
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from poli_sci_kit.appointment.methods import (
+    highest_averages_batch,
+    largest_remainder_batch,
+)
+
+
+def district_apportionment(
+    method: str = "highest_averages",
+    style: str | None = None,
+    districts: np.ndarray | list | None = None,
+    shares: np.ndarray | list[int] | None = None,
+    total_allocations: Mapping | int | None = None,
+    allocation_threshold: float | None = None,
+    min_alloc: int | None = None,
+    tie_break: str = "majority",
+    modifier: float | None = None,
+    n_jobs: int = 1,
+    chunk_size: int | None = None,
+    rng: np.random.Generator | int | None = None,
+) -> np.ndarray:
+    """
+    Apportion seats within each district of a long table of (district, group, share) rows.
+
+    Parameters
+    ----------
+    method : str (default=highest_averages)
+        The apportionment method to use in each district.
+
+        Options: highest_averages, largest_remainder.
+
+    style : str (default=None)
+        The averaging_style or quota_style of the method, with None using the default of the method.
+
+    districts : np.ndarray | list (num_rows; default=None)
+        The district of each row, such as a column of a DataFrame.
+
+    shares : np.ndarray | list[int] (num_rows; default=None)
+        The populations or votes of the group of each row.
+
+    total_allocations : Mapping | int (default=None)
+        The number of allocations to provide in each district, either as a mapping from districts or for all districts.
+
+    allocation_threshold : float (default=None)
+        A minimum percentage of the population or votes of a district that must be met to receive an allocation.
+
+    min_alloc : int (default=None)
+        A minimum number of allocations that each group must receive.
+
+    tie_break : str (default=majority)
+        How a tie break is done (by majority or random, with a majority tie defaulting to random).
+
+    modifier : float (default=None)
+        What to replace the divisor of the first quotient by for highest averages methods.
+
+    n_jobs : int (default=1)
+        The number of processes to apportion chunks of districts on, with 1 apportioning them in the current process.
+
+    chunk_size : int (default=None)
+        The number of districts in each chunk, with None splitting districts evenly across n_jobs.
+
+    rng : np.random.Generator | int (default=None)
+        The generator or seed used for random tie breaks, with each chunk being given an independent stream spawned from it.
+
+    Returns
+    -------
+    np.ndarray (num_rows,)
+        The allocations of each row in the order of the provided rows.
+
+    Notes
+    -----
+    Rows are sorted by district once, with each chunk being passed to workers as contiguous slices of the share array and the offsets of its districts rather than as per district tables.
+
+    Districts of a chunk with the same number of groups are apportioned at once via highest_averages_batch or largest_remainder_batch.
+
+    Divisor methods added via register_divisor_method are only available in workers if they are registered when the module is imported.
+    """
+    assert districts is not None, "'districts' must be provided."
+    assert shares is not None, "'shares' must be provided."
+    assert total_allocations is not None, "'total_allocations' must be provided."
+    assert n_jobs >= 1, "'n_jobs' must be at least 1."
+
+    if method not in ["highest_averages", "largest_remainder"]:
+        raise ValueError(
+            f"'{method}' is not a supported method. Please choose from 'highest_averages' or 'largest_remainder'."
+        )
+
+    district_array = np.asarray(districts)
+    share_array = np.asarray(shares)
+    assert district_array.shape == share_array.shape and share_array.ndim == 1, (
+        "'districts' and 'shares' must be one dimensional and of the same length."
+    )
+
+    district_labels, district_codes = np.unique(district_array, return_inverse=True)
+    order = np.argsort(district_codes, kind="stable")
+    offsets = np.concatenate(
+        [[0], np.cumsum(np.bincount(district_codes, minlength=len(district_labels)))]
+    )
+
+    if isinstance(total_allocations, Mapping):
+        totals = np.asarray(
+            [total_allocations[d] for d in district_labels.tolist()], dtype=np.int64
+        )
+
+    else:
+        totals = np.full(len(district_labels), total_allocations, dtype=np.int64)
+
+    method_kwargs = {
+        "allocation_threshold": allocation_threshold,
+        "min_alloc": min_alloc,
+        "tie_break": tie_break,
+    }
+    if method == "highest_averages":
+        method_kwargs["modifier"] = modifier
+
+    if style is not None:
+        method_kwargs[
+            "averaging_style" if method == "highest_averages" else "quota_style"
+        ] = style
+
+    if chunk_size is None:
+        chunk_size = -(-len(district_labels) // n_jobs)
+
+    chunk_starts = range(0, len(district_labels), max(chunk_size, 1))
+    chunk_rngs = (
+        [None] * len(chunk_starts)
+        if rng is None
+        else np.random.default_rng(rng).spawn(len(chunk_starts))
+    )
+
+    sorted_shares = share_array[order]
+    chunks = [
+        (
+            method,
+            method_kwargs,
+            sorted_shares[
+                offsets[start] : offsets[min(start + chunk_size, len(totals))]
+            ],
+            offsets[start : start + chunk_size + 1] - offsets[start],
+            totals[start : start + chunk_size],
+            chunk_rng,
+        )
+        for start, chunk_rng in zip(chunk_starts, chunk_rngs, strict=True)
+    ]
+
+    if n_jobs == 1 or len(chunks) <= 1:
+        chunk_allocations = [_apportion_chunk(*chunk) for chunk in chunks]
+
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            chunk_allocations = list(executor.map(_apportion_chunk, *zip(*chunks)))
+
+    allocations = np.zeros(len(share_array), dtype=np.int64)
+    if chunk_allocations:
+        allocations[order] = np.concatenate(chunk_allocations)
+
+    return allocations
+
+
+def _apportion_chunk(
+    method: str,
+    method_kwargs: dict,
+    shares: np.ndarray,
+    offsets: np.ndarray,
+    totals: np.ndarray,
+    rng: np.random.Generator | None,
+) -> np.ndarray:
+    """
+    Apportion seats within each district of a chunk of districts.
+
+    Parameters
+    ----------
+    method : str
+        The apportionment method to use in each district.
+
+    method_kwargs : dict
+        The arguments passed to the method other than shares and total_allocation.
+
+    shares : np.ndarray
+        The shares of the rows of the chunk sorted by district.
+
+    offsets : np.ndarray (num_districts + 1,)
+        The indexes of shares where each district starts, followed by the number of rows.
+
+    totals : np.ndarray (num_districts,)
+        The number of allocations to provide in each district.
+
+    rng : np.random.Generator
+        The generator used for random tie breaks.
+
+    Returns
+    -------
+    np.ndarray
+        The allocations of the rows of the chunk.
+
+    Notes
+    -----
+    Districts are grouped by their number of groups rather than padded, as padded groups without shares could still receive minimum allocations.
+    """
+    apportion_batch = (
+        highest_averages_batch
+        if method == "highest_averages"
+        else largest_remainder_batch
+    )
+    num_groups = np.diff(offsets)
+
+    allocations = np.zeros(len(shares), dtype=np.int64)
+    for size in np.unique(num_groups).tolist():
+        size_districts = np.flatnonzero(num_groups == size)
+        rows = offsets[size_districts][:, None] + np.arange(size)
+        allocations[rows] = apportion_batch(
+            shares=shares[rows],
+            total_allocation=totals[size_districts],
+            rng=rng,
+            **method_kwargs,
+        )
+
+    return allocations
@@ -15,23 +15,172 @@
 
     highest_averages
 
-        Options: Jefferson, Webster, Huntington-Hill.
+        Options: Jefferson, Webster, Huntington-Hill, Adams, Dean, Danish, Imperiali.
+
+    biproportional (aka double proportional, Pukelsheim)
+
+    compensatory_allocation (aka overhang compensation, mixed-member proportional)
+
+    seat_vote_breakpoints (seats-votes curves of groups)
+
+    Apportioner (incremental updates of allocations)
 """
 
-from math import ceil, modf, sqrt
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from fractions import Fraction
+from functools import wraps
+from heapq import heapify, heappop, heappush
+from inspect import signature
+from itertools import islice
+from math import ceil, inf, modf, sqrt
 from operator import itemgetter
 from random import shuffle
+from threading import Lock, local
+
+import numpy as np
+
+from poli_sci_kit.appointment.results import AllocationResult
+
+# Divisors of highest averages methods given the allocations of groups, registered
+# as the numerator and denominator of their squares such that irrational divisors
+# can also be compared exactly.
+_DIVISOR_METHODS: dict[str, Callable] = {
+    "Jefferson": lambda a: ((a + 1) ** 2, 1),
+    "Webster": lambda a: (((2 * a) + 1) ** 2, 1),
+    "Huntington-Hill": lambda a: (a * (a + 1), 1),
+    "Adams": lambda a: (a**2, 1),
+    "Dean": lambda a: ((2 * a * (a + 1)) ** 2, ((2 * a) + 1) ** 2),
+    "Danish": lambda a: (((3 * a) + 1) ** 2, 1),
+    "Imperiali": lambda a: ((a + 2) ** 2, 1),
+}
+
+# Real allocations at which the divisors of the built-in methods equal a quotient,
+# such that the allocations of groups above a divisor can be derived in closed form.
+_DIVISOR_INVERSES: dict[str, Callable] = {
+    "Jefferson": lambda x: x - 1,
+    "Webster": lambda x: (x - 1) / 2,
+    "Huntington-Hill": lambda x: (np.sqrt(1 + 4 * x**2) - 1) / 2,
+    "Adams": lambda x: x,
+    "Dean": lambda x: (x - 1 + np.sqrt(x**2 + 1)) / 2,
+    "Danish": lambda x: (x - 1) / 3,
+    "Imperiali": lambda x: x - 2,
+}
+
+# Results of apportionment calls, with a maxsize of 0 meaning that caching is disabled.
+_RESULT_CACHE: OrderedDict = OrderedDict()
+_RESULT_CACHE_STATS = {"hits": 0, "misses": 0, "maxsize": 0}
+_RESULT_CACHE_LOCK = Lock()
+
+# Whether the current thread has broken a tie randomly, such that its results aren't cached.
+_TIE_BREAK_STATE = local()
+
+# The number of shares of a group that largest remainder breakpoints are tested at at once.
+_BREAKPOINT_CHUNK_SIZE = 4096
+
+
+def _memoize_apportionment(function: Callable) -> Callable:
+    """
+    Wrap an apportionment function such that its results are cached when the result cache is enabled.
+
+    Parameters
+    ----------
+    function : Callable
+        The apportionment function to wrap.
+
+    Returns
+    -------
+    Callable
+        The function with results keyed on the function, a tuple of the shares and all other arguments.
+    """
+    parameters = signature(function)
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        """
+        Return the cached result of the arguments, or derive and cache it if it is deterministic.
+
+        Parameters
+        ----------
+        *args : tuple
+            The positional arguments of the apportionment function.
+
+        **kwargs : dict
+            The keyword arguments of the apportionment function.
+
+        Returns
+        -------
+        list | np.ndarray | pd.Series | AllocationResult
+            The result of the apportionment function, with cached allocations being returned as a new list.
+        """
+        if not _RESULT_CACHE_STATS["maxsize"]:
+            return function(*args, **kwargs)
+
+        arguments = parameters.bind(*args, **kwargs)
+        arguments.apply_defaults()
+        if (
+            arguments.arguments["tie_break"] == "random"
+            or arguments.arguments["return_result"]
+            or not isinstance(arguments.arguments["rng"], int | None)
+            or not isinstance(arguments.arguments["shares"], Iterable)
+            or _as_share_array(shares=arguments.arguments["shares"]) is not None
+        ):
+            return function(*arguments.args, **arguments.kwargs)
+
+        # Shares are only iterated once such that generators are also passed on.
+        arguments.arguments["shares"] = tuple(arguments.arguments["shares"])
+        key = (
+            function.__name__,
+            *arguments.arguments.values(),
+        )
+        try:
+            hash(key)
+
+        except TypeError:
+            return function(*arguments.args, **arguments.kwargs)
+
+        with _RESULT_CACHE_LOCK:
+            if key in _RESULT_CACHE:
+                _RESULT_CACHE.move_to_end(key)
+                _RESULT_CACHE_STATS["hits"] += 1
+                return list(_RESULT_CACHE[key])
+
+            _RESULT_CACHE_STATS["misses"] += 1
+
+        outer_used_random = getattr(_TIE_BREAK_STATE, "used_random", False)
+        _TIE_BREAK_STATE.used_random = False
+        try:
+            result = function(*arguments.args, **arguments.kwargs)
+            used_random = _TIE_BREAK_STATE.used_random
+
+        finally:
+            _TIE_BREAK_STATE.used_random |= outer_used_random
+
+        if not used_random:
+            with _RESULT_CACHE_LOCK:
+                if _RESULT_CACHE_STATS["maxsize"]:
+                    _RESULT_CACHE[key] = list(result)
+                    while len(_RESULT_CACHE) > _RESULT_CACHE_STATS["maxsize"]:
+                        _RESULT_CACHE.popitem(last=False)
+
+        return result
 
+    return wrapper
 
+
+@_memoize_apportionment
 def largest_remainder(
     quota_style: str = "Hare",
-    shares: list[int] | None = None,
+    shares: list[int] | np.ndarray | None = None,
     total_allocation: int | None = None,
     allocation_threshold: float | None = None,
     min_alloc: int | None = None,
     tie_break: str = "majority",
     majority_bonus: bool = False,
-) -> list:
+    exact: bool = False,
+    rng: np.random.Generator | int | None = None,
+    return_result: bool = False,
+) -> list | np.ndarray | AllocationResult:
     r"""
     Apportion seats using the Largest Remainder (Hamilton, Vinton, Hare–Niemeyer) methods.
 
@@ -66,9 +215,11 @@ def largest_remainder(
 
                 Note: favors larger groups more than the Hare quota.
 
-    shares : list (default=None)
+    shares : list | np.ndarray (default=None)
         A list of populations or votes for regions or parties.
 
+        Note: arrays, pandas Series and buffers are apportioned without conversion to lists, with allocations being returned as a Series for pandas Series and as a np.ndarray otherwise.
+
     total_allocation : int (default=None)
         The number of allocations to provide.
 
@@ -84,10 +235,21 @@ def largest_remainder(
     majority_bonus : bool (default=False)
         Whether the largest group is automatically given 50% of the vote.
 
+    exact : bool (default=False)
+        Whether remainders are derived and compared as integers rather than floats.
+
+        Note: requires integer shares, with remainders being compared via their numerators over the quota such that ties are exact.
+
+    rng : np.random.Generator | int (default=None)
+        The generator or seed used for random tie breaks, with None using the global state of the random module.
+
+    return_result : bool (default=False)
+        Whether to return an AllocationResult holding the quota, remainders and tied groups along with the allocations.
+
     Returns
     -------
-    list
-        A list of allocations in the order of the provided shares.
+    list | np.ndarray | pd.Series | AllocationResult
+        A list of allocations in the order of the provided shares, a Series if shares are a pandas Series, an array if shares are another array or buffer, or an AllocationResult if return_result is True.
     """
     assert (
         allocation_threshold is None or min_alloc is None
@@ -95,7 +257,49 @@ def largest_remainder(
         Set one of allocation_threshold or min_alloc to None."""
     assert shares is not None, "'shares' must be provided."
     assert total_allocation is not None, "'total_allocation' must be provided."
+
+    rng = _get_rng(rng=rng)
+    share_array = _as_share_array(shares=shares)
+    if share_array is not None and not (majority_bonus or return_result):
+        return _like_shares(
+            shares=shares,
+            allocations=largest_remainder_batch(
+                quota_style=quota_style,
+                shares=share_array[np.newaxis],
+                total_allocation=total_allocation,
+                allocation_threshold=allocation_threshold,
+                min_alloc=min_alloc,
+                tie_break=tie_break,
+                exact=exact,
+                rng=rng,
+            )[0],
+        )
+
+    if share_array is not None and not return_result:
+        return _like_shares(
+            shares=shares,
+            allocations=np.asarray(
+                largest_remainder(
+                    quota_style=quota_style,
+                    shares=share_array.tolist(),
+                    total_allocation=total_allocation,
+                    allocation_threshold=allocation_threshold,
+                    min_alloc=min_alloc,
+                    tie_break=tie_break,
+                    majority_bonus=majority_bonus,
+                    exact=exact,
+                    rng=rng,
+                ),
+                dtype=np.int64,
+            ),
+        )
+
     shares = list(shares)
+    if exact:
+        assert all(int(s) == s for s in shares), (
+            "'shares' must be integers when using exact remainders."
+        )
+        shares = [int(s) for s in shares]
 
     def get_quota(quota_style: str, shares: list[int], total_allocation: int) -> float:
         """
@@ -133,12 +337,117 @@ def get_quota(quota_style: str, shares: list[int], total_allocation: int) -> flo
 
         return seat_quota
 
+    def divide_by_quota(
+        quota_style: str, shares: list[int], total_allocation: int
+    ) -> tuple[tuple, tuple]:
+        """
+        Split the shares of each group by the seat quota into remainders and whole allocations.
+
+        Parameters
+        ----------
+        quota_style : str
+            The name of the quota style to use in the calculation.
+
+        shares : list[int]
+            The allocated votes.
+
+        total_allocation : int
+            The number of allocations to provide.
+
+        Returns
+        -------
+        tuple[tuple, tuple]
+            The remainders and whole allocations of each group.
+
+        Notes
+        -----
+        Exact remainders are the integer numerators of the remainders over the quota numerator, and as such are comparable within a call.
+        """
+        if not exact:
+            seat_quota = get_quota(
+                quota_style=quota_style,
+                shares=shares,
+                total_allocation=total_allocation,
+            )
+            return tuple(zip(*[modf(1.0 * s / seat_quota) for s in shares]))
+
+        if quota_style == "Hare":
+            quota_numerator, quota_denominator = sum(shares), total_allocation
+
+        elif quota_style == "Droop":
+            quota_numerator, quota_denominator = (
+                sum(shares) // (total_allocation + 1) + 1,
+                1,
+            )
+
+        elif quota_style == "Hagenbach–Bischoff":
+            quota_numerator, quota_denominator = sum(shares), total_allocation + 1
+
+        else:
+            raise ValueError(
+                "Invalid quota provided. Choose from Hare, Droop, or Hagenbach–Bischoff."
+            )
+
+        remainders, allocations = zip(
+            *[divmod(s * quota_denominator, quota_numerator)[::-1] for s in shares]
+        )
+
+        return remainders, allocations
+
+    provided_shares = shares
     if allocation_threshold:
+        total_shares = sum(shares)
         passed_threshold = [
-            1.0 * s / sum(shares) > allocation_threshold for s in shares
+            1.0 * s / total_shares > allocation_threshold for s in shares
         ]
         shares = [s if passed_threshold[i] else 0 for i, s in enumerate(shares)]
 
+    def to_result(allocations: list[int]) -> AllocationResult:
+        """
+        Combine allocations with the quota and remainders that they were derived from.
+
+        Parameters
+        ----------
+        allocations : list[int]
+            The final allocations.
+
+        Returns
+        -------
+        AllocationResult
+            The allocations along with the quota, remainders and tied groups.
+
+        Notes
+        -----
+        Given a majority bonus, the quota and remainders are those of the other groups, with the remainder of the majority group being nan as it is not ranked.
+        """
+        if non_majority_result is not None:
+            seat_quota = non_majority_result.quota
+            remainders = np.insert(
+                non_majority_result.remainders, majority_index, np.nan
+            )
+
+        else:
+            seat_quota = get_quota(
+                quota_style=quota_style,
+                shares=shares,
+                total_allocation=original_total,
+            )
+            remainders = np.modf(np.asarray(shares, dtype=np.float64) / seat_quota)[0]
+
+        return AllocationResult(
+            shares=provided_shares,
+            allocations=allocations,
+            method="largest_remainder",
+            style=quota_style,
+            quota=seat_quota,
+            remainders=remainders,
+            tied=tied_indexes,
+        )
+
+    original_total = total_allocation
+    tied_indexes: list[int] = []
+    non_majority_result: AllocationResult | None = None
+    majority_index = 0
     original_remainders: tuple[float, ...] | None = None
     original_with_baseline: list[int] = []
     if min_alloc is not None and min_alloc > 0:
@@ -149,14 +458,11 @@ def get_quota(quota_style: str, shares: list[int], total_allocation: int) -> flo
 
         # Save the original remainders and allocations to avoid penalization
         # from new divisions after minimum seat allocation.
-        seat_quota = get_quota(
+        original_remainders, original_allocations = divide_by_quota(
             quota_style=quota_style,
             shares=shares,
             total_allocation=total_allocation,
         )
-        original_remainders, original_allocations = zip(
-            *[modf(1.0 * s / seat_quota) for s in shares]
-        )
 
         # If possible, append the original allocations with the baseline such
         # that the seats for remainders are used for the minimum allocation.
@@ -174,12 +480,14 @@ def get_quota(quota_style: str, shares: list[int], total_allocation: int) -> flo
         total_allocation -= sum(original_with_baseline)
 
         if total_allocation == 0:
+            if return_result:
+                return to_result(allocations=original_with_baseline)
+
             return original_with_baseline
 
-    seat_quota = get_quota(
+    remainders, allocations = divide_by_quota(
         quota_style=quota_style, shares=shares, total_allocation=total_allocation
     )
-    remainders, allocations = zip(*[modf(1.0 * s / seat_quota) for s in shares])
 
     if min_alloc is not None and min_alloc > 0:
         assert original_remainders is not None
@@ -193,21 +501,25 @@ def get_quota(quota_style: str, shares: list[int], total_allocation: int) -> flo
     allocations = [int(a) for a in allocations]
     unallocated = int(total_allocation - sum(allocations))
 
+    # Small Droop quotas can leave more allocations than groups, with whole
+    # rounds of them being assigned to all groups before the remainders.
+    if unallocated > len(shares):
+        allocations = [a + unallocated // len(shares) for a in allocations]
+        unallocated %= len(shares)
+
     remainders_sorted_ids = [
         i[0] for i in sorted(enumerate(remainders), key=itemgetter(1))
     ][::-1]
-    last_assigned_remainder = remainders_sorted_ids[unallocated - 1]
-    allocatable = [
-        i
-        for i in remainders_sorted_ids
-        if remainders[i] >= remainders[last_assigned_remainder]
+    last_assigned_remainder = remainders[remainders_sorted_ids[unallocated - 1]]
+    greater_than_last_assigned = [
+        i for i in remainders_sorted_ids if remainders[i] > last_assigned_remainder
     ]
     equal_to_last_assigned = [
-        i for i in allocatable if remainders[i] == remainders[last_assigned_remainder]
+        i for i in remainders_sorted_ids if remainders[i] == last_assigned_remainder
     ]
 
     # Assign for all that are greater than the last remainder to be assigned.
-    for k in [i for i in allocatable if i not in equal_to_last_assigned][:unallocated]:
+    for k in greater_than_last_assigned[:unallocated]:
         allocations[k] += 1
         unallocated -= 1
 
@@ -218,12 +530,14 @@ def get_quota(quota_style: str, shares: list[int], total_allocation: int) -> flo
 
     # Tie break conditions.
     else:
+        if 0 < unallocated < len(equal_to_last_assigned):
+            tied_indexes = equal_to_last_assigned
+
         if tie_break == "majority":
-            sorted_by_results = [
-                i[0]
-                for i in sorted(enumerate(shares), key=itemgetter(1))
-                if i[0] in equal_to_last_assigned
-            ][::-1]
+            # Only the tied groups are sorted, with equal shares in reverse index order.
+            sorted_by_results = sorted(
+                equal_to_last_assigned, key=lambda i: (shares[i], i)
+            )[::-1]
             equal_to_highest = [
                 i
                 for i in sorted_by_results
@@ -239,11 +553,11 @@ def get_quota(quota_style: str, shares: list[int], total_allocation: int) -> flo
                 tie_break = "random"
 
         if tie_break == "random":
-            shuffle(equal_to_last_assigned)
+            _shuffle(indexes=equal_to_last_assigned, rng=rng)
             for k in range(unallocated):
                 allocations[equal_to_last_assigned[k]] += 1
 
-        else:
+        elif tie_break != "majority":
             raise ValueError(
                 f"A tie break is required for the last seat(s), and an invalid argument '{tie_break}' has been passed. Please choose from 'majority' or 'random'."
             )
@@ -251,43 +565,60 @@ def get_quota(quota_style: str, shares: list[int], total_allocation: int) -> flo
     if min_alloc:
         allocations = [a + original_with_baseline[i] for i, a in enumerate(allocations)]
 
+    max_share = max(shares)
     if majority_bonus and (
-        allocations[shares.index(max(shares))] < int(ceil(total_allocation / 2))
-        and len([s for s in shares if s == max(shares)]) == 1
+        allocations[shares.index(max_share)] < int(ceil(total_allocation / 2))
+        and shares.count(max_share) == 1
     ):
-        non_majority_shares = [s for s in shares if s != max(shares)]
+        non_majority_shares = [s for s in shares if s != max_share]
         reduced_seats = total_allocation - int(ceil(total_allocation / 2))
-        non_majority_allocations = largest_remainder(
+        non_majority_result = largest_remainder(
             quota_style=quota_style,
             shares=non_majority_shares,
             total_allocation=reduced_seats,
             allocation_threshold=allocation_threshold,
             min_alloc=min_alloc,
             tie_break=tie_break,
+            rng=rng,
             majority_bonus=False,
+            exact=exact,
+            return_result=True,
         )
+        non_majority_allocations = non_majority_result.tolist()
 
-        # Insert majority allocation.
-        non_majority_allocations[
-            shares.index(max(shares)) : shares.index(max(shares))
-        ] = [int(ceil(total_allocation / 2))]
+        # Insert majority allocation, with ties being those of the other groups.
+        majority_index = shares.index(max_share)
+        non_majority_allocations[majority_index:majority_index] = [
+            int(ceil(total_allocation / 2))
+        ]
         allocations = non_majority_allocations
+        tied_indexes = [
+            i + (i >= majority_index) for i in non_majority_result.tied.tolist()
+        ]
+
+    if return_result:
+        return to_result(allocations=allocations)
 
     return allocations
 
 
+@_memoize_apportionment
 def highest_averages(
     averaging_style: str = "Jefferson",
-    shares: list[int] | None = None,
+    shares: list[int] | np.ndarray | None = None,
     total_allocation: int | None = None,
     allocation_threshold: float | None = None,
     min_alloc: int | None = None,
     tie_break: str | None = "majority",
     majority_bonus: bool | None = False,
     modifier: float | None = None,
-) -> list:
+    divisor_search: bool = False,
+    exact: bool = False,
+    rng: np.random.Generator | int | None = None,
+    return_result: bool = False,
+) -> list | np.ndarray | AllocationResult:
     r"""
-    Apportion seats using the Highest Averages (Jefferson, Webster, Huntington-Hill) methods.
+    Apportion seats using the Highest Averages (Jefferson, Webster, Huntington-Hill, Adams, Dean, Danish, Imperiali) methods.
 
     Parameters
     ----------
@@ -320,9 +651,37 @@ def highest_averages(
 
                 Note: assures that all regions or parties receive at least one vote (favors small groups).
 
-    shares : list (default=None)
+            - Adams :
+
+                .. math::
+                    \textrm{d}_{i} &= \frac{s_{i}}{a_{i}}
+
+                Note: all groups with shares receive an allocation before any receives a second (favors small groups).
+
+            - Dean :
+
+                .. math::
+                    \textrm{d}_{i} &= \frac{s_{i} \cdot ((2 \cdot a_{i}) + 1)}{2 \cdot a_{i} \cdot (a_{i} + 1)}
+
+                Note: divides by the harmonic mean of a_{i} and a_{i} + 1 (favors small groups).
+
+            - Danish :
+
+                .. math::
+                    \textrm{d}_{i} &= \frac{s_{i}}{(3 \cdot a_{i}) + 1}
+
+            - Imperiali :
+
+                .. math::
+                    \textrm{d}_{i} &= \frac{s_{i}}{a_{i} + 2}
+
+                Note: methods can be added via register_divisor_method.
+
+    shares : list | np.ndarray (default=None)
         A list of populations or votes for regions or parties.
 
+        Note: arrays, pandas Series and buffers are apportioned without conversion to lists, with allocations being returned as a Series for pandas Series and as a np.ndarray otherwise.
+
     total_allocation : int (default=None)
         The number of allocations to provide.
 
@@ -343,10 +702,26 @@ def highest_averages(
 
         Note: modifiers > 1 disadvantage smaller parties, and modifiers < 1 advantage them.
 
+    divisor_search : bool (default=False)
+        Whether to search for the critical divisor and round all groups at once rather than assigning allocations one at a time.
+
+        Note: allocations are equal to those assigned one at a time, with the final allocations near the critical divisor and ties still being assigned by quotient.
+
+    exact : bool (default=False)
+        Whether quotients are compared exactly via integer cross-multiplication rather than as floats.
+
+        Note: requires integer shares, with Huntington-Hill quotients being compared by their squares and modifiers by their decimal values.
+
+    rng : np.random.Generator | int (default=None)
+        The generator or seed used for random tie breaks, with None using the global state of the random module.
+
+    return_result : bool (default=False)
+        Whether to return an AllocationResult holding the quotients for the next allocation and tied groups along with the allocations.
+
     Returns
     -------
-    list
-        A list of allocations in the order of the provided shares.
+    list | np.ndarray | pd.Series | AllocationResult
+        A list of allocations in the order of the provided shares, a Series if shares are a pandas Series, an array if shares are another array or buffer, or an AllocationResult if return_result is True.
     """
     assert allocation_threshold is None or min_alloc is None, (
         """Appointment methods cannot be used with both an entry threshold and a minimum seat allocation. Set one of 'allocation_threshold' or 'min_alloc' to None."""
@@ -357,7 +732,52 @@ def highest_averages(
     )
     assert shares is not None, "'shares' must be provided."
     assert total_allocation is not None, "'total_allocation' must be provided."
+
+    rng = _get_rng(rng=rng)
+    share_array = _as_share_array(shares=shares)
+    if share_array is not None and not (majority_bonus or return_result):
+        return _like_shares(
+            shares=shares,
+            allocations=highest_averages_batch(
+                averaging_style=averaging_style,
+                shares=share_array[np.newaxis],
+                total_allocation=total_allocation,
+                allocation_threshold=allocation_threshold,
+                min_alloc=min_alloc,
+                tie_break=tie_break,
+                modifier=modifier,
+                exact=exact,
+                rng=rng,
+            )[0],
+        )
+
+    if share_array is not None and not return_result:
+        return _like_shares(
+            shares=shares,
+            allocations=np.asarray(
+                highest_averages(
+                    averaging_style=averaging_style,
+                    shares=share_array.tolist(),
+                    total_allocation=total_allocation,
+                    allocation_threshold=allocation_threshold,
+                    min_alloc=min_alloc,
+                    tie_break=tie_break,
+                    majority_bonus=majority_bonus,
+                    modifier=modifier,
+                    divisor_search=divisor_search,
+                    exact=exact,
+                    rng=rng,
+                ),
+                dtype=np.int64,
+            ),
+        )
+
     shares = list(shares)
+    if exact:
+        assert all(int(s) == s for s in shares), (
+            "'shares' must be integers when using exact quotients."
+        )
+        shares = [int(s) for s in shares]
 
     if averaging_style == "Huntington-Hill" and (min_alloc is None or min_alloc == 0):
         print(
@@ -369,9 +789,11 @@ def highest_averages(
         )
         min_alloc = 1
 
+    provided_shares = shares
     if allocation_threshold:
+        total_shares = sum(shares)
         passed_threshold = [
-            1.0 * i / sum(shares) > allocation_threshold for i in shares
+            1.0 * s / total_shares > allocation_threshold for s in shares
         ]
         shares = [s if passed_threshold[i] else 0 for i, s in enumerate(shares)]
 
@@ -383,113 +805,45 @@ def highest_averages(
         total_allocation -= sum(allocations)
 
         if total_allocation == 0:
+            if return_result:
+                return _highest_averages_result(
+                    averaging_style=averaging_style,
+                    shares=shares,
+                    provided_shares=provided_shares,
+                    allocations=allocations,
+                    modifier=modifier,
+                    tied_indexes=[],
+                )
+
             return allocations
     else:
         allocations = [0] * len(shares)
 
+    tied_indexes: list[int] = []
     remaining_alloc = total_allocation
-    while remaining_alloc > 0:
-        if averaging_style == "Jefferson":
-            if modifier:
-                quotients = [
-                    1.0 * s / (allocations[i] + 1)
-                    if allocations[i] > 1
-                    else 1.0 * s / modifier
-                    for i, s in enumerate(shares)
-                ]
-
-            else:
-                quotients = [
-                    1.0 * s / (allocations[i] + 1) for i, s in enumerate(shares)
-                ]
-
-        elif averaging_style == "Webster":
-            if modifier:
-                quotients = [
-                    1.0 * s / ((2 * allocations[i]) + 1)
-                    if allocations[i] > 1
-                    else 1.0 * s / modifier
-                    for i, s in enumerate(shares)
-                ]
-
-            else:
-                quotients = [
-                    1.0 * s / ((2 * allocations[i]) + 1) for i, s in enumerate(shares)
-                ]
-
-        elif averaging_style == "Huntington-Hill":
-            if modifier:
-                quotients = [
-                    1.0 * s / sqrt(allocations[i] * (allocations[i] + 1))
-                    if allocations[i] > 1
-                    else 1.0 * s / modifier
-                    for i, s in enumerate(shares)
-                ]
-
-            else:
-                quotients = [
-                    1.0 * s / sqrt(allocations[i] * (allocations[i] + 1))
-                    for i, s in enumerate(shares)
-                ]
-
-        else:
-            print(
-                "Naming conventions for methods differ across regions, with United States naming conventions used in poli-sci-kit."
-            )
-            print(
-                """US assignment method name conversions:
-            Jeffersion         : D'Hondt, Hagenbach-Bischoff (includes entry quota)
-            Webster            : Sainte-Laguë, Major Fraction
-            Huntington-Hill    : Equal Proportions"""
-            )
-            raise ValueError(
-                f"'{averaging_style}' is not a supported highest averages method. Please choose from 'Jefferson', 'Webster', or 'Huntington-Hill'."
-            )
-
-        # Find those indexes that have a maximum quotient to check if a tie break
-        # is needed.
-        max_quotient_indexes = [
-            q[0] for q in enumerate(quotients) if q[1] == max(quotients)
-        ]
-
-        # Normal assignment to all that have the max quotient.
-        if len(max_quotient_indexes) <= remaining_alloc:
-            for i in max_quotient_indexes:
-                allocations[i] += 1
-
-            remaining_alloc -= len(max_quotient_indexes)
-
-        # Tie break conditions.
-        elif len(max_quotient_indexes) > remaining_alloc:
-            if tie_break == "majority":
-                sorted_by_results = [
-                    i[0]
-                    for i in sorted(enumerate(shares), key=itemgetter(1))
-                    if i[0] in max_quotient_indexes
-                ][::-1]
-                equal_to_highest = [
-                    i
-                    for i in sorted_by_results
-                    if shares[i] == shares[sorted_by_results[0]]
-                ]
-
-                if len(equal_to_highest) == 1:
-                    allocations[sorted_by_results[0]] += 1
-                    remaining_alloc -= 1
-
-                else:
-                    # Defaults to random for those with equal allocation and remainder.
-                    tie_break = "random"
-
-            if tie_break == "random":
-                shuffle(max_quotient_indexes)
-                allocations[max_quotient_indexes[0]] += 1
-                remaining_alloc -= 1
-
-            else:
-                raise ValueError(
-                    f"A tie break is required for the last seat(s), and an invalid argument '{tie_break}' has been passed. Please choose from 'majority' or 'random'."
-                )
+    if divisor_search:
+        searched_allocations = _allocate_by_divisor_search(
+            averaging_style=averaging_style,
+            shares=np.asarray([shares], dtype=np.float64),
+            allocations=np.asarray([allocations], dtype=np.int64),
+            remaining_alloc=np.asarray([remaining_alloc], dtype=np.int64),
+            modifier=modifier,
+            margin=1e-12 if exact else 0.0,
+        )[0].tolist()
+        remaining_alloc -= sum(searched_allocations) - sum(allocations)
+        allocations = searched_allocations
+
+    allocations = _assign_by_priority(
+        averaging_style=averaging_style,
+        shares=shares,
+        allocations=allocations,
+        remaining_alloc=remaining_alloc,
+        tie_break=tie_break,
+        modifier=modifier,
+        exact=exact,
+        rng=rng,
+        tied_indexes=tied_indexes,
+    )
 
     if (
         majority_bonus
@@ -498,21 +852,2899 @@ def highest_averages(
     ):
         non_majority_shares = [s for s in shares if s != max(shares)]
         reduced_seats = total_allocation - int(ceil(total_allocation / 2))
-        non_majority_allocations = highest_averages(
+        non_majority_result = highest_averages(
             averaging_style=averaging_style,
             shares=non_majority_shares,
             total_allocation=reduced_seats,
             allocation_threshold=allocation_threshold,
             min_alloc=min_alloc,
             tie_break=tie_break,
+            rng=rng,
             majority_bonus=False,
             modifier=modifier,
+            divisor_search=divisor_search,
+            exact=exact,
+            return_result=True,
         )
+        non_majority_allocations = non_majority_result.tolist()
 
-        # Insert majority allocation.
-        non_majority_allocations[
-            shares.index(max(shares)) : shares.index(max(shares))
-        ] = [int(ceil(total_allocation / 2))]
+        # Insert majority allocation, with ties being those of the other groups.
+        majority_index = shares.index(max(shares))
+        non_majority_allocations[majority_index:majority_index] = [
+            int(ceil(total_allocation / 2))
+        ]
         allocations = non_majority_allocations
+        tied_indexes = [
+            i + (i >= majority_index) for i in non_majority_result.tied.tolist()
+        ]
+
+    if return_result:
+        return _highest_averages_result(
+            averaging_style=averaging_style,
+            shares=shares,
+            provided_shares=provided_shares,
+            allocations=allocations,
+            modifier=modifier,
+            tied_indexes=tied_indexes,
+        )
+
+    return allocations
+
+
+def largest_remainder_batch(
+    quota_style: str = "Hare",
+    shares: np.ndarray | list[list[int]] | None = None,
+    total_allocation: int | np.ndarray | list[int] | None = None,
+    allocation_threshold: float | None = None,
+    min_alloc: int | None = None,
+    tie_break: str = "majority",
+    exact: bool = False,
+    rng: np.random.Generator | int | None = None,
+) -> np.ndarray:
+    """
+    Apportion seats for many elections at once using the Largest Remainder (Hamilton, Vinton, Hare–Niemeyer) methods.
+
+    Parameters
+    ----------
+    quota_style : str (default=Hare)
+        The style of quota vote-seat quota to use.
+
+        Options: Hare, Droop, Hagenbach–Bischoff (see largest_remainder).
+
+    shares : np.ndarray | list[list[int]] (num_elections, num_groups; default=None)
+        The populations or votes for regions or parties in each election.
+
+    total_allocation : int | np.ndarray | list[int] (default=None)
+        The number of allocations to provide, either for all elections or for each election.
+
+    allocation_threshold : float (default=None)
+        A minimum percentage of the population or votes that must be met to receive an allocation.
+
+    min_alloc : int (default=None)
+        A minimum number of allocations that each group must receive.
+
+    tie_break : str (default=majority)
+        How a tie break is done (by majority or random, with a majority tie defaulting to random).
+
+    exact : bool (default=False)
+        Whether remainders are derived and compared as integers rather than floats (see largest_remainder).
+
+    rng : np.random.Generator | int (default=None)
+        The generator or seed used for random tie breaks, with None using the global state of the random module.
+
+    Returns
+    -------
+    np.ndarray (num_elections, num_groups)
+        The allocations of each election in the order of the provided shares.
+
+    Notes
+    -----
+    Quotas, remainders and the ranking of remainders are derived for all elections at once, with elections where the last allocation is tied being passed to largest_remainder.
+
+    Exact remainders are derived via int64 division, with Python integers only being used for shares that could overflow it.
+    """
+    assert allocation_threshold is None or min_alloc is None, (
+        """Appointment methods cannot be used with both an entry threshold and a minimum seat allocation. Set one of 'allocation_threshold' or 'min_alloc' to None."""
+    )
+    assert shares is not None, "'shares' must be provided."
+    assert total_allocation is not None, "'total_allocation' must be provided."
+
+    rng = _get_rng(rng=rng)
+
+    share_array = np.asarray(shares)
+    assert share_array.ndim == 2, (
+        "'shares' must be of shape (num_elections, num_groups)."
+    )
+    num_elections, num_groups = share_array.shape
+    original_totals = np.broadcast_to(
+        np.asarray(total_allocation, dtype=np.int64), (num_elections,)
+    )
+
+    if allocation_threshold:
+        passed_threshold = (
+            share_array / share_array.sum(axis=1, keepdims=True) > allocation_threshold
+        )
+        share_array = np.where(passed_threshold, share_array, 0)
+
+    if exact:
+        share_array = _as_exact_shares(
+            share_array=share_array,
+            max_factor=max(num_groups, int(original_totals.max(initial=0)) + 1),
+        )
+
+    allocations, requires_tie_break = _assign_largest_remainders(
+        quota_style=quota_style,
+        share_array=share_array,
+        share_sums=share_array.sum(axis=1),
+        totals=original_totals,
+        min_alloc=min_alloc,
+        exact=exact,
+    )
+
+    # Elections that require a tie break are derived individually.
+    for i in np.flatnonzero(requires_tie_break):
+        allocations[i] = largest_remainder(
+            quota_style=quota_style,
+            shares=np.asarray(shares)[i].tolist(),
+            total_allocation=int(original_totals[i]),
+            allocation_threshold=allocation_threshold,
+            min_alloc=min_alloc,
+            tie_break=tie_break,
+            exact=exact,
+            rng=rng,
+        )
 
     return allocations
+
+
+def largest_remainder_sweep(
+    quota_style: str = "Hare",
+    shares: list[int] | None = None,
+    total_allocations: Iterable[int] | None = None,
+    allocation_threshold: float | None = None,
+    min_alloc: int | None = None,
+    tie_break: str = "majority",
+    rng: np.random.Generator | int | None = None,
+) -> np.ndarray:
+    """
+    Apportion seats for a range of house sizes using the Largest Remainder (Hamilton, Vinton, Hare–Niemeyer) methods.
+
+    Parameters
+    ----------
+    quota_style : str (default=Hare)
+        The style of quota vote-seat quota to use.
+
+        Options: Hare, Droop, Hagenbach–Bischoff (see largest_remainder).
+
+    shares : list (default=None)
+        A list of populations or votes for regions or parties.
+
+    total_allocations : Iterable[int] (default=None)
+        The house sizes to provide allocations for, such as range(1, 436).
+
+    allocation_threshold : float (default=None)
+        A minimum percentage of the population or votes that must be met to receive an allocation.
+
+    min_alloc : int (default=None)
+        A minimum number of allocations that each group must receive.
+
+    tie_break : str (default=majority)
+        How a tie break is done (by majority or random, with a majority tie defaulting to random).
+
+    rng : np.random.Generator | int (default=None)
+        The generator or seed used for random tie breaks, with None using the global state of the random module.
+
+    Returns
+    -------
+    np.ndarray (num_house_sizes, num_groups; contains int32)
+        The allocations for each house size in the order of the provided shares.
+
+    Notes
+    -----
+    Largest remainder allocations are not prefixes of one another, and as such can be used to check house monotonicity (see the Alabama paradox).
+
+    The threshold and share sum are derived once, with the shares being broadcast over all house sizes without being copied.
+    """
+    assert allocation_threshold is None or min_alloc is None, (
+        """Appointment methods cannot be used with both an entry threshold and a minimum seat allocation. Set one of 'allocation_threshold' or 'min_alloc' to None."""
+    )
+    assert shares is not None, "'shares' must be provided."
+    assert total_allocations is not None, "'total_allocations' must be provided."
+
+    rng = _get_rng(rng=rng)
+
+    original_shares = list(shares)
+    share_array = np.asarray(original_shares)
+    totals = np.fromiter(total_allocations, dtype=np.int64)
+
+    if allocation_threshold:
+        passed_threshold = share_array / share_array.sum() > allocation_threshold
+        share_array = np.where(passed_threshold, share_array, 0)
+
+    allocations, requires_tie_break = _assign_largest_remainders(
+        quota_style=quota_style,
+        share_array=np.broadcast_to(share_array, (len(totals), len(share_array))),
+        share_sums=np.broadcast_to(share_array.sum(), (len(totals),)),
+        totals=totals,
+        min_alloc=min_alloc,
+    )
+
+    # House sizes that require a tie break are derived individually.
+    for i in np.flatnonzero(requires_tie_break):
+        allocations[i] = largest_remainder(
+            quota_style=quota_style,
+            shares=original_shares,
+            total_allocation=int(totals[i]),
+            allocation_threshold=allocation_threshold,
+            min_alloc=min_alloc,
+            tie_break=tie_break,
+            rng=rng,
+        )
+
+    return allocations.astype(np.int32)
+
+
+def highest_averages_batch(
+    averaging_style: str = "Jefferson",
+    shares: np.ndarray | list[list[int]] | None = None,
+    total_allocation: int | np.ndarray | list[int] | None = None,
+    allocation_threshold: float | None = None,
+    min_alloc: int | None = None,
+    tie_break: str | None = "majority",
+    modifier: float | None = None,
+    exact: bool = False,
+    rng: np.random.Generator | int | None = None,
+) -> np.ndarray:
+    """
+    Apportion seats for many elections at once using the Highest Averages (Jefferson, Webster, Huntington-Hill, Adams, Dean, Danish, Imperiali) methods.
+
+    Parameters
+    ----------
+    averaging_style : str (default=Jefferson)
+        The style that highest averages are computed.
+
+        Options: Jefferson, Webster, Huntington-Hill, Adams, Dean, Danish, Imperiali (see highest_averages).
+
+        Note: methods can be added via register_divisor_method.
+
+    shares : np.ndarray | list[list[int]] (num_elections, num_groups; default=None)
+        The populations or votes for regions or parties in each election.
+
+    total_allocation : int | np.ndarray | list[int] (default=None)
+        The number of allocations to provide, either for all elections or for each election.
+
+    allocation_threshold : float (default=None)
+        A minimum percentage of the population or votes that must be met to receive an allocation.
+
+    min_alloc : int (default=None)
+        A minimum number of allocations that each group must receive.
+
+    tie_break : str (default=majority)
+        How a tie break is done (by majority or random, with a majority tie defaulting to random).
+
+    modifier : float (default=None)
+        What to replace the divisor of the first quotient by to change the advantage of groups yet to receive an assignment.
+
+    exact : bool (default=False)
+        Whether quotients are compared exactly via integer cross-multiplication rather than as floats (see highest_averages).
+
+    rng : np.random.Generator | int (default=None)
+        The generator or seed used for random tie breaks, with None using the global state of the random module.
+
+    Returns
+    -------
+    np.ndarray (num_elections, num_groups)
+        The allocations of each election in the order of the provided shares.
+
+    Notes
+    -----
+    The critical divisors of all elections are searched for at once, with the allocations closest to them being assigned by quotient and elections where the last allocation is tied being passed to highest_averages.
+
+    Exact quotients are only cross-multiplied for groups with floats at the maximum, doing so in int64 unless the products could overflow it.
+    """
+    assert allocation_threshold is None or min_alloc is None, (
+        """Appointment methods cannot be used with both an entry threshold and a minimum seat allocation. Set one of 'allocation_threshold' or 'min_alloc' to None."""
+    )
+
+    assert allocation_threshold is None or averaging_style != "Huntington-Hill", (
+        """The Huntington-Hill method requires all groups to receive a seat, and thus cannot be used with a threshold. Set 'allocation_threshold' to None."""
+    )
+    assert shares is not None, "'shares' must be provided."
+    assert total_allocation is not None, "'total_allocation' must be provided."
+
+    rng = _get_rng(rng=rng)
+
+    if averaging_style not in _DIVISOR_METHODS:
+        raise _averaging_style_error(averaging_style=averaging_style)
+
+    share_array = np.asarray(shares, dtype=np.float64)
+    assert share_array.ndim == 2, (
+        "'shares' must be of shape (num_elections, num_groups)."
+    )
+    num_elections, num_groups = share_array.shape
+    original_totals = np.broadcast_to(
+        np.asarray(total_allocation, dtype=np.int64), (num_elections,)
+    )
+    if exact:
+        exact_shares = _as_exact_shares(share_array=np.asarray(shares), max_factor=1)
+
+    if averaging_style == "Huntington-Hill" and (min_alloc is None or min_alloc == 0):
+        print(
+            "A minimum allocation is required in the denominator of Huntington-Hill calculations."
+        )
+        print("A minimum allocation of 1 will be applied.")
+        assert (num_groups <= original_totals).all(), (
+            "There must be at least one seat per group when using the Huntington-Hill method."
+        )
+        min_alloc = 1
+
+    if allocation_threshold:
+        passed_threshold = (
+            share_array / share_array.sum(axis=1, keepdims=True) > allocation_threshold
+        )
+        share_array = np.where(passed_threshold, share_array, 0.0)
+        if exact:
+            exact_shares = np.where(passed_threshold, exact_shares, 0)
+
+    allocations = np.zeros(share_array.shape, dtype=np.int64)
+    if min_alloc is not None and min_alloc > 0:
+        assert (min_alloc * num_groups <= original_totals).all(), (
+            "The sum of the minimum seats to be allocated cannot be more than the seats to be allocated."
+        )
+        allocations[:] = min_alloc
+
+    remaining_alloc = original_totals - allocations.sum(axis=1)
+    searched_allocations = _allocate_by_divisor_search(
+        averaging_style=averaging_style,
+        shares=share_array,
+        allocations=allocations,
+        remaining_alloc=remaining_alloc,
+        modifier=modifier,
+        margin=1e-12 if exact else 0.0,
+    )
+    remaining_alloc -= (searched_allocations - allocations).sum(axis=1)
+    allocations = searched_allocations
+
+    # Assign the remaining allocations to all groups with the max quotient,
+    # with elections where a tie break is needed being derived individually.
+    requires_tie_break = np.zeros(num_elections, dtype=bool)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        while True:
+            pending = (remaining_alloc > 0) & ~requires_tie_break
+            if not pending.any():
+                break
+
+            quotients = _highest_averages_quotients(
+                averaging_style=averaging_style,
+                shares=share_array,
+                allocations=allocations,
+                modifier=modifier,
+            )
+            if not exact:
+                is_max_quotient = quotients == quotients.max(axis=1, keepdims=True)
+
+            else:
+                is_max_quotient = _exact_max_quotients(
+                    quotients=quotients,
+                    exact_quotients=_exact_highest_averages_quotients(
+                        averaging_style=averaging_style,
+                        shares=exact_shares,
+                        allocations=allocations,
+                        modifier=modifier,
+                    ),
+                )
+            num_max_quotients = is_max_quotient.sum(axis=1)
+
+            requires_tie_break |= pending & (num_max_quotients > remaining_alloc)
+            assignable = pending & ~requires_tie_break
+            allocations += is_max_quotient & assignable[:, None]
+            remaining_alloc -= np.where(assignable, num_max_quotients, 0)
+
+    for i in np.flatnonzero(requires_tie_break):
+        allocations[i] = highest_averages(
+            averaging_style=averaging_style,
+            shares=np.asarray(shares)[i].tolist(),
+            total_allocation=int(original_totals[i]),
+            allocation_threshold=allocation_threshold,
+            min_alloc=min_alloc,
+            tie_break=tie_break,
+            rng=rng,
+            modifier=modifier,
+            exact=exact,
+        )
+
+    return allocations
+
+
+def biproportional(
+    shares: np.ndarray | list[list[int]] | None = None,
+    district_allocations: np.ndarray | list[int] | None = None,
+    party_allocations: np.ndarray | list[int] | None = None,
+    max_iterations: int = 1000,
+    return_stats: bool = False,
+) -> np.ndarray | tuple[np.ndarray, dict]:
+    """
+    Apportion seats to parties within districts using the Biproportional (double proportional, Pukelsheim) method.
+
+    Parameters
+    ----------
+    shares : np.ndarray | list[list[int]] (num_districts, num_parties; default=None)
+        The votes for each party in each district.
+
+    district_allocations : np.ndarray | list[int] (num_districts; default=None)
+        The number of allocations to provide in each district.
+
+    party_allocations : np.ndarray | list[int] (num_parties; default=None)
+        The number of allocations each party receives over all districts.
+
+        Note: None derives party allocations from the total votes of parties via the Webster method.
+
+    max_iterations : int (default=1000)
+        The maximum number of row and column scaling steps.
+
+    return_stats : bool (default=False)
+        Whether to also return the divisors and iteration statistics of the solution.
+
+    Returns
+    -------
+    np.ndarray (num_districts, num_parties) | tuple[np.ndarray, dict]
+        The allocations of each party in each district, and if return_stats a dict of the row_divisors, column_divisors, iterations, converged and flaws (the total deviation from the district and party allocations after each step).
+
+    Notes
+    -----
+    Allocations are Webster roundings of shares / (row_divisors * column_divisors), with divisors being found by alternately scaling rows and then columns such that their sums are met until both are.
+
+    Allocations may not exist when parties only receive votes in districts with too few allocations for them. If not converged, the last allocations meet the party allocations but not all district allocations.
+    """
+    assert shares is not None, "'shares' must be provided."
+    assert district_allocations is not None, "'district_allocations' must be provided."
+
+    share_array = np.asarray(shares, dtype=np.float64)
+    assert share_array.ndim == 2, (
+        "'shares' must be of shape (num_districts, num_parties)."
+    )
+    district_totals = np.asarray(district_allocations, dtype=np.int64)
+    if party_allocations is None:
+        party_totals = np.asarray(
+            highest_averages(
+                averaging_style="Webster",
+                shares=share_array.sum(axis=0).tolist(),
+                total_allocation=int(district_totals.sum()),
+            ),
+            dtype=np.int64,
+        )
+
+    else:
+        party_totals = np.asarray(party_allocations, dtype=np.int64)
+
+    assert district_totals.shape == (share_array.shape[0],), (
+        "'district_allocations' must have an allocation for each district."
+    )
+    assert party_totals.shape == (share_array.shape[1],), (
+        "'party_allocations' must have an allocation for each party."
+    )
+    assert district_totals.sum() == party_totals.sum(), (
+        "The district and party allocations must sum to the same number of allocations."
+    )
+
+    row_divisors = np.ones(share_array.shape[0])
+    column_divisors = np.ones(share_array.shape[1])
+    flaws = []
+    converged = False
+    iterations = 0
+    while iterations < max_iterations:
+        iterations += 1
+        allocations, row_divisors = _webster_allocate_rows(
+            weights=share_array / column_divisors, totals=district_totals
+        )
+        flaws.append(int(np.abs(allocations.sum(axis=0) - party_totals).sum()))
+        if flaws[-1] == 0:
+            converged = True
+            break
+
+        iterations += 1
+        column_allocations, column_divisors = _webster_allocate_rows(
+            weights=(share_array / row_divisors[:, None]).T, totals=party_totals
+        )
+        allocations = column_allocations.T
+        flaws.append(int(np.abs(allocations.sum(axis=1) - district_totals).sum()))
+        if flaws[-1] == 0:
+            converged = True
+            break
+
+    if not return_stats:
+        return allocations
+
+    return allocations, {
+        "row_divisors": row_divisors,
+        "column_divisors": column_divisors,
+        "iterations": iterations,
+        "converged": converged,
+        "flaws": flaws,
+    }
+
+
+def seat_priority_sequence(
+    averaging_style: str = "Jefferson",
+    shares: list[int] | None = None,
+    min_alloc: int | None = None,
+    modifier: float | None = None,
+    allocations: list[int] | None = None,
+) -> Iterator[tuple[int, float, int]]:
+    """
+    Lazily generate the order in which the Highest Averages methods award seats.
+
+    Parameters
+    ----------
+    averaging_style : str (default=Jefferson)
+        The style that highest averages are computed.
+
+        Options: Jefferson, Webster, Huntington-Hill, Adams, Dean, Danish, Imperiali (see highest_averages).
+
+    shares : list (default=None)
+        A list of populations or votes for regions or parties.
+
+    min_alloc : int (default=None)
+        A minimum number of allocations that each group must receive.
+
+        Note: Huntington-Hill sequences always use a minimum allocation of at least 1.
+
+    modifier : float (default=None)
+        What to replace the divisor of the first quotient by to change the advantage of groups yet to receive an assignment.
+
+    allocations : list[int] (default=None)
+        The allocations that groups have already received, with the sequence continuing from them rather than from min_alloc.
+
+    Yields
+    ------
+    tuple[int, float, int]
+        The index of the group receiving the seat, its quotient and the number of the seat in the house.
+
+    Notes
+    -----
+    Seats of the minimum allocation are not yielded, with the sequence starting at seat min_alloc * len(shares) + 1 as in the US Census priority list.
+
+    The allocations of any house size are thus the minimum allocation plus the groups of the corresponding prefix of the sequence.
+
+    Groups with equal quotients are ordered by their shares as in majority tie breaks, with groups that also have equal shares being ordered by index. All groups with equal quotients receive a seat before any of them receives another, as in highest_averages.
+    """
+    assert shares is not None, "'shares' must be provided."
+    shares = list(shares)
+
+    if averaging_style not in _DIVISOR_METHODS:
+        raise _averaging_style_error(averaging_style=averaging_style)
+
+    if averaging_style == "Huntington-Hill" and (min_alloc is None or min_alloc == 0):
+        min_alloc = 1
+
+    if allocations is None:
+        allocations = [min_alloc or 0] * len(shares)
+
+    else:
+        assert len(allocations) == len(shares), (
+            "'allocations' must have an allocation for each group."
+        )
+        allocations = list(allocations)
+
+    seat_number = sum(allocations)
+
+    def get_quotient(i: int) -> float:
+        """
+        Derive the quotient of a group given its current allocation.
+
+        Parameters
+        ----------
+        i : int
+            The index of the group.
+
+        Returns
+        -------
+        float
+            The quotient of the group.
+        """
+        return _quotient(
+            share=shares[i],
+            divisor=_divisor(
+                averaging_style=averaging_style,
+                modifier=modifier,
+                allocation=allocations[i],
+            ),
+        )
+
+    heap = [(-get_quotient(i), -s, i) for i, s in enumerate(shares)]
+    heapify(heap)
+
+    while heap:
+        # Pop all groups that share the maximum quotient, as each receives a seat
+        # before any receives another in highest_averages.
+        quotient, _, first_index = heappop(heap)
+        max_quotient_indexes = [first_index]
+        while heap and heap[0][0] == quotient:
+            max_quotient_indexes.append(heappop(heap)[2])
+
+        for i in max_quotient_indexes:
+            allocations[i] += 1
+            seat_number += 1
+
+            yield i, -quotient, seat_number
+
+        for i in max_quotient_indexes:
+            heappush(heap, (-get_quotient(i), -shares[i], i))
+
+
+def compensatory_allocation(
+    averaging_style: str = "Webster",
+    shares: list[int] | None = None,
+    direct_allocations: list[int] | None = None,
+    total_allocation: int | None = None,
+    allocation_threshold: float | None = None,
+    modifier: float | None = None,
+) -> list:
+    """
+    Apportion seats such that all direct (constituency) allocations are covered by increasing the house size via compensatory seats.
+
+    Parameters
+    ----------
+    averaging_style : str (default=Webster)
+        The style that highest averages are computed.
+
+        Options: Jefferson, Webster, Huntington-Hill, Adams, Dean, Danish, Imperiali (see highest_averages).
+
+    shares : list (default=None)
+        A list of votes for parties.
+
+    direct_allocations : list[int] (default=None)
+        The number of constituencies that each party has won.
+
+    total_allocation : int (default=None)
+        The base number of allocations to provide before compensatory seats are added.
+
+    allocation_threshold : float (default=None)
+        A minimum percentage of the votes that must be met to receive proportional allocations.
+
+        Note: parties below the threshold keep their direct allocations, with these being removed from the base house size.
+
+    modifier : float (default=None)
+        What to replace the divisor of the first quotient by to change the advantage of groups yet to receive an assignment.
+
+    Returns
+    -------
+    list
+        A list of allocations in the order of the provided shares, with their sum being the final house size.
+
+    Notes
+    -----
+    The base house is apportioned once, with seats then being added one at a time from the seat priority sequence of the base allocations until every party has at least its direct allocations, as in Bundestag elections from 2013 to 2020.
+    """
+    assert shares is not None, "'shares' must be provided."
+    assert direct_allocations is not None, "'direct_allocations' must be provided."
+    assert total_allocation is not None, "'total_allocation' must be provided."
+    assert len(shares) == len(direct_allocations), (
+        "'direct_allocations' must have an allocation for each party."
+    )
+
+    shares = list(shares)
+    if allocation_threshold:
+        total_shares = sum(shares)
+        eligible = [
+            i for i, s in enumerate(shares) if s / total_shares > allocation_threshold
+        ]
+
+    else:
+        eligible = list(range(len(shares)))
+
+    allocations = list(direct_allocations)
+    base_allocation = (
+        total_allocation - sum(allocations) + sum(allocations[i] for i in eligible)
+    )
+    if not eligible:
+        return allocations
+
+    eligible_shares = [shares[i] for i in eligible]
+    eligible_direct = [direct_allocations[i] for i in eligible]
+    assert all(
+        s > 0 for s, d in zip(eligible_shares, eligible_direct, strict=True) if d > 0
+    ), "Parties with direct allocations must have shares for them to be covered."
+
+    # Jump to the allocations above the quotient of the last direct allocation to
+    # be covered, as all of these are awarded before the house is large enough.
+    eligible_allocations = None
+    if not modifier and any(eligible_direct):
+        if averaging_style not in _DIVISOR_METHODS:
+            raise _averaging_style_error(averaging_style=averaging_style)
+
+        covering_divisor = min(
+            _quotient(
+                share=s,
+                divisor=_divisor(
+                    averaging_style=averaging_style, modifier=None, allocation=d - 1
+                ),
+            )
+            for s, d in zip(eligible_shares, eligible_direct, strict=True)
+            if d > 0
+        )
+        eligible_allocations = _allocate_above_divisor(
+            averaging_style=averaging_style,
+            shares=eligible_shares,
+            divisor=covering_divisor,
+        )
+        if sum(eligible_allocations) < base_allocation:
+            eligible_allocations = None
+
+    if eligible_allocations is None:
+        eligible_allocations = highest_averages(
+            averaging_style=averaging_style,
+            shares=eligible_shares,
+            total_allocation=base_allocation,
+            modifier=modifier,
+            divisor_search=True,
+        )
+
+    deficits = sum(
+        1 for a, d in zip(eligible_allocations, eligible_direct, strict=True) if a < d
+    )
+    if deficits:
+        for j, _, _ in seat_priority_sequence(
+            averaging_style=averaging_style,
+            shares=eligible_shares,
+            modifier=modifier,
+            allocations=eligible_allocations,
+        ):
+            eligible_allocations[j] += 1
+            if eligible_allocations[j] == eligible_direct[j]:
+                deficits -= 1
+                if not deficits:
+                    break
+
+    for i, a in zip(eligible, eligible_allocations, strict=True):
+        allocations[i] = a
+
+    return allocations
+
+
+def seat_vote_breakpoints(
+    method: str = "highest_averages",
+    style: str | None = None,
+    shares: list[int] | None = None,
+    total_allocation: int | None = None,
+    group: int | None = None,
+    min_alloc: int | None = None,
+    modifier: float | None = None,
+    max_share: int | None = None,
+    exact: bool = False,
+) -> list[tuple[int, int]]:
+    """
+    Derive the shares at which the allocation of a group changes given that the shares of all other groups are fixed.
+
+    Parameters
+    ----------
+    method : str (default=highest_averages)
+        The apportionment method to use.
+
+        Options: highest_averages, largest_remainder.
+
+    style : str (default=None)
+        The averaging_style or quota_style of the method, with None using the default of the method.
+
+    shares : list[int] (default=None)
+        A list of populations or votes for regions or parties, with the share of the group being replaced.
+
+    total_allocation : int (default=None)
+        The number of allocations to provide.
+
+    group : int (default=None)
+        The index of the group whose shares are varied.
+
+    min_alloc : int (default=None)
+        A minimum number of allocations that each group must receive for highest averages methods.
+
+    modifier : float (default=None)
+        What to replace the divisor of the first quotient by for highest averages methods.
+
+    max_share : int (default=None)
+        The largest share of the group to derive breakpoints for, with None being all breakpoints for highest averages methods and the total shares for largest remainder methods.
+
+    exact : bool (default=False)
+        Whether highest averages quotients are compared exactly as in highest_averages with exact=True rather than as floats.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        Pairs of a share and the allocation that the group receives from that share until the share of the next pair, starting with a share of 0.
+
+    Notes
+    -----
+    Highest averages breakpoints are derived in one pass over the seat priority sequence of the other groups, with the group needing its k-th seat to be ranked above the (remaining_alloc - k + 1)-th seat of all others. The least share that does so is found by bisecting around the share where the quotients are equal.
+
+    Largest remainder breakpoints can only be where the quotient of a group crosses an integer or where the remainders of two groups cross, and as these are closed form in the share of the group, allocations are only derived at these shares in batches. Droop quotas are integers that step with the share of the group, with breakpoints being solved for over each step such that their number does not grow with the total shares.
+
+    Allocations at breakpoints follow majority tie breaks, with ties between groups with equal shares being broken randomly.
+    """
+    assert shares is not None, "'shares' must be provided."
+    assert total_allocation is not None, "'total_allocation' must be provided."
+    assert group is not None, "'group' must be provided."
+    assert all(int(s) == s and s >= 0 for s in shares), (
+        "'shares' must be non-negative integers to derive breakpoints."
+    )
+
+    shares = [int(s) for s in shares]
+    if method == "highest_averages":
+        averaging_style = style or "Jefferson"
+        if averaging_style not in _DIVISOR_METHODS:
+            raise _averaging_style_error(averaging_style=averaging_style)
+
+        if averaging_style == "Huntington-Hill" and not min_alloc:
+            min_alloc = 1
+
+        breakpoints = _highest_averages_breakpoints(
+            averaging_style=averaging_style,
+            shares=shares,
+            total_allocation=total_allocation,
+            group=group,
+            min_alloc=min_alloc or 0,
+            modifier=modifier,
+            exact=exact,
+        )
+        if max_share is not None:
+            breakpoints = [(v, a) for v, a in breakpoints if v <= max_share]
+
+        return breakpoints
+
+    if method != "largest_remainder":
+        raise ValueError(
+            f"'{method}' is not a supported method. Please choose from 'highest_averages' or 'largest_remainder'."
+        )
+
+    assert min_alloc is None, (
+        "Largest remainder breakpoints cannot be derived with a minimum allocation."
+    )
+    quota_style = style or "Hare"
+    max_share = sum(shares) if max_share is None else max_share
+
+    candidates = _largest_remainder_breakpoint_candidates(
+        quota_style=quota_style,
+        shares=shares,
+        total_allocation=total_allocation,
+        group=group,
+        max_share=max_share,
+    )
+
+    # Allocations are constant between candidates, and so are derived at the
+    # integers around each candidate, allowing for floating point error.
+    floors = np.floor(candidates)
+    test_shares = np.unique(
+        np.clip(
+            np.concatenate(
+                [[0, max_share], floors - 1, floors, floors + 1, floors + 2]
+            ),
+            0,
+            max_share,
+        ).astype(np.int64)
+    )
+    # Allocations are derived in chunks of elections such that memory is bounded.
+    group_allocations = np.empty(len(test_shares), dtype=np.int64)
+    for start in range(0, len(test_shares), _BREAKPOINT_CHUNK_SIZE):
+        chunk_shares = test_shares[start : start + _BREAKPOINT_CHUNK_SIZE]
+        share_array = np.tile(
+            np.asarray(shares, dtype=np.int64), (len(chunk_shares), 1)
+        )
+        share_array[:, group] = chunk_shares
+        group_allocations[start : start + len(chunk_shares)] = largest_remainder_batch(
+            quota_style=quota_style,
+            shares=share_array,
+            total_allocation=total_allocation,
+        )[:, group]
+
+    changes = np.flatnonzero(np.diff(group_allocations)) + 1
+    starts = np.concatenate([[0], changes])
+
+    return list(
+        zip(
+            test_shares[starts].tolist(),
+            group_allocations[starts].tolist(),
+            strict=True,
+        )
+    )
+
+
+class Apportioner:
+    """
+    Maintain the allocations of shares that are updated over time, such as during an election night.
+
+    Parameters
+    ----------
+    method : str (default=highest_averages)
+        The apportionment method to use.
+
+        Options: highest_averages, largest_remainder.
+
+    style : str (default=None)
+        The averaging_style or quota_style of the method, with None using the default of the method.
+
+    shares : list (default=None)
+        A list of populations or votes for regions or parties.
+
+    total_allocation : int (default=None)
+        The number of allocations to provide.
+
+    allocation_threshold : float (default=None)
+        A minimum percentage of the population or votes that must be met to receive an allocation.
+
+    min_alloc : int (default=None)
+        A minimum number of allocations that each group must receive.
+
+    modifier : float (default=None)
+        What to replace the divisor of the first quotient by for highest averages methods.
+
+    Notes
+    -----
+    Highest averages allocations are kept between updates, with seats being moved from the group with the smallest last quotient to the group with the largest next quotient until no next quotient is greater, such that only the seats at the margin are recomputed.
+
+    Largest remainder quotas depend on the total shares such that all remainders change with each update, and so these allocations are recomputed in full, as are highest averages allocations with modifiers that lead to decreasing divisors.
+
+    Allocations match those of highest_averages and largest_remainder with majority tie breaks, except for ties between groups with equal shares that are broken randomly.
+    """
+
+    def __init__(
+        self,
+        method: str = "highest_averages",
+        style: str | None = None,
+        shares: list[int] | None = None,
+        total_allocation: int | None = None,
+        allocation_threshold: float | None = None,
+        min_alloc: int | None = None,
+        modifier: float | None = None,
+    ) -> None:
+        """
+        Validate the method and style and derive the allocations of the initial shares.
+
+        Parameters
+        ----------
+        method : str (default=highest_averages)
+            The apportionment method to use.
+
+        style : str (default=None)
+            The averaging_style or quota_style of the method, with None using the default of the method.
+
+        shares : list (default=None)
+            A list of populations or votes for regions or parties.
+
+        total_allocation : int (default=None)
+            The number of allocations to provide.
+
+        allocation_threshold : float (default=None)
+            A minimum percentage of the population or votes that must be met to receive an allocation.
+
+        min_alloc : int (default=None)
+            A minimum number of allocations that each group must receive.
+
+        modifier : float (default=None)
+            What to replace the divisor of the first quotient by for highest averages methods.
+        """
+        assert shares is not None, "'shares' must be provided."
+        assert total_allocation is not None, "'total_allocation' must be provided."
+
+        if method == "highest_averages":
+            style = style or "Jefferson"
+            if style not in _DIVISOR_METHODS:
+                raise _averaging_style_error(averaging_style=style)
+
+            if style == "Huntington-Hill" and not min_alloc:
+                min_alloc = 1
+
+        elif method == "largest_remainder":
+            style = style or "Hare"
+
+        else:
+            raise ValueError(
+                f"'{method}' is not a supported method. Please choose from 'highest_averages' or 'largest_remainder'."
+            )
+
+        self.method = method
+        self.style = style
+        self.total_allocation = total_allocation
+        self.allocation_threshold = allocation_threshold
+        self.min_alloc = min_alloc
+        self.modifier = modifier
+        self._shares = list(shares)
+
+        self._incremental = False
+        if method == "highest_averages":
+            # Seats are only assigned in quotient order if divisors don't decrease.
+            self._incremental = (min_alloc or 0) >= _monotone_from(
+                averaging_style=style, modifier=modifier
+            )
+
+        self._allocations = self._apportion()
+
+    @property
+    def shares(self) -> list:
+        """
+        The current shares of the groups.
+
+        Returns
+        -------
+        list
+            A copy of the shares in the order of the groups.
+        """
+        return list(self._shares)
+
+    @property
+    def allocations(self) -> list[int]:
+        """
+        The allocations of the current shares.
+
+        Returns
+        -------
+        list[int]
+            A copy of the allocations in the order of the groups.
+        """
+        return list(self._allocations)
+
+    def update(self, deltas: dict[int, int | float]) -> list[int]:
+        """
+        Change the shares of groups and update the allocations.
+
+        Parameters
+        ----------
+        deltas : dict[int, int | float]
+            The changes to the shares of groups keyed by their indexes.
+
+        Returns
+        -------
+        list[int]
+            The allocations of the updated shares.
+        """
+        for i, delta in deltas.items():
+            self._shares[i] += delta
+
+        assert all(s >= 0 for s in self._shares), "'shares' cannot be negative."
+
+        if self._incremental:
+            self._move_marginal_seats()
+
+        else:
+            self._allocations = self._apportion()
+
+        return self.allocations
+
+    def _apportion(self) -> list[int]:
+        """
+        Derive the allocations of the current shares in full.
+
+        Returns
+        -------
+        list[int]
+            The allocations of the current shares.
+        """
+        if self.method == "highest_averages":
+            return highest_averages(
+                averaging_style=self.style,
+                shares=self._shares,
+                total_allocation=self.total_allocation,
+                allocation_threshold=self.allocation_threshold,
+                min_alloc=self.min_alloc,
+                modifier=self.modifier,
+                divisor_search=True,
+            )
+
+        return largest_remainder(
+            quota_style=self.style,
+            shares=self._shares,
+            total_allocation=self.total_allocation,
+            allocation_threshold=self.allocation_threshold,
+            min_alloc=self.min_alloc,
+        )
+
+    def _move_marginal_seats(self) -> None:
+        """
+        Move seats between groups until the last seat of every group is ranked above the next seat of all groups.
+
+        Notes
+        -----
+        Seats are ranked by quotient and then share as in majority tie breaks, with groups that also have equal shares being ranked by index.
+        """
+        shares = self._shares
+        if self.allocation_threshold:
+            total_shares = sum(shares)
+            shares = [
+                s if 1.0 * s / total_shares > self.allocation_threshold else 0
+                for s in shares
+            ]
+
+        allocations = self._allocations
+        base_alloc = self.min_alloc or 0
+        while True:
+            next_seats = [
+                (
+                    _quotient(
+                        share=s,
+                        divisor=_divisor(
+                            averaging_style=self.style,
+                            modifier=self.modifier,
+                            allocation=a,
+                        ),
+                    ),
+                    s,
+                    -i,
+                )
+                for i, (s, a) in enumerate(zip(shares, allocations, strict=True))
+            ]
+            last_seats = [
+                (
+                    _quotient(
+                        share=s,
+                        divisor=_divisor(
+                            averaging_style=self.style,
+                            modifier=self.modifier,
+                            allocation=a - 1,
+                        ),
+                    ),
+                    s,
+                    -i,
+                )
+                for i, (s, a) in enumerate(zip(shares, allocations, strict=True))
+                if a > base_alloc
+            ]
+            best_next_seat = max(next_seats)
+            if not last_seats or best_next_seat <= (worst_last_seat := min(last_seats)):
+                break
+
+            allocations[-best_next_seat[2]] += 1
+            allocations[-worst_last_seat[2]] -= 1
+
+
+def register_divisor_method(
+    name: str, squared_divisor: Callable[[int | np.ndarray], tuple]
+) -> None:
+    r"""
+    Register a highest averages method such that it can be passed as an averaging_style.
+
+    Parameters
+    ----------
+    name : str
+        The name of the method to pass as averaging_style.
+
+    squared_divisor : Callable
+        A function of the allocations a group has received that returns the numerator and denominator of the square of its divisor.
+
+        Note: the function must accept both integers and numpy arrays, with integers returning integers for exact comparisons.
+
+    Returns
+    -------
+    None
+        The method is added to the registry of divisor methods.
+
+    Notes
+    -----
+    Squares are used such that irrational divisors can still be compared exactly, for example Huntington-Hill is registered as:
+
+    .. math::
+        \textrm{d}^{2} &= \frac{a \cdot (a + 1)}{1}
+    """
+    assert callable(squared_divisor), "The squared_divisor argument must be a function."
+
+    _DIVISOR_METHODS[name] = squared_divisor
+    _DIVISOR_INVERSES.pop(name, None)
+
+
+def enable_result_cache(maxsize: int = 128) -> None:
+    """
+    Cache the results of largest_remainder and highest_averages such that repeated calls are not recomputed.
+
+    Parameters
+    ----------
+    maxsize : int (default=128)
+        The number of results to keep, with the least recently used being evicted first.
+
+    Returns
+    -------
+    None
+        Later calls with the same shares and arguments return cached results.
+
+    Notes
+    -----
+    Calls with tie_break='random' or an rng that is a np.random.Generator always bypass the cache, and results where a majority tie break defaulted to random are not stored.
+    """
+    assert maxsize > 0, "The maximum size of the result cache must be positive."
+
+    with _RESULT_CACHE_LOCK:
+        _RESULT_CACHE_STATS["maxsize"] = maxsize
+        while len(_RESULT_CACHE) > maxsize:
+            _RESULT_CACHE.popitem(last=False)
+
+
+def disable_result_cache() -> None:
+    """
+    Stop caching the results of largest_remainder and highest_averages and clear all cached results.
+
+    Returns
+    -------
+    None
+        Later calls are always recomputed.
+    """
+    with _RESULT_CACHE_LOCK:
+        _RESULT_CACHE_STATS["maxsize"] = 0
+        _RESULT_CACHE.clear()
+
+
+def clear_result_cache() -> None:
+    """
+    Remove all cached results and reset the hit and miss statistics of the result cache.
+
+    Returns
+    -------
+    None
+        The cache is emptied without changing whether it is enabled.
+    """
+    with _RESULT_CACHE_LOCK:
+        _RESULT_CACHE.clear()
+        _RESULT_CACHE_STATS["hits"] = 0
+        _RESULT_CACHE_STATS["misses"] = 0
+
+
+def result_cache_info() -> dict[str, int]:
+    """
+    Report the statistics of the result cache.
+
+    Returns
+    -------
+    dict[str, int]
+        The hits, misses, maxsize and current size (currsize) of the cache.
+    """
+    with _RESULT_CACHE_LOCK:
+        return {**_RESULT_CACHE_STATS, "currsize": len(_RESULT_CACHE)}
+
+
+def _get_rng(rng: np.random.Generator | int | None) -> np.random.Generator | None:
+    """
+    Derive the generator used for random tie breaks from a generator or seed.
+
+    Parameters
+    ----------
+    rng : np.random.Generator | int
+        The generator or seed used for random tie breaks.
+
+    Returns
+    -------
+    np.random.Generator
+        The generator, or None if the global state of the random module should be used.
+    """
+    if rng is None or isinstance(rng, np.random.Generator):
+        return rng
+
+    return np.random.default_rng(rng)
+
+
+def _as_share_array(shares: object) -> np.ndarray | None:
+    """
+    View shares as a one dimensional array if they are passed as an array rather than a Python sequence.
+
+    Parameters
+    ----------
+    shares : object
+        The shares passed to an apportionment function.
+
+    Returns
+    -------
+    np.ndarray | None
+        The shares as an array, or None if they are a list, tuple or other Python iterable.
+
+    Notes
+    -----
+    Arrays, pandas Series and other objects supporting the array interface or buffer protocol are viewed without copying where their dtype allows.
+    """
+    if isinstance(shares, np.ndarray):
+        share_array = shares
+
+    elif isinstance(shares, list | tuple):
+        return None
+
+    else:
+        if not hasattr(shares, "__array__"):
+            try:
+                memoryview(shares)
+
+            except TypeError:
+                return None
+
+        share_array = np.asarray(shares)
+
+    assert share_array.ndim == 1, "'shares' must be one dimensional."
+
+    return share_array
+
+
+def _like_shares(shares: object, allocations: np.ndarray) -> np.ndarray:
+    """
+    Return allocations as a Series if the shares that were passed are a pandas Series, and otherwise as an array.
+
+    Parameters
+    ----------
+    shares : object
+        The shares passed to an apportionment function as an array, Series or buffer.
+
+    allocations : np.ndarray
+        The allocations in the order of the provided shares.
+
+    Returns
+    -------
+    np.ndarray | pd.Series
+        The allocations, with the index and name of the shares if they are a pandas Series.
+
+    Notes
+    -----
+    Buffers such as array.array and memoryview are returned as arrays.
+    """
+    if not isinstance(shares, np.ndarray) and hasattr(shares, "to_numpy"):
+        return type(shares)(
+            allocations, index=shares.index, name=getattr(shares, "name", None)
+        )
+
+    return allocations
+
+
+def _shuffle(indexes: list[int], rng: np.random.Generator | None = None) -> None:
+    """
+    Shuffle the indexes of tied groups in place and record that a tie was broken randomly.
+
+    Parameters
+    ----------
+    indexes : list[int]
+        The indexes of the groups that are tied.
+
+    rng : np.random.Generator (default=None)
+        The generator used for random tie breaks, with None using the global state of the random module.
+
+    Returns
+    -------
+    None
+        The indexes are shuffled in place.
+    """
+    if rng is None:
+        shuffle(indexes)
+
+    else:
+        rng.shuffle(indexes)
+
+    _TIE_BREAK_STATE.used_random = True
+
+
+def _assign_largest_remainders(
+    quota_style: str,
+    share_array: np.ndarray,
+    share_sums: np.ndarray,
+    totals: np.ndarray,
+    min_alloc: int | None,
+    exact: bool = False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Derive largest remainder allocations for many elections at once.
+
+    Parameters
+    ----------
+    quota_style : str
+        The name of the quota style to use in the calculation.
+
+    share_array : np.ndarray (num_elections, num_groups)
+        The populations or votes for regions or parties in each election after thresholds are applied.
+
+    share_sums : np.ndarray (num_elections,)
+        The total shares of each election.
+
+    totals : np.ndarray (num_elections,)
+        The number of allocations to provide in each election.
+
+    min_alloc : int
+        A minimum number of allocations that each group must receive.
+
+    exact : bool (default=False)
+        Whether remainders are derived as integer numerators over the quota numerators of the elections.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The allocations of each election and a mask of the elections that require a tie break and must be derived individually.
+    """
+    baseline_allocations = np.zeros(share_array.shape, dtype=np.int64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if min_alloc is not None and min_alloc > 0:
+            assert (min_alloc * share_array.shape[1] <= totals).all(), (
+                "The sum of the minimum seats to be allocated cannot be more than the seats to be allocated."
+            )
+            # Save the original remainders to avoid penalization from new
+            # divisions after minimum seat allocation.
+            original_remainders, original_allocations = _divide_by_quotas(
+                quota_style=quota_style,
+                share_array=share_array,
+                share_sums=share_sums,
+                totals=totals,
+                exact=exact,
+            )
+            baseline_allocations = np.maximum(original_allocations, min_alloc).astype(
+                np.int64
+            )
+            over_allocated = baseline_allocations.sum(axis=1) > totals
+            baseline_allocations[over_allocated] = min_alloc
+            totals = totals - baseline_allocations.sum(axis=1)
+
+            remainders, allocations = _divide_by_quotas(
+                quota_style=quota_style,
+                share_array=share_array,
+                share_sums=share_sums,
+                totals=totals,
+                exact=exact,
+            )
+            remainders = original_remainders
+            has_extra_allocations = (baseline_allocations != min_alloc).any(axis=1)
+            allocations[has_extra_allocations] = 0
+
+        else:
+            remainders, allocations = _divide_by_quotas(
+                quota_style=quota_style,
+                share_array=share_array,
+                share_sums=share_sums,
+                totals=totals,
+                exact=exact,
+            )
+
+    allocations = allocations.astype(np.int64)
+    unallocated = totals - allocations.sum(axis=1)
+    assigned = totals == 0
+    allocations[assigned] = 0
+
+    # Whole rounds of allocations are assigned to all groups if there are more
+    # unallocated than groups, as in largest_remainder.
+    num_elections, num_groups = share_array.shape
+    rounds = np.where(unallocated > num_groups, unallocated // num_groups, 0)
+    allocations += rounds[:, None]
+    unallocated = unallocated - rounds * num_groups
+
+    # Assign to the remainders that are greater than or equal to the last
+    # remainder to be assigned given that it is unique.
+    assignable = ~assigned & (unallocated >= 1) & (unallocated <= num_groups)
+    remainders_sorted = -np.sort(-remainders, axis=1)
+    last_assigned_remainders = remainders_sorted[
+        np.arange(num_elections), np.clip(unallocated - 1, 0, num_groups - 1)
+    ][:, None]
+    assignable &= (remainders == last_assigned_remainders).sum(axis=1) == 1
+    allocations += (remainders >= last_assigned_remainders) & assignable[:, None]
+
+    allocations += baseline_allocations
+
+    return allocations, ~assigned & ~assignable
+
+
+def _divide_by_quotas(
+    quota_style: str,
+    share_array: np.ndarray,
+    share_sums: np.ndarray,
+    totals: np.ndarray,
+    exact: bool = False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Split the shares of many elections by their seat quotas into remainders and whole allocations.
+
+    Parameters
+    ----------
+    quota_style : str
+        The name of the quota style to use in the calculation.
+
+    share_array : np.ndarray (num_elections, num_groups)
+        The populations or votes for regions or parties in each election.
+
+    share_sums : np.ndarray (num_elections,)
+        The total shares of each election.
+
+    totals : np.ndarray (num_elections,)
+        The number of allocations to provide in each election.
+
+    exact : bool (default=False)
+        Whether remainders are derived as integer numerators over the quota numerators of the elections.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The remainders and whole allocations of each group.
+
+    Notes
+    -----
+    Exact remainders are those of largest_remainder with exact=True, and as such are comparable within an election.
+    """
+    if not exact:
+        return np.modf(
+            share_array
+            / _get_quotas(
+                quota_style=quota_style, share_sums=share_sums, totals=totals
+            )[:, None]
+        )
+
+    if quota_style == "Hare":
+        quota_numerators, quota_denominators = share_sums, totals
+
+    elif quota_style == "Droop":
+        quota_numerators, quota_denominators = (
+            share_sums // (totals + 1) + 1,
+            np.ones_like(totals),
+        )
+
+    elif quota_style == "Hagenbach–Bischoff":
+        quota_numerators, quota_denominators = share_sums, totals + 1
+
+    else:
+        raise ValueError(
+            "Invalid quota provided. Choose from Hare, Droop, or Hagenbach–Bischoff."
+        )
+
+    allocations, remainders = np.divmod(
+        share_array * quota_denominators[:, None], quota_numerators[:, None]
+    )
+
+    return remainders, allocations
+
+
+def _as_exact_shares(share_array: np.ndarray, max_factor: int) -> np.ndarray:
+    """
+    Convert shares to integers that can be multiplied by a factor without overflow.
+
+    Parameters
+    ----------
+    share_array : np.ndarray
+        The populations or votes for regions or parties.
+
+    max_factor : int
+        The largest factor that the shares are multiplied by.
+
+    Returns
+    -------
+    np.ndarray
+        The shares as int64, or as Python integers if their products with max_factor could overflow int64.
+    """
+    if share_array.dtype.kind not in "iub":
+        assert all(int(s) == s for s in share_array.flat), (
+            "'shares' must be integers when using exact comparisons."
+        )
+
+    if int(abs(share_array).max(initial=0)) * max_factor < 2**63:
+        return share_array.astype(np.int64)
+
+    return np.frompyfunc(int, 1, 1)(share_array)
+
+
+def _get_quotas(
+    quota_style: str, share_sums: np.ndarray, totals: np.ndarray
+) -> np.ndarray:
+    """
+    Derive the number of shares represented by each allocation for many elections.
+
+    Parameters
+    ----------
+    quota_style : str
+        The name of the quota style to use in the calculation.
+
+    share_sums : np.ndarray
+        The total shares of each election.
+
+    totals : np.ndarray
+        The number of allocations to provide in each election.
+
+    Returns
+    -------
+    np.ndarray
+        The seat quota of each election for the given quota style.
+    """
+    if quota_style == "Hare":
+        return 1.0 * share_sums / totals
+
+    elif quota_style == "Droop":
+        return np.trunc(share_sums / (totals + 1)) + 1
+
+    elif quota_style == "Hagenbach–Bischoff":
+        return 1.0 * share_sums / (totals + 1)
+
+    raise ValueError(
+        "Invalid quota provided. Choose from Hare, Droop, or Hagenbach–Bischoff."
+    )
+
+
+def _quotient(share: int | float, divisor: float) -> float:
+    """
+    Divide a share by a divisor, with positive shares over a divisor of zero having an infinite quotient.
+
+    Parameters
+    ----------
+    share : int | float
+        The population or votes of the group.
+
+    divisor : float
+        The divisor of the group given its current allocation.
+
+    Returns
+    -------
+    float
+        The quotient of the group.
+    """
+    if divisor:
+        return 1.0 * share / divisor
+
+    return inf if share else 0.0
+
+
+def _divisor(averaging_style: str, modifier: float | None, allocation: int) -> float:
+    """
+    Derive the divisor of a highest averages style given the allocations of a group.
+
+    Parameters
+    ----------
+    averaging_style : str
+        The name of the highest averages style to use in the calculation.
+
+    modifier : float
+        What to replace the divisor of the first quotient by.
+
+    allocation : int
+        The number of allocations the group has already received.
+
+    Returns
+    -------
+    float
+        The divisor of the group, equal to that of _divisors.
+    """
+    if modifier and allocation <= 1:
+        return float(modifier)
+
+    numerator, denominator = _DIVISOR_METHODS[averaging_style](float(allocation))
+
+    return sqrt(numerator / denominator)
+
+
+def _divisors(
+    averaging_style: str, modifier: float | None, allocations: np.ndarray
+) -> np.ndarray:
+    """
+    Derive the divisors of a highest averages style given the allocations of groups.
+
+    Parameters
+    ----------
+    averaging_style : str
+        The name of the highest averages style to use in the calculation.
+
+    modifier : float
+        What to replace the divisor of the first quotient by.
+
+    allocations : np.ndarray
+        The number of allocations the groups have already received.
+
+    Returns
+    -------
+    np.ndarray
+        The divisors of the groups.
+
+    Notes
+    -----
+    Divisors are derived from the allocations in closed form, such that no table of divisors as long as the house is needed.
+    """
+    allocation_floats = np.asarray(allocations, dtype=np.float64)
+    numerators, denominators = _DIVISOR_METHODS[averaging_style](allocation_floats)
+    divisors = np.sqrt(
+        np.broadcast_to(
+            np.asarray(numerators / denominators, dtype=np.float64),
+            allocation_floats.shape,
+        )
+    )
+    if modifier:
+        divisors = np.where(allocation_floats <= 1, float(modifier), divisors)
+
+    return divisors
+
+
+def _monotone_from(averaging_style: str, modifier: float | None) -> int:
+    """
+    Find the allocation from which the divisors of a highest averages style do not decrease.
+
+    Parameters
+    ----------
+    averaging_style : str
+        The name of the highest averages style to use in the calculation.
+
+    modifier : float
+        What to replace the divisor of the first quotient by.
+
+    Returns
+    -------
+    int
+        The least allocation after which divisors do not decrease.
+
+    Notes
+    -----
+    Registered divisors are assumed to not decrease, such that only a modifier that is greater than the divisor that follows it can lead to decreasing divisors.
+    """
+    decreasing = np.flatnonzero(
+        np.diff(
+            _divisors(
+                averaging_style=averaging_style,
+                modifier=modifier,
+                allocations=np.arange(3),
+            )
+        )
+        < 0
+    )
+
+    return int(decreasing[-1]) + 1 if len(decreasing) else 0
+
+
+def _least_allocations_with_divisor(
+    averaging_style: str,
+    modifier: float | None,
+    quotients: np.ndarray,
+    low: np.ndarray | int,
+    high: np.ndarray | int,
+) -> np.ndarray:
+    """
+    Find the least allocations between bounds with divisors that are at least the given quotients.
+
+    Parameters
+    ----------
+    averaging_style : str
+        The name of the highest averages style to use in the calculation.
+
+    modifier : float
+        What to replace the divisor of the first quotient by.
+
+    quotients : np.ndarray
+        The values that divisors are compared to.
+
+    low : np.ndarray | int
+        The least allocations to return, from which divisors must not decrease.
+
+    high : np.ndarray | int
+        The greatest allocations to return, being returned if no lesser allocation has a divisor that is at least the quotient.
+
+    Returns
+    -------
+    np.ndarray
+        The least allocations with divisors that are at least the quotients.
+
+    Notes
+    -----
+    Allocations of the built-in styles are derived by inverting their divisors, and so may differ by one from those of _divisors given floating point error, with those of registered styles being found via bisection over the allocations.
+    """
+    low = np.broadcast_to(np.asarray(low, dtype=np.int64), quotients.shape)
+    high = np.broadcast_to(np.asarray(high, dtype=np.int64), quotients.shape)
+
+    if averaging_style not in _DIVISOR_INVERSES:
+        while (searching := low < high).any():
+            middle = (low + high) // 2
+            at_least = (
+                _divisors(
+                    averaging_style=averaging_style,
+                    modifier=modifier,
+                    allocations=middle,
+                )
+                >= quotients
+            )
+            high = np.where(searching & at_least, middle, high)
+            low = np.where(searching & ~at_least, middle + 1, low)
+
+        return low
+
+    with np.errstate(invalid="ignore", over="ignore"):
+        estimates = np.ceil(_DIVISOR_INVERSES[averaging_style](quotients))
+
+    if modifier:
+        # The modifier replaces the divisors of the first two allocations.
+        estimates = np.where(
+            (quotients <= modifier) & (low < 2), 0.0, np.maximum(estimates, 2.0)
+        )
+
+    return np.clip(np.nan_to_num(estimates, nan=0.0), low, high).astype(np.int64)
+
+
+def _exact_highest_averages_quotient(
+    averaging_style: str, share: int, allocation: int, modifier: float | None
+) -> tuple[int, int]:
+    """
+    Derive the square of the quotient of a group as an integer numerator and denominator.
+
+    Parameters
+    ----------
+    averaging_style : str
+        The name of the highest averages style to use in the calculation.
+
+    share : int
+        The population or votes of the group.
+
+    allocation : int
+        The number of allocations the group has already received.
+
+    modifier : float
+        What to replace the divisor of the first quotient by.
+
+    Returns
+    -------
+    tuple[int, int]
+        The numerator and denominator of the squared quotient, with the denominator being zero for infinite quotients.
+    """
+    if not share:
+        return 0, 1
+
+    if modifier and allocation <= 1:
+        # The decimal value of the modifier is used rather than its binary float.
+        exact_modifier = Fraction(str(modifier))
+        divisor_numerator, divisor_denominator = (
+            exact_modifier.numerator**2,
+            exact_modifier.denominator**2,
+        )
+
+    else:
+        divisor_numerator, divisor_denominator = _DIVISOR_METHODS[averaging_style](
+            allocation
+        )
+
+    return share**2 * divisor_denominator, divisor_numerator
+
+
+def _exact_highest_averages_quotients(
+    averaging_style: str,
+    shares: np.ndarray,
+    allocations: np.ndarray,
+    modifier: float | None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Derive the squares of the quotients of all groups as integer numerators and denominators.
+
+    Parameters
+    ----------
+    averaging_style : str
+        The name of the highest averages style to use in the calculation.
+
+    shares : np.ndarray
+        The populations or votes of the groups as integers.
+
+    allocations : np.ndarray
+        The number of allocations the groups have already received.
+
+    modifier : float
+        What to replace the divisor of the first quotient by.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The numerators and denominators of the squared quotients as in _exact_highest_averages_quotient, being int64 unless their cross-products could overflow it and Python integers otherwise.
+    """
+    divisor_method = _DIVISOR_METHODS[averaging_style]
+    if modifier:
+        exact_modifier = Fraction(str(modifier))
+        modifier_numerator, modifier_denominator = (
+            exact_modifier.numerator**2,
+            exact_modifier.denominator**2,
+        )
+
+    def get_divisors(allocations: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Derive the numerators and denominators of the squared divisors of the groups.
+
+        Parameters
+        ----------
+        allocations : np.ndarray
+            The number of allocations the groups have already received.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The numerators and denominators of the squared divisors.
+        """
+        divisor_numerators, divisor_denominators = (
+            np.broadcast_to(d, allocations.shape) for d in divisor_method(allocations)
+        )
+        if modifier:
+            divisor_numerators = np.where(
+                allocations <= 1, modifier_numerator, divisor_numerators
+            )
+            divisor_denominators = np.where(
+                allocations <= 1, modifier_denominator, divisor_denominators
+            )
+
+        return divisor_numerators, divisor_denominators
+
+    # Cross-products are bounded by the squared shares times both divisor parts,
+    # which is estimated via floats with a margin for their rounding.
+    float_numerators, float_denominators = get_divisors(
+        allocations=allocations.astype(np.float64)
+    )
+    max_product = (
+        float(abs(shares).max(initial=0)) ** 2
+        * float(abs(float_numerators).max(initial=0))
+        * float(abs(float_denominators).max(initial=0))
+    )
+    if max_product < 2**62:
+        shares, allocations = shares.astype(np.int64), allocations.astype(np.int64)
+
+    else:
+        shares, allocations = (
+            np.frompyfunc(int, 1, 1)(shares),
+            np.frompyfunc(int, 1, 1)(allocations),
+        )
+
+    divisor_numerators, divisor_denominators = get_divisors(allocations=allocations)
+    has_shares = shares != 0
+
+    return (
+        np.where(has_shares, shares**2 * divisor_denominators, 0),
+        np.where(has_shares, divisor_numerators, 1),
+    )
+
+
+def _exact_max_quotients(
+    quotients: np.ndarray, exact_quotients: tuple[np.ndarray, np.ndarray]
+) -> np.ndarray:
+    """
+    Find the groups of each election with the maximum quotient given exact comparisons.
+
+    Parameters
+    ----------
+    quotients : np.ndarray (num_elections, num_groups)
+        The quotients of the groups as floats.
+
+    exact_quotients : tuple[np.ndarray, np.ndarray]
+        The numerators and denominators of the squared quotients of the groups.
+
+    Returns
+    -------
+    np.ndarray (num_elections, num_groups)
+        A mask of the groups with the maximum quotient of each election.
+
+    Notes
+    -----
+    Only groups with floats within rounding error of the maximum are cross-multiplied, starting from a group with the maximum float.
+    """
+    numerators, denominators = exact_quotients
+    rows = np.arange(len(quotients))
+    candidates = quotients >= quotients.max(axis=1, keepdims=True) * (1 - 1e-12)
+    max_indexes = quotients.argmax(axis=1)
+    while True:
+        max_numerators = numerators[rows, max_indexes][:, None]
+        max_denominators = denominators[rows, max_indexes][:, None]
+        is_greater = candidates & (
+            numerators * max_denominators > max_numerators * denominators
+        )
+        if not is_greater.any():
+            break
+
+        max_indexes = np.where(
+            is_greater.any(axis=1), is_greater.argmax(axis=1), max_indexes
+        )
+
+    return candidates & (numerators * max_denominators == max_numerators * denominators)
+
+
+def _averaging_style_error(averaging_style: str) -> ValueError:
+    """
+    Explain the naming conventions of highest averages methods and create the error for an unsupported style.
+
+    Parameters
+    ----------
+    averaging_style : str
+        The name of the highest averages style that was passed.
+
+    Returns
+    -------
+    ValueError
+        The error to raise for the unsupported style.
+    """
+    print(
+        "Naming conventions for methods differ across regions, with United States naming conventions used in poli-sci-kit."
+    )
+    print(
+        """US assignment method name conversions:
+            Jeffersion         : D'Hondt, Hagenbach-Bischoff (includes entry quota)
+            Webster            : Sainte-Laguë, Major Fraction
+            Huntington-Hill    : Equal Proportions
+            Adams              : Smallest Divisors
+            Dean               : Harmonic Mean"""
+    )
+    return ValueError(
+        f"'{averaging_style}' is not a supported highest averages method. Please choose from "
+        + ", ".join(f"'{style}'" for style in _DIVISOR_METHODS)
+        + "."
+    )
+
+
+def _break_tie(
+    tied_indexes: list[int],
+    shares: list[int],
+    tie_break: str | None,
+    rng: np.random.Generator | None = None,
+) -> tuple[int, str | None]:
+    """
+    Select the group that receives an allocation when more groups are tied than allocations remain.
+
+    Parameters
+    ----------
+    tied_indexes : list[int]
+        The indexes of the groups that are tied.
+
+    shares : list[int]
+        A list of populations or votes for regions or parties.
+
+    tie_break : str
+        How a tie break is done (by majority or random, with a majority tie defaulting to random).
+
+    rng : np.random.Generator (default=None)
+        The generator used for random tie breaks, with None using the global state of the random module.
+
+    Returns
+    -------
+    tuple[int, str]
+        The index of the group that receives the allocation and the tie break to use for later ties.
+    """
+    tied_indexes = sorted(tied_indexes)
+    if tie_break == "majority":
+        sorted_by_results = sorted(tied_indexes, key=lambda i: shares[i])[::-1]
+        equal_to_highest = [
+            i for i in sorted_by_results if shares[i] == shares[sorted_by_results[0]]
+        ]
+
+        if len(equal_to_highest) == 1:
+            return sorted_by_results[0], tie_break
+
+        # Defaults to random for those with equal allocation and remainder.
+        tie_break = "random"
+
+    if tie_break == "random":
+        _shuffle(indexes=tied_indexes, rng=rng)
+        return tied_indexes[0], tie_break
+
+    raise ValueError(
+        f"A tie break is required for the last seat(s), and an invalid argument '{tie_break}' has been passed. Please choose from 'majority' or 'random'."
+    )
+
+
+def _assign_by_priority(
+    averaging_style: str,
+    shares: list[int],
+    allocations: list[int],
+    remaining_alloc: int,
+    tie_break: str | None,
+    modifier: float | None,
+    exact: bool = False,
+    rng: np.random.Generator | None = None,
+    tied_indexes: list[int] | None = None,
+) -> list[int]:
+    """
+    Assign the remaining allocations one at a time to the groups with the highest quotients.
+
+    Parameters
+    ----------
+    averaging_style : str
+        The name of the highest averages style to use in the calculation.
+
+    shares : list[int]
+        A list of populations or votes for regions or parties.
+
+    allocations : list[int]
+        The allocations that each group has already received.
+
+    remaining_alloc : int
+        The number of allocations left to provide.
+
+    tie_break : str
+        How a tie break is done (by majority or random, with a majority tie defaulting to random).
+
+    modifier : float
+        What to replace the divisor of the first quotient by.
+
+    exact : bool (default=False)
+        Whether quotients are compared exactly via integer cross-multiplication.
+
+    rng : np.random.Generator (default=None)
+        The generator used for random tie breaks, with None using the global state of the random module.
+
+    tied_indexes : list[int] (default=None)
+        A list that the indexes of the groups tied for the last allocations are added to if a tie break is required.
+
+    Returns
+    -------
+    list[int]
+        The allocations in the order of the provided shares.
+
+    Notes
+    -----
+    Quotients are kept in a max-heap such that only the quotient of a group that has received an allocation is recomputed, with each allocation thus costing O(log n).
+
+    Exact quotients are ordered in the heap by their correctly rounded floats, which never invert the order of two quotients, with cross-multiplication only being needed for groups with equal floats.
+    """
+    if remaining_alloc <= 0:
+        return allocations
+
+    if averaging_style not in _DIVISOR_METHODS:
+        raise _averaging_style_error(averaging_style=averaging_style)
+
+    exact_quotients: dict[int, tuple[int, int]] = {}
+
+    def get_priority(i: int) -> float:
+        """
+        Derive the heap priority of a group given its current allocation.
+
+        Parameters
+        ----------
+        i : int
+            The index of the group.
+
+        Returns
+        -------
+        float
+            The negative quotient of the group.
+        """
+        if not exact:
+            return -_quotient(
+                share=shares[i],
+                divisor=_divisor(
+                    averaging_style=averaging_style,
+                    modifier=modifier,
+                    allocation=allocations[i],
+                ),
+            )
+
+        numerator, denominator = _exact_highest_averages_quotient(
+            averaging_style=averaging_style,
+            share=shares[i],
+            allocation=allocations[i],
+            modifier=modifier,
+        )
+        exact_quotients[i] = numerator, denominator
+
+        return -(numerator / denominator) if denominator else -inf
+
+    heap = [(get_priority(i), i) for i in range(len(shares))]
+    heapify(heap)
+
+    while remaining_alloc > 0:
+        # Pop all groups that share the maximum quotient to check if a tie break
+        # is needed.
+        max_quotient, first_index = heappop(heap)
+        max_quotient_indexes = [first_index]
+        while heap and heap[0][0] == max_quotient:
+            max_quotient_indexes.append(heappop(heap)[1])
+
+        if exact and len(max_quotient_indexes) > 1:
+            # Equal floats may be unequal quotients, so only keep the exact maximum.
+            max_numerator, max_denominator = exact_quotients[first_index]
+            for i in max_quotient_indexes[1:]:
+                numerator, denominator = exact_quotients[i]
+                if numerator * max_denominator > max_numerator * denominator:
+                    max_numerator, max_denominator = numerator, denominator
+
+            smaller_quotient_indexes = [
+                i
+                for i in max_quotient_indexes
+                if exact_quotients[i][0] * max_denominator
+                < max_numerator * exact_quotients[i][1]
+            ]
+            for i in smaller_quotient_indexes:
+                heappush(heap, (max_quotient, i))
+
+            max_quotient_indexes = [
+                i for i in max_quotient_indexes if i not in smaller_quotient_indexes
+            ]
+
+        # Normal assignment to all that have the max quotient.
+        if len(max_quotient_indexes) <= remaining_alloc:
+            assigned_indexes = max_quotient_indexes
+
+        # Tie break conditions.
+        else:
+            if tied_indexes is not None and not tied_indexes:
+                tied_indexes.extend(max_quotient_indexes)
+
+            assigned_index, tie_break = _break_tie(
+                tied_indexes=max_quotient_indexes,
+                shares=shares,
+                tie_break=tie_break,
+                rng=rng,
+            )
+            assigned_indexes = [assigned_index]
+
+        for i in assigned_indexes:
+            allocations[i] += 1
+
+        remaining_alloc -= len(assigned_indexes)
+
+        for i in max_quotient_indexes:
+            heappush(heap, (get_priority(i), i))
+
+    return allocations
+
+
+def _highest_averages_quotients(
+    averaging_style: str,
+    shares: np.ndarray,
+    allocations: np.ndarray,
+    modifier: float | None,
+) -> np.ndarray:
+    """
+    Derive the quotients of all groups given their current allocations.
+
+    Parameters
+    ----------
+    averaging_style : str
+        The name of the highest averages style to use in the calculation.
+
+    shares : np.ndarray
+        The populations or votes of the groups as floats.
+
+    allocations : np.ndarray
+        The number of allocations the groups have already received.
+
+    modifier : float
+        What to replace the divisor of the first quotient by.
+
+    Returns
+    -------
+    np.ndarray
+        The quotients of the groups, equal to those of _quotient given the same divisors.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        quotients = shares / _divisors(
+            averaging_style=averaging_style,
+            modifier=modifier,
+            allocations=allocations,
+        )
+
+    return np.where(shares > 0, quotients, 0.0)
+
+
+def _highest_averages_result(
+    averaging_style: str,
+    shares: list[int],
+    provided_shares: list[int],
+    allocations: list[int],
+    modifier: float | None,
+    tied_indexes: list[int],
+) -> AllocationResult:
+    """
+    Combine highest averages allocations with the quotients of groups for the next allocation.
+
+    Parameters
+    ----------
+    averaging_style : str
+        The name of the highest averages style to use in the calculation.
+
+    shares : list[int]
+        The populations or votes for regions or parties that passed the allocation threshold.
+
+    provided_shares : list[int]
+        The populations or votes for regions or parties that were provided.
+
+    allocations : list[int]
+        The final allocations.
+
+    modifier : float
+        What to replace the divisor of the first quotient by.
+
+    tied_indexes : list[int]
+        The indexes of the groups that were tied for the last allocations.
+
+    Returns
+    -------
+    AllocationResult
+        The allocations along with the next quotients and tied groups.
+    """
+    if averaging_style not in _DIVISOR_METHODS:
+        raise _averaging_style_error(averaging_style=averaging_style)
+
+    share_array = np.asarray(shares, dtype=np.float64)
+    allocation_array = np.asarray(allocations, dtype=np.int64)
+
+    return AllocationResult(
+        shares=provided_shares,
+        allocations=allocation_array,
+        method="highest_averages",
+        style=averaging_style,
+        quotients=_highest_averages_quotients(
+            averaging_style=averaging_style,
+            shares=share_array,
+            allocations=allocation_array,
+            modifier=modifier,
+        ),
+        tied=tied_indexes,
+    )
+
+
+def _allocate_by_divisor_search(
+    averaging_style: str,
+    shares: np.ndarray,
+    allocations: np.ndarray,
+    remaining_alloc: np.ndarray,
+    modifier: float | None,
+    margin: float = 0.0,
+) -> np.ndarray:
+    """
+    Assign all allocations with quotients above a critical divisor at once.
+
+    Parameters
+    ----------
+    averaging_style : str
+        The name of the highest averages style to use in the calculation.
+
+    shares : np.ndarray (num_elections, num_groups)
+        The populations or votes of the groups as floats.
+
+    allocations : np.ndarray (num_elections, num_groups)
+        The allocations that each group has already received.
+
+    remaining_alloc : np.ndarray (num_elections,)
+        The number of allocations left to provide in each election.
+
+    modifier : float
+        What to replace the divisor of the first quotient by.
+
+    margin : float (default=0.0)
+        The relative amount by which assigned quotients must be greater than unassigned ones, allowing for quotients that are compared exactly rather than as floats.
+
+    Returns
+    -------
+    np.ndarray (num_elections, num_groups)
+        The allocations including those above the critical divisors, with at most remaining_alloc being added to each election.
+
+    Notes
+    -----
+    The critical divisor of each election is found via bisection, with the number of allocations for each divisor derived by inverting the divisors of all groups at once such that the runtime does not grow with the number of allocations.
+
+    Allocations that are within floating point error of the divisor are removed such that every quotient assigned is strictly greater than every quotient that is not, with the remaining allocations then needing to be assigned by quotient.
+    """
+    if averaging_style not in _DIVISOR_METHODS or allocations.size == 0:
+        return allocations
+
+    # Divisors must not decrease after the current allocations, as otherwise
+    # seats aren't assigned in quotient order.
+    monotone_from = _monotone_from(averaging_style=averaging_style, modifier=modifier)
+    max_allocations = (allocations.max(axis=1) + remaining_alloc)[:, None]
+
+    searchable = (
+        (remaining_alloc > 0)
+        & (shares > 0).any(axis=1)
+        & (allocations.min(axis=1) >= monotone_from)
+    )
+
+    def count_allocations(rows: np.ndarray, divisors: np.ndarray) -> np.ndarray:
+        """
+        Count the allocations of each group with quotients greater than the divisor of its election.
+
+        Parameters
+        ----------
+        rows : np.ndarray (num_rows,)
+            The indexes of the elections to count allocations for.
+
+        divisors : np.ndarray (num_rows,)
+            The divisors that quotients are compared to.
+
+        Returns
+        -------
+        np.ndarray (num_rows, num_groups)
+            The number of allocations above the divisors in addition to the passed allocations.
+        """
+        counts = (
+            _least_allocations_with_divisor(
+                averaging_style=averaging_style,
+                modifier=modifier,
+                quotients=shares[rows] / divisors[:, None],
+                low=monotone_from,
+                high=max_allocations[rows],
+            )
+            - allocations[rows]
+        )
+
+        return np.maximum(counts, 0)
+
+    counts = np.zeros(shares.shape, dtype=np.int64)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        # Quotients are bounded by the largest share over the smallest positive
+        # divisor, with only those of zero divisors being greater.
+        first_divisors = _divisors(
+            averaging_style=averaging_style,
+            modifier=modifier,
+            allocations=np.arange(3),
+        )
+        low = np.zeros(len(shares))
+        high = shares.max(axis=1) / first_divisors[first_divisors > 0].min(initial=inf)
+        for _ in range(200):
+            mid = (low + high) / 2
+            searchable &= (mid != low) & (mid != high)
+            if not searchable.any():
+                break
+
+            # Only elections that are still being searched are counted.
+            rows = np.flatnonzero(searchable)
+            mid_counts = count_allocations(rows=rows, divisors=mid[rows])
+            mid_totals = mid_counts.sum(axis=1)
+            above = mid_totals > remaining_alloc[rows]
+
+            low[rows[above]] = mid[rows[above]]
+            high[rows[~above]] = mid[rows[~above]]
+            counts[rows[~above]] = mid_counts[~above]
+            searchable[rows[~above & (mid_totals == remaining_alloc[rows])]] = False
+
+        # Remove allocations that are not strictly above all unassigned quotients.
+        while counts.any():
+            last_quotients = _highest_averages_quotients(
+                averaging_style=averaging_style,
+                shares=shares,
+                allocations=allocations + counts - 1,
+                modifier=modifier,
+            )
+            max_next_quotients = _highest_averages_quotients(
+                averaging_style=averaging_style,
+                shares=shares,
+                allocations=allocations + counts,
+                modifier=modifier,
+            ).max(axis=1, keepdims=True)
+            uncertain = (counts > 0) & (
+                last_quotients <= max_next_quotients * (1 + margin)
+            )
+            if not uncertain.any():
+                break
+
+            counts[uncertain] -= 1
+
+    return allocations + counts
+
+
+def _webster_allocate_rows(
+    weights: np.ndarray, totals: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Apportion each row of weights via the Webster method and derive the divisor of each row.
+
+    Parameters
+    ----------
+    weights : np.ndarray (num_rows, num_columns)
+        The scaled shares of each row.
+
+    totals : np.ndarray (num_rows,)
+        The number of allocations to provide in each row.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The allocations of each row and divisors that round the weights over them to the allocations, with tied quotients being assigned to the first column.
+    """
+    assert ((weights > 0).any(axis=1) | (totals == 0)).all(), (
+        "Allocations cannot be provided to rows without shares."
+    )
+
+    allocations = _allocate_by_divisor_search(
+        averaging_style="Webster",
+        shares=weights,
+        allocations=np.zeros(weights.shape, dtype=np.int64),
+        remaining_alloc=totals,
+        modifier=None,
+    )
+    rows = np.arange(len(weights))
+    while (pending := allocations.sum(axis=1) < totals).any():
+        quotients = _highest_averages_quotients(
+            averaging_style="Webster",
+            shares=weights,
+            allocations=allocations,
+            modifier=None,
+        )
+        allocations[rows[pending], quotients[pending].argmax(axis=1)] += 1
+
+    next_quotients = _highest_averages_quotients(
+        averaging_style="Webster",
+        shares=weights,
+        allocations=allocations,
+        modifier=None,
+    ).max(axis=1)
+    last_quotients = np.where(
+        allocations > 0,
+        _highest_averages_quotients(
+            averaging_style="Webster",
+            shares=weights,
+            allocations=np.maximum(allocations - 1, 0),
+            modifier=None,
+        ),
+        inf,
+    ).min(axis=1)
+
+    # Quotients are over the odd Webster divisors 2a + 1, such that divisors between
+    # them are doubled to round the weights over them to the allocations. Rows
+    # without allocations only need divisors above all of their quotients.
+    divisors = np.where(
+        np.isfinite(last_quotients),
+        next_quotients + last_quotients,
+        np.where(next_quotients > 0, 4 * next_quotients, 2.0),
+    )
+
+    return allocations, divisors
+
+
+def _allocate_above_divisor(
+    averaging_style: str, shares: list[int], divisor: float
+) -> list[int]:
+    """
+    Count the allocations of each group with quotients strictly greater than a divisor.
+
+    Parameters
+    ----------
+    averaging_style : str
+        The name of the highest averages style to use in the calculation.
+
+    shares : list[int]
+        A list of populations or votes for regions or parties.
+
+    divisor : float
+        The divisor that quotients are compared to.
+
+    Returns
+    -------
+    list[int]
+        The number of allocations of each group with quotients above the divisor.
+
+    Notes
+    -----
+    Counts are found by inverting the divisors, and are then corrected such that they agree with quotients derived via _quotient.
+    """
+
+    def get_divisor(allocation: int) -> float:
+        """
+        Derive the divisor of a group given its allocation.
+
+        Parameters
+        ----------
+        allocation : int
+            The number of allocations the group has already received.
+
+        Returns
+        -------
+        float
+            The divisor of the group.
+        """
+        return _divisor(
+            averaging_style=averaging_style, modifier=None, allocation=allocation
+        )
+
+    max_allocation = 1
+    while _quotient(share=max(shares), divisor=get_divisor(max_allocation)) > divisor:
+        max_allocation *= 2
+
+    with np.errstate(divide="ignore"):
+        counts = _least_allocations_with_divisor(
+            averaging_style=averaging_style,
+            modifier=None,
+            quotients=np.asarray(shares, dtype=np.float64) / divisor,
+            low=0,
+            high=max_allocation,
+        ).tolist()
+
+    for i, s in enumerate(shares):
+        while counts[i] > 0 and not (
+            _quotient(share=s, divisor=get_divisor(counts[i] - 1)) > divisor
+        ):
+            counts[i] -= 1
+
+        while _quotient(share=s, divisor=get_divisor(counts[i])) > divisor:
+            counts[i] += 1
+
+    return counts
+
+
+def _highest_averages_breakpoints(
+    averaging_style: str,
+    shares: list[int],
+    total_allocation: int,
+    group: int,
+    min_alloc: int,
+    modifier: float | None,
+    exact: bool,
+) -> list[tuple[int, int]]:
+    """
+    Derive the least shares at which a group receives each of its allocations via highest averages methods.
+
+    Parameters
+    ----------
+    averaging_style : str
+        The name of the highest averages style to use in the calculation.
+
+    shares : list[int]
+        A list of populations or votes for regions or parties.
+
+    total_allocation : int
+        The number of allocations to provide.
+
+    group : int
+        The index of the group whose shares are varied.
+
+    min_alloc : int
+        The number of allocations that each group receives before quotients are compared.
+
+    modifier : float
+        What to replace the divisor of the first quotient by.
+
+    exact : bool
+        Whether quotients are compared exactly rather than as floats.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+        Pairs of a share and the allocation that the group receives from that share.
+    """
+    other_indexes = [i for i in range(len(shares)) if i != group]
+    other_shares = [shares[i] for i in other_indexes]
+    remaining_alloc = total_allocation - min_alloc * len(shares)
+    assert remaining_alloc >= 0, (
+        "The sum of the minimum seats to be allocated cannot be more than the seats to be allocated."
+    )
+
+    # The seats of the other groups in the order that they are awarded.
+    other_allocations = [min_alloc] * len(other_shares)
+    other_seats = []
+    for j, quotient, _ in islice(
+        seat_priority_sequence(
+            averaging_style=averaging_style,
+            shares=other_shares,
+            modifier=modifier,
+            allocations=other_allocations,
+        ),
+        remaining_alloc,
+    ):
+        other_seats.append((j, other_allocations[j], quotient))
+        other_allocations[j] += 1
+
+    breakpoints = [(0, min_alloc)]
+    for k in range(1, remaining_alloc + 1):
+        allocation = min_alloc + k - 1
+        divisor = _divisor(
+            averaging_style=averaging_style, modifier=modifier, allocation=allocation
+        )
+        if k > len(other_seats):
+            # Others have too few seats to be competed with given no shares.
+            least_share = 0
+
+        else:
+            j, other_allocation, quotient = other_seats[remaining_alloc - k]
+            if exact:
+                numerator, denominator = _exact_highest_averages_quotient(
+                    averaging_style=averaging_style,
+                    share=other_shares[j],
+                    allocation=other_allocation,
+                    modifier=modifier,
+                )
+
+            def is_ranked_above(share: int) -> bool:
+                """
+                Check whether the seat of the group is ranked above the competing seat given a share.
+
+                Parameters
+                ----------
+                share : int
+                    The share of the group.
+
+                Returns
+                -------
+                bool
+                    Whether the group is awarded its seat before the competing seat.
+                """
+                if exact:
+                    group_numerator, group_denominator = (
+                        _exact_highest_averages_quotient(
+                            averaging_style=averaging_style,
+                            share=share,
+                            allocation=allocation,
+                            modifier=modifier,
+                        )
+                    )
+                    left = group_numerator * denominator
+                    right = numerator * group_denominator
+
+                else:
+                    left = _quotient(share=share, divisor=divisor)
+                    right = quotient
+
+                if left != right:
+                    return left > right
+
+                return share > other_shares[j] or (
+                    share == other_shares[j] and group < other_indexes[j]
+                )
+
+            least_share = _least_integer(
+                condition=is_ranked_above,
+                estimate=quotient * divisor,
+            )
+
+        if least_share is None:
+            break
+
+        if least_share == breakpoints[-1][0]:
+            breakpoints[-1] = (least_share, allocation + 1)
+
+        else:
+            breakpoints.append((least_share, allocation + 1))
+
+    return breakpoints
+
+
+def _least_integer(condition: Callable[[int], bool], estimate: float) -> int | None:
+    """
+    Find the least non-negative integer for which a monotone condition holds given an estimate of it.
+
+    Parameters
+    ----------
+    condition : Callable[[int], bool]
+        A condition that holds for all integers greater than the least one that it holds for.
+
+    estimate : float
+        An estimate of the least integer.
+
+    Returns
+    -------
+    int | None
+        The least integer for which the condition holds, or None if it does not hold for any.
+    """
+    if condition(0):
+        return 0
+
+    if not np.isfinite(estimate):
+        estimate = 1.0
+
+    high = max(int(ceil(estimate * (1 + 1e-9))) + 1, 1)
+    while not condition(high):
+        if high > 2**256:
+            return None
+
+        high *= 2
+
+    low = max(min(int(estimate * (1 - 1e-9)) - 1, high - 1), 0)
+    while low > 0 and condition(low):
+        low //= 2
+
+    # The condition doesn't hold for low and holds for high.
+    while high - low > 1:
+        middle = (low + high) // 2
+        if condition(middle):
+            high = middle
+
+        else:
+            low = middle
+
+    return high
+
+
+def _largest_remainder_breakpoint_candidates(
+    quota_style: str,
+    shares: list[int],
+    total_allocation: int,
+    group: int,
+    max_share: int,
+) -> np.ndarray:
+    """
+    Derive the shares of a group at which largest remainder allocations can change.
+
+    Parameters
+    ----------
+    quota_style : str
+        The name of the quota style to use in the calculation.
+
+    shares : list[int]
+        A list of populations or votes for regions or parties.
+
+    total_allocation : int
+        The number of allocations to provide.
+
+    group : int
+        The index of the group whose shares are varied.
+
+    max_share : int
+        The largest share of the group to derive candidates for.
+
+    Returns
+    -------
+    np.ndarray
+        The shares of the group where a quotient crosses an integer or two remainders cross.
+    """
+    other_shares = np.asarray(
+        [s for i, s in enumerate(shares) if i != group], dtype=np.float64
+    )
+    other_total = other_shares.sum()
+    if other_total == 0:
+        return np.zeros(0)
+
+    candidates = []
+    if quota_style in ["Hare", "Hagenbach–Bischoff"]:
+        # Quotients are s * c / (v + other_total) for the share v of the group.
+        c = total_allocation if quota_style == "Hare" else total_allocation + 1
+
+        def solve_others(differences: np.ndarray) -> np.ndarray:
+            """
+            Find the shares at which (differences * c / (v + other_total)) is an integer.
+
+            Parameters
+            ----------
+            differences : np.ndarray
+                The shares or differences of shares of other groups.
+
+            Returns
+            -------
+            np.ndarray
+                The shares of the group with integer quotients.
+            """
+            differences = np.abs(differences[differences != 0])
+            solutions = [
+                d * c / np.arange(max(low, 1), high + 1) - other_total
+                for d, low, high in zip(
+                    differences,
+                    np.ceil(differences * c / (max_share + other_total)).astype(int),
+                    np.floor(differences * c / other_total).astype(int),
+                    strict=True,
+                )
+            ]
+
+            return np.concatenate([np.zeros(0), *solutions])
+
+        pairs = other_shares[:, None] - other_shares[None, :]
+        candidates.append(solve_others(other_shares))
+        candidates.append(solve_others(pairs[np.triu_indices(len(other_shares), 1)]))
+
+        # The quotient of the group crosses m, or its remainder crosses that of
+        # another group when their quotients differ by d.
+        m = np.arange(1, c)
+        candidates.append(m * other_total / (c - m))
+        d = np.arange(-c, c)
+        candidates.append(
+            (
+                (d[:, None] * other_total + other_shares[None, :] * c)
+                / (c - d[:, None])
+            ).ravel()
+        )
+
+    elif quota_style == "Droop":
+        # Quotas are q = p + 1 over pieces p of piece_length shares of the total,
+        # with the quotients of all groups being below piece_length.
+        piece_length = total_allocation + 1
+        other_total = int(other_total)
+        integer_shares = other_shares.astype(np.int64)
+
+        # The quotient of another group crosses k when q passes its share over k,
+        # which is at the start of the piece with the next quota.
+        k = np.arange(1, piece_length + 1)
+        candidates.append(
+            (
+                (integer_shares[:, None] // k[None, :]) * piece_length - other_total
+            ).ravel()
+        )
+
+        # The quotient of the group crosses an integer d (s = 0) or that of another
+        # group plus d (s being its share) when v - d * q crosses s. This is
+        # p * (piece_length - d) - other_total - d at the start of piece p, rising
+        # by total_allocation within the piece and by 1 - d at its start, so s can
+        # only be crossed within or at the start of few pieces.
+        s, d = np.meshgrid(
+            np.concatenate([[0], integer_shares]),
+            np.arange(-total_allocation, piece_length),
+            indexing="ij",
+        )
+        s, d = s.ravel(), d.ravel()
+        slope = piece_length - d
+        first_pieces = np.maximum(
+            -(-(s + other_total + d - total_allocation) // slope),
+            other_total // piece_length,
+        )
+        last_pieces = np.minimum(
+            (s + other_total + np.maximum(d, 1)) // slope,
+            (max_share + other_total) // piece_length,
+        )
+        counts = np.maximum(last_pieces - first_pieces + 1, 0)
+        offsets = np.arange(counts.sum()) - np.repeat(counts.cumsum() - counts, counts)
+        pieces = np.repeat(first_pieces, counts) + offsets
+        candidates.append(pieces * piece_length - other_total)
+        candidates.append(np.repeat(s, counts) + np.repeat(d, counts) * (pieces + 1))
+
+    else:
+        raise ValueError(
+            "Invalid quota provided. Choose from Hare, Droop, or Hagenbach–Bischoff."
+        )
+
+    candidates = np.concatenate(candidates)
+
+    return candidates[(candidates >= 0) & (candidates <= max_share)]
@@ -22,8 +22,9 @@
 
 from math import exp, log, sqrt
 
-from scipy.stats import linregress
+import numpy as np
 
+from poli_sci_kit.appointment.results import AllocationResult
 from poli_sci_kit.utils import normalize
 
 
@@ -376,20 +377,117 @@ def effective_number_of_groups(
         )
 
 
+def diversity_profile(
+    shares: np.ndarray | list | None = None,
+    q: np.ndarray | list[float] | None = None,
+    metric_type: str = "Effective",
+) -> np.ndarray:
+    """
+    Calculate the diversity of share distributions over many orders of diversity at once.
+
+    Parameters
+    ----------
+    shares : np.ndarray | list (num_groups,) or (num_distributions, num_groups) (default=None)
+        The proportion of the original shares for the regions or groups, optionally for many distributions.
+
+    q : np.ndarray | list[float] (num_q,) (default=None)
+        The orders of diversity, which can include 1 and positive or negative infinity.
+
+    metric_type : str (default=Effective)
+        The type of formula to use.
+
+        Options:
+            - Effective : the Hill numbers, or effective number of types, of each order (see diversity_index).
+
+            - Renyi : the Renyi entropies of each order, equal to the logarithms of the Hill numbers.
+
+    Returns
+    -------
+    np.ndarray (num_q,) or (num_distributions, num_q)
+        The diversity of each distribution for each order.
+
+    Notes
+    -----
+    Orders of 1 are derived via the Shannon entropy, and orders of positive (negative) infinity via the largest (smallest) share, such as the Berger-Parker index for positive infinity.
+
+    Powers of shares are derived via one broadcast of the logarithms of the shares over all orders, with the largest term factored out of each sum such that large orders don't underflow.
+
+    Groups without shares are excluded, such that they are not counted by orders that are zero or less, and distributions without shares have NaN diversity.
+    """
+    assert shares is not None, "'shares' must be provided."
+    assert q is not None, "The order of diversity 'q' argument must be provided."
+
+    if metric_type not in ["Effective", "Renyi"]:
+        raise ValueError(
+            f"{metric_type} is not a valid value for the 'metric_type' argument. Please choose from 'Effective' or 'Renyi'."
+        )
+
+    share_array = np.asarray(shares, dtype=np.float64)
+    orders = np.asarray(q, dtype=np.float64)
+    assert share_array.ndim in [1, 2], (
+        "'shares' must be of shape (num_groups,) or (num_distributions, num_groups)."
+    )
+    assert orders.ndim == 1, "'q' must be one dimensional."
+
+    norm_shares = normalize(vals=np.atleast_2d(share_array), axis=1, zero_total="nan")
+    present = norm_shares > 0
+    with np.errstate(divide="ignore"):
+        log_shares = np.where(present, np.log(norm_shares), -np.inf)
+
+    # The log of the sum of shares to the power of each order, with the largest
+    # term of each sum factored out.
+    finite_orders = np.where(np.isfinite(orders), orders, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weighted_logs = np.where(
+            present[:, :, np.newaxis],
+            log_shares[:, :, np.newaxis] * finite_orders,
+            -np.inf,
+        )
+        max_weighted_logs = weighted_logs.max(axis=1)
+        log_power_sums = max_weighted_logs + np.log(
+            np.exp(weighted_logs - max_weighted_logs[:, np.newaxis, :]).sum(axis=1)
+        )
+
+        entropies = log_power_sums / (1 - finite_orders)
+        shannon = -np.where(present, norm_shares * log_shares, 0.0).sum(axis=1)
+        entropies = np.where(orders == 1, shannon[:, np.newaxis], entropies)
+        entropies = np.where(
+            orders == np.inf, -np.log(norm_shares.max(axis=1))[:, np.newaxis], entropies
+        )
+        entropies = np.where(
+            orders == -np.inf,
+            -np.log(np.where(present, norm_shares, np.inf).min(axis=1))[:, np.newaxis],
+            entropies,
+        )
+
+    # Distributions with a total of zero have undefined diversity for all orders.
+    entropies[~present.any(axis=1)] = np.nan
+
+    profiles = entropies if metric_type == "Renyi" else np.exp(entropies)
+
+    return profiles if share_array.ndim == 2 else profiles[0]
+
+
 def disproportionality_index(
-    shares: list, allocations: list, metric_type: str = "Gallagher"
+    shares: list | None = None,
+    allocations: list | AllocationResult | None = None,
+    metric_type: str = "Gallagher",
 ) -> float:
     """
     Measure the degree to which the actual allocations deviates from the shares, with larger indexes implying greater disproportionality.
 
     Parameters
     ----------
-    shares : list
+    shares : list (default=None)
         The proportion of the original shares for the regions or groups.
 
-    allocations : list
+        Note: can be None if allocations is an AllocationResult, with the shares of the result being used.
+
+    allocations : list | AllocationResult (default=None)
         The share of allocations given to the regions or groups.
 
+        Note: the proportions of an AllocationResult are used rather than normalizing its shares and allocations again.
+
     metric_type : str (default=Gallagher)
         The type of formula to use.
 
@@ -443,6 +541,12 @@ def disproportionality_index(
     float
         A measure of disproportionality between allocations and original shares.
     """
+    assert allocations is not None, "'allocations' must be provided."
+    result_shares = isinstance(allocations, AllocationResult) and shares is None
+    if result_shares:
+        shares = allocations.shares
+
+    assert shares is not None, "'shares' must be provided."
     assert len(shares) == len(allocations), (
         "The number of different shares must equal the number of different allocations."
     )
@@ -463,8 +567,17 @@ def disproportionality_index(
         + "."
     )
 
-    norm_shares = normalize(vals=shares)
-    norm_allocations = normalize(vals=allocations)
+    if result_shares:
+        norm_shares = allocations.share_proportions.tolist()
+
+    else:
+        norm_shares = normalize(vals=shares)
+
+    if isinstance(allocations, AllocationResult):
+        norm_allocations = allocations.allocation_proportions.tolist()
+
+    else:
+        norm_allocations = normalize(vals=allocations)
 
     if metric_type == "Gallagher":
         index = sqrt(1.0 / 2) * sqrt(
@@ -512,6 +625,531 @@ def disproportionality_index(
         )
 
     elif metric_type == "Cox-Shugart":
-        index = linregress(shares, allocations)[0]
+        # scipy is imported here such that importing metrics doesn't load it.
+        from scipy.stats import linregress
+
+        index = linregress(
+            shares,
+            allocations.allocations
+            if isinstance(allocations, AllocationResult)
+            else allocations,
+        )[0]
 
     return index
+
+
+def disproportionality_report(
+    shares: list | np.ndarray | None = None,
+    allocations: list | np.ndarray | AllocationResult | None = None,
+) -> dict[str, float]:
+    """
+    Measure all disproportionality indexes at once, normalizing shares and allocations a single time.
+
+    Parameters
+    ----------
+    shares : list | np.ndarray (default=None)
+        The proportion of the original shares for the regions or groups.
+
+        Note: can be None if allocations is an AllocationResult, with the shares of the result being used.
+
+    allocations : list | np.ndarray | AllocationResult (default=None)
+        The share of allocations given to the regions or groups.
+
+    Returns
+    -------
+    dict[str, float]
+        The Gallagher, Loosemore–Hanby, Rose, Rae, Sainte-Laguë, d’Hondt and Cox-Shugart indexes (see disproportionality_index).
+
+    Notes
+    -----
+    All indexes are derived from the same arrays of normalized shares and allocations and their differences rather than each index normalizing and iterating over them.
+
+    Groups without shares lead to infinite or undefined Sainte-Laguë and d’Hondt indexes rather than raising a ZeroDivisionError.
+    """
+    assert allocations is not None, "'allocations' must be provided."
+    norm_shares, norm_allocations = None, None
+    if isinstance(allocations, AllocationResult):
+        if shares is None:
+            shares = allocations.shares
+            norm_shares = allocations.share_proportions[np.newaxis]
+
+        norm_allocations = allocations.allocation_proportions[np.newaxis]
+        allocations = allocations.allocations
+
+    assert shares is not None, "'shares' must be provided."
+    share_array = np.asarray(shares, dtype=np.float64)
+    allocation_array = np.asarray(allocations, dtype=np.float64)
+    assert share_array.shape == allocation_array.shape, (
+        "The number of different shares must equal the number of different allocations."
+    )
+
+    indexes = _disproportionality_indexes(
+        shares=share_array[np.newaxis],
+        allocations=allocation_array[np.newaxis],
+        present=np.ones((1, len(share_array)), dtype=bool),
+        norm_shares=norm_shares,
+        norm_allocations=norm_allocations,
+    )
+
+    return {metric_type: float(index[0]) for metric_type, index in indexes.items()}
+
+
+def disproportionality_batch(
+    shares: np.ndarray | list[list] | None = None,
+    allocations: np.ndarray | list[list] | None = None,
+    mask: np.ndarray | list[list[bool]] | None = None,
+) -> dict[str, np.ndarray]:
+    """
+    Measure all disproportionality indexes for many elections at once.
+
+    Parameters
+    ----------
+    shares : np.ndarray | list[list] (num_elections, num_groups; default=None)
+        The original shares for the regions or groups in each election.
+
+    allocations : np.ndarray | list[list] (num_elections, num_groups; default=None)
+        The allocations given to the regions or groups in each election.
+
+    mask : np.ndarray | list[list[bool]] (num_elections, num_groups; default=None)
+        Whether each group is part of each election, such that elections with fewer groups can be padded.
+
+        Note: None includes all groups in all elections.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        The Gallagher, Loosemore–Hanby, Rose, Rae, Sainte-Laguë, d’Hondt and Cox-Shugart indexes (see disproportionality_index) of each election, each of shape (num_elections,).
+
+    Notes
+    -----
+    Groups that are masked out are excluded from the normalization of an election, the number of groups of the Rae index and the least squares of the Cox-Shugart index.
+
+    Cox-Shugart slopes of all elections are derived together via centered sums of products rather than a regression per election.
+    """
+    assert shares is not None, "'shares' must be provided."
+    assert allocations is not None, "'allocations' must be provided."
+
+    share_array = np.asarray(shares, dtype=np.float64)
+    allocation_array = np.asarray(allocations, dtype=np.float64)
+    assert share_array.ndim == 2, (
+        "'shares' must be of shape (num_elections, num_groups)."
+    )
+    assert share_array.shape == allocation_array.shape, (
+        "The number of different shares must equal the number of different allocations."
+    )
+
+    if mask is None:
+        present = np.ones(share_array.shape, dtype=bool)
+
+    else:
+        present = np.asarray(mask, dtype=bool)
+        assert present.shape == share_array.shape, (
+            "'mask' must be of the same shape as 'shares'."
+        )
+
+    return _disproportionality_indexes(
+        shares=np.where(present, share_array, 0.0),
+        allocations=np.where(present, allocation_array, 0.0),
+        present=present,
+    )
+
+
+class DiversityAccumulator:
+    """
+    Maintain diversity measures of shares that are updated over time, such as during an election night.
+
+    Parameters
+    ----------
+    shares : list (default=None)
+        A list of populations or votes for regions or parties.
+
+    Notes
+    -----
+    The total of the shares, the sum of their squares and the sum of each share times its logarithm are kept such that an update of k groups takes O(k).
+
+    Accumulators of different shards of the same groups can be merged, with the shares of the groups being added together.
+    """
+
+    def __init__(self, shares: list[int | float] | None = None) -> None:
+        """
+        Derive the running sums of the initial shares.
+
+        Parameters
+        ----------
+        shares : list (default=None)
+            A list of populations or votes for regions or parties.
+        """
+        assert shares is not None, "'shares' must be provided."
+
+        self._shares = [0] * len(shares)
+        self._total: int | float = 0
+        self._squares: int | float = 0
+        self._entropy_terms = 0.0
+        self.update(deltas=dict(enumerate(shares)))
+
+    @property
+    def shares(self) -> list:
+        """
+        The current shares of the groups.
+
+        Returns
+        -------
+        list
+            A copy of the shares in the order of the groups.
+        """
+        return list(self._shares)
+
+    def update(self, deltas: dict[int, int | float]) -> None:
+        """
+        Change the shares of groups and update the running sums.
+
+        Parameters
+        ----------
+        deltas : dict[int, int | float]
+            The changes to the shares of groups keyed by their indexes.
+
+        Returns
+        -------
+        None
+            The running sums are updated in place.
+        """
+        for i, delta in deltas.items():
+            share = self._shares[i]
+            updated_share = share + delta
+            assert updated_share >= 0, "'shares' cannot be negative."
+
+            self._total += delta
+            self._squares += updated_share**2 - share**2
+            self._entropy_terms += _entropy_term(share=updated_share) - _entropy_term(
+                share=share
+            )
+            self._shares[i] = updated_share
+
+    def merge(self, other: "DiversityAccumulator") -> "DiversityAccumulator":
+        """
+        Add the shares of another accumulator of the same groups to this one.
+
+        Parameters
+        ----------
+        other : DiversityAccumulator
+            The accumulator of another shard of the shares.
+
+        Returns
+        -------
+        DiversityAccumulator
+            This accumulator with the shares of both.
+        """
+        assert len(other._shares) == len(self._shares), (
+            "Only accumulators of the same groups can be merged."
+        )
+        self.update(deltas={i: s for i, s in enumerate(other._shares) if s})
+
+        return self
+
+    def diversity_index(self, metric_type: str = "Shannon") -> float:
+        """
+        Calculate the diversity index of the current shares.
+
+        Parameters
+        ----------
+        metric_type : str (default=Shannon)
+            The type of formula to use.
+
+            Options: Shannon, Simpson, Gini-Simpson (see diversity_index).
+
+        Returns
+        -------
+        float
+            The measure of diversity given the current shares.
+        """
+        if metric_type == "Shannon":
+            return log(self._total) - self._entropy_terms / self._total
+
+        elif metric_type == "Simpson":
+            return 1.0 * self._squares / self._total**2
+
+        elif metric_type == "Gini-Simpson":
+            return 1 - 1.0 * self._squares / self._total**2
+
+        raise ValueError(
+            f"{metric_type} is not a valid value for the 'metric_type' argument. Please choose from 'Shannon', 'Simpson' or 'Gini-Simpson'."
+        )
+
+    def effective_number_of_groups(self) -> float:
+        """
+        Calculate the Laakso-Taagepera effective number of groups given the current shares.
+
+        Returns
+        -------
+        float
+            The effective number of groups.
+        """
+        return 1.0 * self._total**2 / self._squares
+
+
+class DisproportionalityAccumulator:
+    """
+    Maintain disproportionality measures of shares and allocations that are updated over time, such as during an election night.
+
+    Parameters
+    ----------
+    shares : list (default=None)
+        A list of populations or votes for regions or parties.
+
+    allocations : list (default=None)
+        The allocations given to the regions or parties.
+
+    Notes
+    -----
+    The totals and sums of squares of shares and allocations (see DiversityAccumulator) and the sum of their products are kept such that an update of k groups takes O(k), with the Gallagher index being derived from these sums in O(1).
+
+    The absolute differences of the Loosemore–Hanby index change for all groups when totals change, and so the Loosemore–Hanby and Rose indexes are derived from the current shares and allocations in one vectorized pass when requested.
+
+    Integer shares and allocations are summed exactly, whereas running sums of floats can accumulate rounding errors over many updates.
+    """
+
+    def __init__(
+        self,
+        shares: list[int | float] | None = None,
+        allocations: list[int] | None = None,
+    ) -> None:
+        """
+        Derive the running sums of the initial shares and allocations.
+
+        Parameters
+        ----------
+        shares : list (default=None)
+            A list of populations or votes for regions or parties.
+
+        allocations : list (default=None)
+            The allocations given to the regions or parties.
+        """
+        assert shares is not None, "'shares' must be provided."
+        assert allocations is not None, "'allocations' must be provided."
+        assert len(shares) == len(allocations), (
+            "The number of different shares must equal the number of different allocations."
+        )
+
+        self.share_diversity = DiversityAccumulator(shares=shares)
+        self.allocation_diversity = DiversityAccumulator(shares=allocations)
+        self._products = sum(s * a for s, a in zip(shares, allocations, strict=True))
+
+    @property
+    def shares(self) -> list:
+        """
+        The current shares of the groups.
+
+        Returns
+        -------
+        list
+            A copy of the shares in the order of the groups.
+        """
+        return self.share_diversity.shares
+
+    @property
+    def allocations(self) -> list:
+        """
+        The current allocations of the groups.
+
+        Returns
+        -------
+        list
+            A copy of the allocations in the order of the groups.
+        """
+        return self.allocation_diversity.shares
+
+    def update(
+        self,
+        share_deltas: dict[int, int | float] | None = None,
+        allocation_deltas: dict[int, int] | None = None,
+    ) -> None:
+        """
+        Change the shares and allocations of groups and update the running sums.
+
+        Parameters
+        ----------
+        share_deltas : dict[int, int | float] (default=None)
+            The changes to the shares of groups keyed by their indexes.
+
+        allocation_deltas : dict[int, int] (default=None)
+            The changes to the allocations of groups keyed by their indexes.
+
+        Returns
+        -------
+        None
+            The running sums are updated in place.
+        """
+        share_deltas = share_deltas or {}
+        allocation_deltas = allocation_deltas or {}
+        shares = self.share_diversity._shares
+        allocations = self.allocation_diversity._shares
+
+        changed = share_deltas.keys() | allocation_deltas.keys()
+        self._products -= sum(shares[i] * allocations[i] for i in changed)
+        self.share_diversity.update(deltas=share_deltas)
+        self.allocation_diversity.update(deltas=allocation_deltas)
+        self._products += sum(shares[i] * allocations[i] for i in changed)
+
+    def merge(
+        self, other: "DisproportionalityAccumulator"
+    ) -> "DisproportionalityAccumulator":
+        """
+        Add the shares and allocations of another accumulator of the same groups to this one.
+
+        Parameters
+        ----------
+        other : DisproportionalityAccumulator
+            The accumulator of another shard of the shares and allocations.
+
+        Returns
+        -------
+        DisproportionalityAccumulator
+            This accumulator with the shares and allocations of both.
+        """
+        assert len(other.shares) == len(self.shares), (
+            "Only accumulators of the same groups can be merged."
+        )
+        self.update(
+            share_deltas={i: s for i, s in enumerate(other.shares) if s},
+            allocation_deltas={i: a for i, a in enumerate(other.allocations) if a},
+        )
+
+        return self
+
+    def disproportionality_index(self, metric_type: str = "Gallagher") -> float:
+        """
+        Measure the disproportionality of the current shares and allocations.
+
+        Parameters
+        ----------
+        metric_type : str (default=Gallagher)
+            The type of formula to use.
+
+            Options: Gallagher, Loosemore–Hanby, Rose (see disproportionality_index).
+
+        Returns
+        -------
+        float
+            A measure of disproportionality between the current allocations and shares.
+        """
+        share_total = self.share_diversity._total
+        allocation_total = self.allocation_diversity._total
+
+        if metric_type == "Gallagher":
+            # The sum of squared differences of proportions over a common denominator.
+            squared_differences = (
+                self.share_diversity._squares * allocation_total**2
+                - 2 * self._products * share_total * allocation_total
+                + self.allocation_diversity._squares * share_total**2
+            ) / (share_total * allocation_total) ** 2
+
+            return sqrt(1.0 / 2) * sqrt(max(squared_differences, 0))
+
+        elif metric_type in ["Loosemore–Hanby", "Rose"]:
+            loosemore_hanby = (
+                1.0
+                / 2
+                * np.abs(
+                    np.asarray(self.share_diversity._shares, dtype=np.float64)
+                    / share_total
+                    - np.asarray(self.allocation_diversity._shares, dtype=np.float64)
+                    / allocation_total
+                ).sum()
+            )
+
+            return float(
+                loosemore_hanby
+                if metric_type == "Loosemore–Hanby"
+                else 100 - loosemore_hanby
+            )
+
+        raise ValueError(
+            f"{metric_type} is not a valid value for the 'metric_type' argument. Please choose from 'Gallagher', 'Loosemore–Hanby' or 'Rose'."
+        )
+
+
+def _entropy_term(share: int | float) -> float:
+    """
+    Derive the term of a share in the Shannon entropy of unnormalized shares.
+
+    Parameters
+    ----------
+    share : int | float
+        The population or votes of the group.
+
+    Returns
+    -------
+    float
+        The share times its logarithm, with shares of zero having a term of zero.
+    """
+    return share * log(share) if share else 0.0
+
+
+def _disproportionality_indexes(
+    shares: np.ndarray,
+    allocations: np.ndarray,
+    present: np.ndarray,
+    norm_shares: np.ndarray | None = None,
+    norm_allocations: np.ndarray | None = None,
+) -> dict[str, np.ndarray]:
+    """
+    Derive all disproportionality indexes of the rows of share and allocation arrays.
+
+    Parameters
+    ----------
+    shares : np.ndarray (num_elections, num_groups)
+        The original shares, with zeros for groups that are not present.
+
+    allocations : np.ndarray (num_elections, num_groups)
+        The allocations, with zeros for groups that are not present.
+
+    present : np.ndarray (num_elections, num_groups)
+        Whether each group is part of each election.
+
+    norm_shares : np.ndarray (num_elections, num_groups; default=None)
+        Shares that have already been normalized, with None normalizing them.
+
+    norm_allocations : np.ndarray (num_elections, num_groups; default=None)
+        Allocations that have already been normalized, with None normalizing them.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        The indexes of each election keyed by their metric_type.
+    """
+    if norm_shares is None:
+        norm_shares = normalize(vals=shares, axis=1, zero_total="nan")
+
+    if norm_allocations is None:
+        norm_allocations = normalize(vals=allocations, axis=1, zero_total="nan")
+
+    num_groups = present.sum(axis=1)
+    differences = norm_shares - norm_allocations
+    absolute_differences = np.abs(differences).sum(axis=1)
+    loosemore_hanby = 1.0 / 2 * absolute_differences
+
+    # The Cox-Shugart index is the least squares slope of the original allocations over shares.
+    centered_shares = np.where(
+        present, shares - shares.sum(axis=1, keepdims=True) / num_groups[:, None], 0.0
+    )
+    centered_allocations = np.where(
+        present,
+        allocations - allocations.sum(axis=1, keepdims=True) / num_groups[:, None],
+        0.0,
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sainte_lague = np.where(present, differences**2 / norm_shares, 0.0).sum(axis=1)
+        dhondt = np.where(present, norm_allocations / norm_shares, -np.inf).max(axis=1)
+        cox_shugart = (centered_shares * centered_allocations).sum(axis=1) / (
+            centered_shares**2
+        ).sum(axis=1)
+
+    return {
+        "Gallagher": sqrt(1.0 / 2) * np.sqrt((differences**2).sum(axis=1)),
+        "Loosemore–Hanby": loosemore_hanby,
+        "Rose": 100 - loosemore_hanby,
+        "Rae": 1.0 / num_groups * absolute_differences,
+        "Sainte-Laguë": sainte_lague,
+        "d’Hondt": dhondt,
+        "Cox-Shugart": cox_shugart,
+    }
@@ -0,0 +1,261 @@
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Functions to project allocations from streams of results.
+
+Contents:
+    apportion_stream
+"""
+
+import asyncio
+from collections.abc import AsyncIterable, Awaitable, Callable, Hashable, Mapping
+from concurrent.futures import Executor
+from time import monotonic
+
+from poli_sci_kit.appointment.methods import highest_averages, largest_remainder
+from poli_sci_kit.appointment.metrics import disproportionality_index
+
+# Marks the end of the records in the queue between the reader and the batches.
+_END_OF_RECORDS = object()
+
+
+async def apportion_stream(
+    records: AsyncIterable[tuple[Hashable, Hashable, int | float]] | None = None,
+    callback: Callable[[dict], Awaitable[None]] | None = None,
+    total_allocations: Mapping | int | None = None,
+    method: str = "highest_averages",
+    style: str | None = None,
+    allocation_threshold: float | None = None,
+    modifier: float | None = None,
+    metric_type: str = "Gallagher",
+    batch_interval: float = 0.1,
+    max_batch_size: int = 10000,
+    executor: Executor | None = None,
+) -> dict:
+    """
+    Project the allocations of each region from a stream of (region, party, delta) records.
+
+    Parameters
+    ----------
+    records : AsyncIterable[tuple[Hashable, Hashable, int | float]] (default=None)
+        The changes to the votes of parties in regions, such as results consumed from a message queue.
+
+    callback : Callable[[dict], Awaitable[None]] (default=None)
+        An async function that is awaited with the projections after each batch of records.
+
+    total_allocations : Mapping | int (default=None)
+        The number of allocations to provide in each region, either as a mapping from regions or for all regions.
+
+    method : str (default=highest_averages)
+        The apportionment method to use in each region.
+
+        Options: highest_averages, largest_remainder.
+
+    style : str (default=None)
+        The averaging_style or quota_style of the method, with None using the default of the method.
+
+    allocation_threshold : float (default=None)
+        A minimum percentage of the votes of a region that must be met to receive an allocation.
+
+    modifier : float (default=None)
+        What to replace the divisor of the first quotient by for highest averages methods.
+
+    metric_type : str (default=Gallagher)
+        The disproportionality_index that is derived for each region.
+
+    batch_interval : float (default=0.1)
+        The number of seconds after the first record of a batch that further records are coalesced into it.
+
+    max_batch_size : int (default=10000)
+        The maximum number of records in a batch.
+
+    executor : Executor (default=None)
+        The executor that allocations and indexes are derived in, with None using the default executor of the event loop.
+
+    Returns
+    -------
+    dict
+        The latest projections of all regions once all records have been consumed.
+
+    Notes
+    -----
+    Projections passed to the callback have the keys batch (the number of the batch), records (the number of records consumed so far) and regions, with only regions that changed in the batch being included.
+
+    Each region has the keys parties, shares, allocations and disproportionality, with parties in the order that they first appeared. Regions without positive total votes are not projected.
+
+    Records that arrive while a batch is being projected are coalesced into the next batch.
+    """
+    assert records is not None, "'records' must be provided."
+    assert callback is not None, "'callback' must be provided."
+    assert total_allocations is not None, "'total_allocations' must be provided."
+
+    if method not in ["highest_averages", "largest_remainder"]:
+        raise ValueError(
+            f"'{method}' is not a supported method. Please choose from 'highest_averages' or 'largest_remainder'."
+        )
+
+    method_kwargs: dict = {"allocation_threshold": allocation_threshold}
+    if method == "highest_averages":
+        method_kwargs["modifier"] = modifier
+
+    if style is not None:
+        method_kwargs[
+            "averaging_style" if method == "highest_averages" else "quota_style"
+        ] = style
+
+    queue: asyncio.Queue = asyncio.Queue()
+    reader = asyncio.create_task(_read_records(records=records, queue=queue))
+
+    loop = asyncio.get_running_loop()
+    totals: dict[Hashable, dict[Hashable, int | float]] = {}
+    projections: dict = {}
+    num_batches = 0
+    num_records = 0
+    finished = False
+    try:
+        while not finished:
+            record = await queue.get()
+            if record is _END_OF_RECORDS:
+                break
+
+            batch = [record]
+            deadline = monotonic() + batch_interval
+            while len(batch) < max_batch_size:
+                if queue.empty():
+                    timeout = deadline - monotonic()
+                    if timeout <= 0:
+                        break
+
+                    try:
+                        record = await asyncio.wait_for(queue.get(), timeout=timeout)
+
+                    except TimeoutError:
+                        break
+
+                else:
+                    record = queue.get_nowait()
+
+                if record is _END_OF_RECORDS:
+                    finished = True
+                    break
+
+                batch.append(record)
+
+            changed_regions = set()
+            for region, party, delta in batch:
+                region_totals = totals.setdefault(region, {})
+                region_totals[party] = region_totals.get(party, 0) + delta
+                changed_regions.add(region)
+
+            snapshots = {
+                region: (
+                    list(totals[region]),
+                    list(totals[region].values()),
+                    total_allocations[region]
+                    if isinstance(total_allocations, Mapping)
+                    else total_allocations,
+                )
+                for region in changed_regions
+            }
+            region_projections = await loop.run_in_executor(
+                executor,
+                _project_regions,
+                method,
+                method_kwargs,
+                metric_type,
+                snapshots,
+            )
+
+            num_batches += 1
+            num_records += len(batch)
+            projections.update(region_projections)
+            await callback(
+                {
+                    "batch": num_batches,
+                    "records": num_records,
+                    "regions": region_projections,
+                }
+            )
+
+    except BaseException:
+        reader.cancel()
+        raise
+
+    # Raise errors of the reader such as those from the records.
+    await reader
+
+    return projections
+
+
+async def _read_records(records: AsyncIterable, queue: asyncio.Queue) -> None:
+    """
+    Move records from an async iterable into a queue, followed by a marker of their end.
+
+    Parameters
+    ----------
+    records : AsyncIterable
+        The records to read.
+
+    queue : asyncio.Queue
+        The queue that the records are put in.
+
+    Returns
+    -------
+    None
+        The records are put in the queue.
+    """
+    try:
+        async for record in records:
+            queue.put_nowait(record)
+
+    finally:
+        queue.put_nowait(_END_OF_RECORDS)
+
+
+def _project_regions(
+    method: str, method_kwargs: dict, metric_type: str, snapshots: dict
+) -> dict:
+    """
+    Derive the allocations and disproportionality of regions given their votes.
+
+    Parameters
+    ----------
+    method : str
+        The apportionment method to use in each region.
+
+    method_kwargs : dict
+        The arguments passed to the method other than shares and total_allocation.
+
+    metric_type : str
+        The disproportionality_index that is derived for each region.
+
+    snapshots : dict
+        The parties, votes and total allocations of each region.
+
+    Returns
+    -------
+    dict
+        The parties, shares, allocations and disproportionality of each region.
+    """
+    apportion = highest_averages if method == "highest_averages" else largest_remainder
+
+    region_projections = {}
+    for region, (parties, shares, total_allocation) in snapshots.items():
+        if sum(shares) <= 0:
+            continue
+
+        result = apportion(
+            shares=shares,
+            total_allocation=total_allocation,
+            return_result=True,
+            **method_kwargs,
+        )
+        region_projections[region] = {
+            "parties": parties,
+            "shares": shares,
+            "allocations": result.tolist(),
+            "disproportionality": disproportionality_index(
+                allocations=result, metric_type=metric_type
+            ),
+        }
+
+    return region_projections
@@ -0,0 +1,236 @@
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Classes to hold the results of appointment methods.
+
+Contents:
+    AllocationResult
+"""
+
+from collections.abc import Iterator, Sequence
+
+import numpy as np
+
+
+class AllocationResult:
+    """
+    The allocations of an appointment method along with the intermediate state that derived them.
+
+    Parameters
+    ----------
+    shares : list | np.ndarray
+        The populations or votes for regions or parties that were provided, including those that did not pass an allocation threshold.
+
+    allocations : list[int] | np.ndarray
+        The allocations in the order of the provided shares.
+
+    method : str (default=None)
+        The appointment method that derived the allocations.
+
+    style : str (default=None)
+        The quota_style or averaging_style of the method.
+
+    quota : float (default=None)
+        The number of shares represented by each allocation for largest remainder methods.
+
+    remainders : list[float] | np.ndarray (default=None)
+        The fractional parts of the shares of each group over the quota that allocations beyond whole quotas were ranked by.
+
+    quotients : list[float] | np.ndarray (default=None)
+        The quotients of each group for the next allocation given the final allocations of highest averages methods.
+
+    tied : list[int] | np.ndarray (default=None)
+        The indexes of the groups that were tied for the last allocation(s) and required a tie break.
+
+    Notes
+    -----
+    Results behave as a sequence of the allocations, such that they can be used wherever the list returned by appointment methods is.
+
+    Shares and allocations are normalized once when the result is created, with the proportions being used by metrics and checks in place of normalizing them again.
+    """
+
+    __slots__ = (
+        "shares",
+        "allocations",
+        "method",
+        "style",
+        "quota",
+        "remainders",
+        "quotients",
+        "tied",
+        "share_proportions",
+        "allocation_proportions",
+    )
+
+    def __init__(
+        self,
+        shares: list | np.ndarray,
+        allocations: list[int] | np.ndarray,
+        method: str | None = None,
+        style: str | None = None,
+        quota: float | None = None,
+        remainders: list[float] | np.ndarray | None = None,
+        quotients: list[float] | np.ndarray | None = None,
+        tied: list[int] | np.ndarray | None = None,
+    ) -> None:
+        """
+        Normalize the shares and allocations and store the state that derived them.
+
+        Parameters
+        ----------
+        shares : list | np.ndarray
+            The populations or votes for regions or parties that were provided.
+
+        allocations : list[int] | np.ndarray
+            The allocations in the order of the provided shares.
+
+        method : str (default=None)
+            The appointment method that derived the allocations.
+
+        style : str (default=None)
+            The quota_style or averaging_style of the method.
+
+        quota : float (default=None)
+            The number of shares represented by each allocation for largest remainder methods.
+
+        remainders : list[float] | np.ndarray (default=None)
+            The fractional parts of the shares of each group over the quota.
+
+        quotients : list[float] | np.ndarray (default=None)
+            The quotients of each group for the next allocation.
+
+        tied : list[int] | np.ndarray (default=None)
+            The indexes of the groups that were tied for the last allocation(s).
+        """
+        self.shares = np.asarray(shares, dtype=np.float64)
+        self.allocations = np.asarray(allocations, dtype=np.int64)
+        assert self.shares.shape == self.allocations.shape, (
+            "The number of different shares must equal the number of different allocations."
+        )
+
+        self.method = method
+        self.style = style
+        self.quota = quota
+        self.remainders = (
+            None if remainders is None else np.asarray(remainders, dtype=np.float64)
+        )
+        self.quotients = (
+            None if quotients is None else np.asarray(quotients, dtype=np.float64)
+        )
+        self.tied = np.asarray([] if tied is None else sorted(tied), dtype=np.int64)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.share_proportions = self.shares / self.shares.sum()
+            self.allocation_proportions = self.allocations / self.allocations.sum()
+
+    @property
+    def total_allocation(self) -> int:
+        """
+        The number of allocations that were provided.
+
+        Returns
+        -------
+        int
+            The sum of the allocations.
+        """
+        return int(self.allocations.sum())
+
+    @property
+    def ideal_shares(self) -> np.ndarray:
+        """
+        The allocations each group would receive given exact proportionality.
+
+        Returns
+        -------
+        np.ndarray
+            The share proportions of the groups times the total allocation.
+        """
+        return self.share_proportions * self.total_allocation
+
+    def tolist(self) -> list[int]:
+        """
+        Return the allocations as a list.
+
+        Returns
+        -------
+        list[int]
+            The allocations in the order of the provided shares.
+        """
+        return self.allocations.tolist()
+
+    def __len__(self) -> int:
+        """
+        Return the number of groups.
+
+        Returns
+        -------
+        int
+            The number of allocations.
+        """
+        return len(self.allocations)
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        Iterate over the allocations.
+
+        Returns
+        -------
+        Iterator[int]
+            The allocations in the order of the provided shares.
+        """
+        return iter(self.allocations.tolist())
+
+    def __getitem__(self, index: int | slice) -> int | list[int]:
+        """
+        Return the allocations at an index or slice.
+
+        Parameters
+        ----------
+        index : int | slice
+            The index or slice of the groups.
+
+        Returns
+        -------
+        int | list[int]
+            The allocation of the group, or a list of allocations for a slice.
+        """
+        if isinstance(index, slice):
+            return self.allocations[index].tolist()
+
+        return int(self.allocations[index])
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare the result to another result or to a sequence of allocations.
+
+        Parameters
+        ----------
+        other : object
+            An AllocationResult, or a sequence or array of allocations.
+
+        Returns
+        -------
+        bool
+            Whether the shares and allocations of results or the allocations of a sequence are equal.
+        """
+        if isinstance(other, AllocationResult):
+            return np.array_equal(self.shares, other.shares) and np.array_equal(
+                self.allocations, other.allocations
+            )
+
+        if isinstance(other, Sequence | np.ndarray):
+            return self.tolist() == list(other)
+
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        """
+        Represent the result by its method, style and allocations.
+
+        Returns
+        -------
+        str
+            The representation of the result.
+        """
+        return f"AllocationResult(method={self.method!r}, style={self.style!r}, allocations={self.tolist()})"
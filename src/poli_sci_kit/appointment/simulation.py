@@ -0,0 +1,160 @@
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Functions to project seat distributions given uncertainty in shares.
+
+Contents:
+    simulate_allocations
+"""
+
+import numpy as np
+
+from poli_sci_kit.appointment.methods import (
+    highest_averages_batch,
+    largest_remainder_batch,
+)
+
+
+def simulate_allocations(
+    method: str = "highest_averages",
+    style: str | None = None,
+    shares: list[float] | np.ndarray | None = None,
+    total_allocation: int | None = None,
+    num_draws: int = 10000,
+    distribution: str = "dirichlet",
+    sample_size: int = 1000,
+    allocation_threshold: float | None = None,
+    min_alloc: int | None = None,
+    modifier: float | None = None,
+    chunk_size: int = 100000,
+    rng: np.random.Generator | int | None = None,
+) -> dict[str, np.ndarray]:
+    """
+    Simulate allocations given shares that are drawn around polled or expected shares.
+
+    Parameters
+    ----------
+    method : str (default=highest_averages)
+        The apportionment method to use for each draw.
+
+        Options: highest_averages, largest_remainder.
+
+    style : str (default=None)
+        The averaging_style or quota_style of the method, with None using the default of the method.
+
+    shares : list[float] | np.ndarray (default=None)
+        The polled or expected shares or votes of regions or parties.
+
+    total_allocation : int (default=None)
+        The number of allocations to provide.
+
+    num_draws : int (default=10000)
+        The number of share vectors to draw.
+
+    distribution : str (default=dirichlet)
+        The distribution that shares are drawn from.
+
+        Options:
+            - dirichlet : shares are drawn with concentrations of the normalized shares times sample_size.
+
+            - multinomial : votes are drawn from sample_size respondents with probabilities of the normalized shares.
+
+    sample_size : int (default=1000)
+        The number of respondents that the shares are based on, with larger samples leading to less uncertainty.
+
+    allocation_threshold : float (default=None)
+        A minimum percentage of the population or votes that must be met to receive an allocation.
+
+    min_alloc : int (default=None)
+        A minimum number of allocations that each group must receive.
+
+    modifier : float (default=None)
+        What to replace the divisor of the first quotient by for highest averages methods.
+
+    chunk_size : int (default=100000)
+        The number of draws that are apportioned at once, bounding memory use for large numbers of draws.
+
+    rng : np.random.Generator | int (default=None)
+        The generator or seed used for draws and random tie breaks.
+
+    Returns
+    -------
+    dict[str, np.ndarray]
+        The following simulation results:
+
+        - histograms : (num_groups, total_allocation + 1) the number of draws in which each group received each number of allocations.
+
+        - majority_probabilities : (num_groups,) the proportion of draws in which each group received more than half of the allocations.
+
+        - mean_allocations : (num_groups,) the mean allocations of each group.
+    """
+    assert shares is not None, "'shares' must be provided."
+    assert total_allocation is not None, "'total_allocation' must be provided."
+    assert num_draws > 0 and chunk_size > 0, (
+        "'num_draws' and 'chunk_size' must be positive."
+    )
+
+    if method not in ["highest_averages", "largest_remainder"]:
+        raise ValueError(
+            f"'{method}' is not a supported method. Please choose from 'highest_averages' or 'largest_remainder'."
+        )
+
+    if distribution not in ["dirichlet", "multinomial"]:
+        raise ValueError(
+            f"'{distribution}' is not a supported distribution. Please choose from 'dirichlet' or 'multinomial'."
+        )
+
+    probabilities = np.asarray(shares, dtype=np.float64)
+    probabilities = probabilities / probabilities.sum()
+    num_groups = len(probabilities)
+    rng = np.random.default_rng(rng)
+
+    method_kwargs = {
+        "total_allocation": total_allocation,
+        "allocation_threshold": allocation_threshold,
+        "min_alloc": min_alloc,
+        "rng": rng,
+    }
+    if method == "highest_averages":
+        apportion = highest_averages_batch
+        method_kwargs["modifier"] = modifier
+        if style is not None:
+            method_kwargs["averaging_style"] = style
+
+    else:
+        apportion = largest_remainder_batch
+        if style is not None:
+            method_kwargs["quota_style"] = style
+
+    # Histograms of all groups are derived via one bincount by offsetting each group.
+    histogram_offsets = np.arange(num_groups) * (total_allocation + 1)
+    histograms = np.zeros(num_groups * (total_allocation + 1), dtype=np.int64)
+    majority_counts = np.zeros(num_groups, dtype=np.int64)
+    allocation_sums = np.zeros(num_groups, dtype=np.int64)
+    for start in range(0, num_draws, chunk_size):
+        num_chunk_draws = min(chunk_size, num_draws - start)
+        if distribution == "dirichlet":
+            # Groups without shares are kept at zero as the Dirichlet requires positive concentrations.
+            drawn_shares = np.zeros((num_chunk_draws, num_groups))
+            has_share = probabilities > 0
+            drawn_shares[:, has_share] = rng.dirichlet(
+                probabilities[has_share] * sample_size, size=num_chunk_draws
+            )
+
+        else:
+            drawn_shares = rng.multinomial(
+                sample_size, probabilities, size=num_chunk_draws
+            )
+
+        allocations = apportion(shares=drawn_shares, **method_kwargs)
+
+        histograms += np.bincount(
+            (allocations + histogram_offsets).ravel(), minlength=len(histograms)
+        )
+        majority_counts += (2 * allocations > total_allocation).sum(axis=0)
+        allocation_sums += allocations.sum(axis=0)
+
+    return {
+        "histograms": histograms.reshape(num_groups, total_allocation + 1),
+        "majority_probabilities": majority_counts / num_draws,
+        "mean_allocations": allocation_sums / num_draws,
+    }
@@ -1,3 +1,5 @@
+# Plotting functions are imported eagerly as their modules share their names, with
+# the plot subpackage itself only being imported on first access from poli_sci_kit.
 from poli_sci_kit.plot.disproportionality_bar_plot import disproportionality_bar_plot
 from poli_sci_kit.plot.parliament_plot import parliament_plot
 
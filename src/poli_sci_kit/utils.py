@@ -3,26 +3,54 @@
 Utility functions for general operations and plotting.
 """
 
+from __future__ import annotations
+
 import colorsys
+from typing import TYPE_CHECKING
 
 import numpy as np
-import pandas as pd
-from colormath.color_objects import sRGBColor
+
+# pandas and colormath are imported where they're used such that normalize can be
+# imported by metrics without loading them.
+if TYPE_CHECKING:
+    import pandas as pd
+    from colormath.color_objects import sRGBColor
 
 
-def normalize(vals: list) -> list:
+def normalize(
+    vals: list | np.ndarray,
+    axis: int = -1,
+    out: np.ndarray | None = None,
+    zero_total: str = "raise",
+) -> list | np.ndarray:
     """
     Return respective normalized values.
 
     Parameters
     ----------
-    vals : list
-        The values to normalize.
+    vals : list | np.ndarray
+        The values to normalize, optionally as a 2D batch of rows of values.
+
+    axis : int (default=-1)
+        The axis along which values are normalized.
+
+    out : np.ndarray (default=None)
+        An array of floats of the shape of vals that the normalized values are written to rather than allocating a new array.
+
+    zero_total : str (default=raise)
+        How values with a total of zero are normalized.
+
+        Options:
+            - raise : a ZeroDivisionError is raised.
+
+            - zero : the normalized values are zero.
+
+            - nan : the normalized values are NaN.
 
     Returns
     -------
-    list
-        The original values normalized.
+    list | np.ndarray
+        The original values normalized, as a list if vals is a list or tuple and out isn't provided.
 
     Notes
     -----
@@ -31,7 +59,37 @@ def normalize(vals: list) -> list:
         .. math::
         1.0 * v / sum(vals) for v in vals
     """
-    return [1.0 * v / sum(vals) for v in vals]
+    if zero_total not in ["raise", "zero", "nan"]:
+        raise ValueError(
+            f"{zero_total} is not a valid value for the 'zero_total' argument. Please choose from 'raise', 'zero' or 'nan'."
+        )
+
+    val_array = np.asarray(vals, dtype=np.float64)
+    totals = val_array.sum(axis=axis, keepdims=True)
+    # Empty values have no totals to divide by, and so are returned empty.
+    is_zero_total = (totals == 0) & (val_array.size > 0)
+    has_zero_total = bool(is_zero_total.any())
+    if has_zero_total and zero_total == "raise":
+        raise ZeroDivisionError("Values with a total of zero cannot be normalized.")
+
+    return_list = isinstance(vals, list | tuple) and out is None
+    if out is None:
+        out = np.empty_like(val_array)
+
+    assert out.shape == val_array.shape, "'out' must be of the same shape as 'vals'."
+
+    np.divide(val_array, totals, out=out, where=~is_zero_total)
+    if has_zero_total:
+        np.copyto(
+            out,
+            0.0 if zero_total == "zero" else np.nan,
+            where=np.broadcast_to(is_zero_total, out.shape),
+        )
+
+    if return_list:
+        return out.tolist()
+
+    return out
 
 
 def gen_list_of_lists(original_list: list, new_structure: list[int]) -> list[list]:
@@ -154,6 +212,8 @@ def gen_parliament_plot_points(
             largest_group_index = labels.index(speaker)
             allocations[largest_group_index] -= 1
 
+    import pandas as pd
+
     # Make an empty dataframe and fill it with coordinates for the structure.
     # Then assign group values for allocation based on the rows.
     df_seat_lctns = pd.DataFrame(
@@ -493,6 +553,8 @@ def hex_to_rgb(hex_rep: str) -> sRGBColor:
     sRGBColor
         An RGB tuple color representation.
     """
+    from colormath.color_objects import sRGBColor
+
     return sRGBColor(
         *[int(hex_rep[i + 1 : i + 3], 16) for i in (0, 2, 4)], is_upscaled=True
     )
@@ -550,7 +612,8 @@ def scale_saturation(rgb_triple: str | sRGBColor, sat: float) -> str | tuple:
     if (isinstance(rgb_triple, str)) and (len(rgb_triple) == 7):
         rgb_triple = hex_to_rgb(rgb_triple)
 
-    if isinstance(rgb_triple, sRGBColor):
+    if hasattr(rgb_triple, "get_value_tuple"):
+        # An sRGBColor, checked for by attribute as colormath is imported lazily.
         rgb_triple = rgb_triple.get_value_tuple()
 
     hue, lightness, saturation = colorsys.rgb_to_hls(*rgb_triple)  # ty: ignore[invalid-argument-type]
@@ -0,0 +1,63 @@
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Apportioner tests.
+"""
+
+import pytest
+
+from poli_sci_kit.appointment.methods import (
+    Apportioner,
+    highest_averages,
+    largest_remainder,
+)
+
+
+def test_apportioner_highest_averages(highest_averages_styles, short_votes_list):
+    apportioner = Apportioner(
+        method="highest_averages",
+        style=highest_averages_styles,
+        shares=short_votes_list,
+        total_allocation=50,
+    )
+    for deltas in [{0: -900000}, {4: 1500000, 1: 1000}, {0: 2000000, 3: -500000}]:
+        assert apportioner.update(deltas) == highest_averages(
+            averaging_style=highest_averages_styles,
+            shares=apportioner.shares,
+            total_allocation=50,
+        )
+
+
+def test_apportioner_threshold(short_votes_list):
+    apportioner = Apportioner(
+        style="Webster",
+        shares=short_votes_list,
+        total_allocation=30,
+        allocation_threshold=0.12,
+    )
+    assert apportioner.allocations[-1] == 0
+
+    assert apportioner.update({4: 200000}) == highest_averages(
+        averaging_style="Webster",
+        shares=apportioner.shares,
+        total_allocation=30,
+        allocation_threshold=0.12,
+    )
+    assert apportioner.allocations[-1] > 0
+
+
+def test_apportioner_largest_remainder(short_votes_list):
+    apportioner = Apportioner(
+        method="largest_remainder",
+        style="Droop",
+        shares=short_votes_list,
+        total_allocation=25,
+    )
+
+    assert apportioner.update({2: 400000}) == largest_remainder(
+        quota_style="Droop", shares=apportioner.shares, total_allocation=25
+    )
+
+
+def test_apportioner_method_error(short_votes_list):
+    with pytest.raises(ValueError):
+        Apportioner(method="sainte_lague", shares=short_votes_list, total_allocation=5)
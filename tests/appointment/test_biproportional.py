@@ -0,0 +1,61 @@
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Biproportional method tests.
+"""
+
+import numpy as np
+
+from poli_sci_kit.appointment.methods import biproportional, highest_averages
+
+
+def test_biproportional():
+    shares = np.asarray(
+        [
+            [12000, 8000, 3000, 500],
+            [4000, 9000, 1000, 2500],
+            [7000, 2000, 6000, 0],
+        ]
+    )
+    district_allocations = [9, 7, 6]
+    allocations, stats = biproportional(
+        shares=shares, district_allocations=district_allocations, return_stats=True
+    )
+
+    assert stats["converged"]
+    assert stats["flaws"][-1] == 0
+    assert allocations.sum(axis=1).tolist() == district_allocations
+    assert allocations.sum(axis=0).tolist() == highest_averages(
+        averaging_style="Webster",
+        shares=shares.sum(axis=0).tolist(),
+        total_allocation=22,
+    )
+
+    # Allocations are Webster roundings of the shares over both divisors.
+    quotients = shares / np.outer(stats["row_divisors"], stats["column_divisors"])
+    assert ((quotients >= allocations - 0.5) & (quotients <= allocations + 0.5)).all()
+    assert (allocations[shares == 0] == 0).all()
+
+
+def test_biproportional_party_allocations():
+    allocations = biproportional(
+        shares=[[100, 100], [100, 100]],
+        district_allocations=[3, 1],
+        party_allocations=[1, 3],
+    )
+
+    assert allocations.sum(axis=0).tolist() == [1, 3]
+    assert allocations.sum(axis=1).tolist() == [3, 1]
+
+
+def test_biproportional_not_converged():
+    # The second party only has votes in a district with too few allocations.
+    _, stats = biproportional(
+        shares=[[100, 1000], [100, 0]],
+        district_allocations=[1, 5],
+        party_allocations=[3, 3],
+        max_iterations=20,
+        return_stats=True,
+    )
+
+    assert not stats["converged"]
+    assert stats["iterations"] == 20
@@ -0,0 +1,116 @@
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Seat-vote breakpoint tests.
+"""
+
+import pytest
+
+from poli_sci_kit.appointment.methods import (
+    highest_averages,
+    largest_remainder,
+    seat_vote_breakpoints,
+)
+
+
+def allocation_at(breakpoints, share):
+    return [a for s, a in breakpoints if s <= share][-1]
+
+
+@pytest.mark.parametrize(
+    "method, style, apportion",
+    [
+        ("highest_averages", "Jefferson", highest_averages),
+        ("highest_averages", "Webster", highest_averages),
+        ("highest_averages", "Huntington-Hill", highest_averages),
+        ("largest_remainder", "Hare", largest_remainder),
+        ("largest_remainder", "Droop", largest_remainder),
+        ("largest_remainder", "Hagenbach–Bischoff", largest_remainder),
+    ],
+)
+def test_seat_vote_breakpoints(method, style, apportion):
+    shares = [410, 270, 160, 95]
+    breakpoints = seat_vote_breakpoints(
+        method=method,
+        style=style,
+        shares=shares,
+        total_allocation=12,
+        group=2,
+        max_share=600,
+    )
+
+    assert breakpoints[0][0] == 0
+    for share in range(0, 601, 7):
+        if share in [410, 270, 95]:
+            continue
+
+        varied_shares = [410, 270, share, 95]
+        assert (
+            allocation_at(breakpoints, share) == apportion(style, varied_shares, 12)[2]
+        )
+
+
+def test_seat_vote_breakpoints_droop_millions():
+    shares = [4_000_000, 2_500_000, 1_200_000, 300_000]
+    breakpoints = seat_vote_breakpoints(
+        method="largest_remainder",
+        style="Droop",
+        shares=shares,
+        total_allocation=10,
+        group=1,
+    )
+
+    assert len(breakpoints) < 100
+    for share in [*range(0, 8_000_001, 99_991), *(s for s, _ in breakpoints)]:
+        for varied_share in [share - 1, share]:
+            if varied_share < 0 or varied_share in shares:
+                continue
+
+            varied_shares = [4_000_000, varied_share, 1_200_000, 300_000]
+            assert (
+                allocation_at(breakpoints, varied_share)
+                == largest_remainder("Droop", varied_shares, 10)[1]
+            )
+
+
+@pytest.mark.parametrize(
+    "shares, total_allocation",
+    [([27, 24], 11), ([35, 37], 12), ([13, 14], 7)],
+)
+def test_seat_vote_breakpoints_droop_small_quota(shares, total_allocation):
+    # Small Droop quotas leave more unallocated seats than groups for small shares.
+    breakpoints = seat_vote_breakpoints(
+        method="largest_remainder",
+        style="Droop",
+        shares=shares,
+        total_allocation=total_allocation,
+        group=0,
+    )
+
+    for share in range(0, sum(shares) + 1):
+        if share == shares[1]:
+            continue
+
+        assert (
+            allocation_at(breakpoints, share)
+            == largest_remainder("Droop", [share, shares[1]], total_allocation)[0]
+        )
+
+
+def test_seat_vote_breakpoints_exact():
+    shares = [2**54, 2**53 + 1]
+    float_breakpoints = seat_vote_breakpoints(
+        shares=shares, total_allocation=2, group=1
+    )
+    exact_breakpoints = seat_vote_breakpoints(
+        shares=shares, total_allocation=2, group=1, exact=True
+    )
+
+    assert allocation_at(float_breakpoints, 2**53 + 1) == 0
+    assert allocation_at(exact_breakpoints, 2**53 + 1) == 1
+
+
+def test_seat_vote_breakpoints_method_error():
+    with pytest.raises(ValueError):
+        seat_vote_breakpoints(
+            method="sainte_lague", shares=[1, 2], total_allocation=2, group=0
+        )
@@ -0,0 +1,58 @@
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Compensatory allocation tests.
+"""
+
+from poli_sci_kit.appointment.methods import compensatory_allocation, highest_averages
+
+
+def test_compensatory_allocation_no_overhang(short_votes_list):
+    assert compensatory_allocation(
+        averaging_style="Webster",
+        shares=short_votes_list,
+        direct_allocations=[2, 1, 1, 0, 0],
+        total_allocation=20,
+    ) == highest_averages(
+        averaging_style="Webster", shares=short_votes_list, total_allocation=20
+    )
+
+
+def test_compensatory_allocation_overhang(short_votes_list):
+    direct_allocations = [12, 1, 1, 0, 0]
+    allocations = compensatory_allocation(
+        averaging_style="Webster",
+        shares=short_votes_list,
+        direct_allocations=direct_allocations,
+        total_allocation=20,
+    )
+    assert all(a >= d for a, d in zip(allocations, direct_allocations, strict=True))
+
+    # The house is the smallest that covers all direct allocations.
+    assert allocations == highest_averages(
+        averaging_style="Webster",
+        shares=short_votes_list,
+        total_allocation=sum(allocations),
+    )
+    smaller = highest_averages(
+        averaging_style="Webster",
+        shares=short_votes_list,
+        total_allocation=sum(allocations) - 1,
+    )
+    assert any(a < d for a, d in zip(smaller, direct_allocations, strict=True))
+
+
+def test_compensatory_allocation_threshold(short_votes_list):
+    allocations = compensatory_allocation(
+        averaging_style="Jefferson",
+        shares=short_votes_list,
+        direct_allocations=[8, 0, 0, 0, 2],
+        total_allocation=30,
+        allocation_threshold=0.15,
+    )
+
+    assert allocations[-1] == 2
+    assert allocations[:-1] == highest_averages(
+        averaging_style="Jefferson",
+        shares=short_votes_list[:-1],
+        total_allocation=sum(allocations[:-1]),
+    )
@@ -0,0 +1,104 @@
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+District apportionment tests.
+"""
+
+import numpy as np
+import pytest
+
+from poli_sci_kit.appointment.districts import district_apportionment
+from poli_sci_kit.appointment.methods import highest_averages, largest_remainder
+
+
+@pytest.fixture
+def district_rows():
+    districts = ["b", "a", "b", "c", "a", "b", "c", "a"]
+    shares = [5000, 3000, 2500, 900, 1200, 800, 400, 700]
+
+    return districts, shares, {"a": 5, "b": 7, "c": 3}
+
+
+def test_district_apportionment(district_rows):
+    districts, shares, totals = district_rows
+    allocations = district_apportionment(
+        method="highest_averages",
+        style="Webster",
+        districts=districts,
+        shares=shares,
+        total_allocations=totals,
+    )
+
+    for district, total in totals.items():
+        rows = [i for i, d in enumerate(districts) if d == district]
+        assert allocations[rows].tolist() == highest_averages(
+            averaging_style="Webster",
+            shares=[shares[i] for i in rows],
+            total_allocation=total,
+        )
+
+
+def test_district_apportionment_process_pool(district_rows):
+    districts, shares, totals = district_rows
+
+    assert (
+        district_apportionment(
+            method="largest_remainder",
+            districts=districts,
+            shares=shares,
+            total_allocations=totals,
+            n_jobs=2,
+            chunk_size=1,
+        ).tolist()
+        == district_apportionment(
+            method="largest_remainder",
+            districts=districts,
+            shares=shares,
+            total_allocations=totals,
+        ).tolist()
+    )
+
+
+def test_district_apportionment_total(district_rows):
+    districts, shares, _ = district_rows
+    allocations = district_apportionment(
+        method="largest_remainder",
+        style="Droop",
+        districts=np.asarray(districts),
+        shares=np.asarray(shares),
+        total_allocations=4,
+    )
+
+    assert allocations.sum() == 12
+    assert allocations[[1, 4, 7]].tolist() == largest_remainder(
+        quota_style="Droop", shares=[3000, 1200, 700], total_allocation=4
+    )
+
+
+def test_district_apportionment_min_alloc(district_rows):
+    # Districts with fewer groups are not padded, and so only their groups receive minimum allocations.
+    districts, shares, totals = district_rows
+    allocations = district_apportionment(
+        method="largest_remainder",
+        districts=districts,
+        shares=shares,
+        total_allocations=totals,
+        min_alloc=1,
+    )
+
+    for district, total in totals.items():
+        rows = [i for i, d in enumerate(districts) if d == district]
+        assert allocations[rows].tolist() == largest_remainder(
+            shares=[shares[i] for i in rows], total_allocation=total, min_alloc=1
+        )
+
+
+def test_district_apportionment_method_error(district_rows):
+    districts, shares, totals = district_rows
+
+    with pytest.raises(ValueError):
+        district_apportionment(
+            method="sainte_lague",
+            districts=districts,
+            shares=shares,
+            total_allocations=totals,
+        )
@@ -3,7 +3,19 @@
 Highest Averages method tests.
 """
 
-from poli_sci_kit.appointment.methods import highest_averages
+import tracemalloc
+from itertools import islice
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from poli_sci_kit.appointment.methods import (
+    highest_averages,
+    highest_averages_batch,
+    register_divisor_method,
+    seat_priority_sequence,
+)
 
 
 def test_ha_sum(highest_averages_styles, votes, seats):
@@ -228,3 +240,329 @@ def test_ha_majority(tie_votes_list):
         )
         == results
     )
+
+
+def test_ha_majority_tie_break():
+    assert highest_averages(
+        averaging_style="Jefferson",
+        shares=[30, 15],
+        total_allocation=2,
+        tie_break="majority",
+    ) == [2, 0]
+
+
+def test_ha_divisor_search(highest_averages_styles, long_votes_list, seats_large):
+    assert highest_averages(
+        averaging_style=highest_averages_styles,
+        shares=long_votes_list,
+        total_allocation=seats_large,
+        divisor_search=True,
+    ) == highest_averages(
+        averaging_style=highest_averages_styles,
+        shares=long_votes_list,
+        total_allocation=seats_large,
+    )
+
+
+def test_ha_divisor_search_large_house(long_votes_list):
+    # Divisors are derived in closed form rather than from a table as long as the house.
+    tracemalloc.start()
+    try:
+        allocations = highest_averages(
+            averaging_style="Webster",
+            shares=long_votes_list,
+            total_allocation=10**7,
+            divisor_search=True,
+        )
+        _, peak = tracemalloc.get_traced_memory()
+
+    finally:
+        tracemalloc.stop()
+
+    assert sum(allocations) == 10**7
+    assert peak < 2**20
+    ideal_shares = [10**7 * v / sum(long_votes_list) for v in long_votes_list]
+    assert all(
+        abs(a - ideal) <= 1 for a, ideal in zip(allocations, ideal_shares, strict=True)
+    )
+
+
+def test_ha_divisor_search_modifier(short_votes_list):
+    assert highest_averages(
+        averaging_style="Jefferson",
+        shares=short_votes_list,
+        total_allocation=5,
+        modifier=0.5,
+        divisor_search=True,
+    ) == [2, 2, 1, 0, 0]
+
+
+def test_ha_divisor_search_tie_break():
+    assert highest_averages(
+        averaging_style="Jefferson",
+        shares=[30, 15],
+        total_allocation=2,
+        tie_break="majority",
+        divisor_search=True,
+    ) == [2, 0]
+
+
+def test_ha_batch(highest_averages_styles, long_votes_list, votes, seats_large):
+    shares = [long_votes_list[:4], votes, long_votes_list[-4:]]
+    allocations = highest_averages_batch(
+        averaging_style=highest_averages_styles,
+        shares=shares,
+        total_allocation=[seats_large, 20, 50],
+    )
+
+    assert allocations.shape == (3, 4)
+    assert allocations.tolist() == [
+        highest_averages(
+            averaging_style=highest_averages_styles, shares=s, total_allocation=t
+        )
+        for s, t in zip(shares, [seats_large, 20, 50])
+    ]
+
+
+def test_ha_batch_threshold(short_votes_list):
+    assert highest_averages_batch(
+        averaging_style="Jefferson",
+        shares=[short_votes_list, short_votes_list],
+        total_allocation=200,
+        allocation_threshold=0.2,
+    ).tolist() == [[118, 82, 0, 0, 0], [118, 82, 0, 0, 0]]
+
+
+def test_ha_batch_tie_break():
+    assert highest_averages_batch(
+        averaging_style="Jefferson",
+        shares=[[30, 15], [15, 30]],
+        total_allocation=2,
+        tie_break="majority",
+    ).tolist() == [[2, 0], [0, 2]]
+
+
+def test_ha_seat_priority_sequence(highest_averages_styles, votes, seats_val):
+    min_alloc = 1 if highest_averages_styles == "Huntington-Hill" else 0
+    allocations = [min_alloc] * len(votes)
+    for i, _, _ in islice(
+        seat_priority_sequence(averaging_style=highest_averages_styles, shares=votes),
+        seats_val - sum(allocations),
+    ):
+        allocations[i] += 1
+
+    assert (
+        highest_averages(
+            averaging_style=highest_averages_styles,
+            shares=votes,
+            total_allocation=seats_val,
+        )
+        == allocations
+    )
+
+
+@pytest.mark.parametrize(
+    "averaging_style, modifier, shares, total_allocation",
+    [
+        ("Adams", 0.6, [200, 400, 400], 2),
+        ("Webster", 0.6, [800, 700, 700], 4),
+        ("Dean", 3, [200, 400, 400, 200], 4),
+        ("Jefferson", 2, [300, 300, 600], 4),
+    ],
+)
+def test_ha_seat_priority_sequence_modifier(
+    averaging_style, modifier, shares, total_allocation
+):
+    allocations = [0] * len(shares)
+    for i, _, _ in islice(
+        seat_priority_sequence(
+            averaging_style=averaging_style, shares=shares, modifier=modifier
+        ),
+        total_allocation,
+    ):
+        allocations[i] += 1
+
+    assert (
+        highest_averages(
+            averaging_style=averaging_style,
+            shares=shares,
+            total_allocation=total_allocation,
+            tie_break="majority",
+            modifier=modifier,
+        )
+        == allocations
+    )
+
+
+def test_ha_seat_priority_sequence_seat_numbers(votes):
+    sequence = seat_priority_sequence(
+        averaging_style="Huntington-Hill", shares=votes, min_alloc=2
+    )
+
+    assert [seat for _, _, seat in islice(sequence, 3)] == [9, 10, 11]
+
+
+def test_ha_exact(highest_averages_styles, long_votes_list, seats_large):
+    assert highest_averages(
+        averaging_style=highest_averages_styles,
+        shares=long_votes_list,
+        total_allocation=seats_large,
+        exact=True,
+    ) == highest_averages(
+        averaging_style=highest_averages_styles,
+        shares=long_votes_list,
+        total_allocation=seats_large,
+    )
+
+
+def test_ha_exact_array(highest_averages_styles, long_votes_list, seats_large):
+    assert highest_averages(
+        averaging_style=highest_averages_styles,
+        shares=np.array(long_votes_list),
+        total_allocation=seats_large,
+        exact=True,
+    ).tolist() == highest_averages(
+        averaging_style=highest_averages_styles,
+        shares=long_votes_list,
+        total_allocation=seats_large,
+        exact=True,
+    )
+
+
+def test_ha_exact_float_tie():
+    # Quotients of 2**53 and 2**53 + 1 are equal as floats.
+    shares = [2**54, 2**53 + 1]
+
+    assert highest_averages(
+        averaging_style="Jefferson", shares=shares, total_allocation=2
+    ) == [2, 0]
+    assert highest_averages(
+        averaging_style="Jefferson", shares=shares, total_allocation=2, exact=True
+    ) == [1, 1]
+    assert highest_averages(
+        averaging_style="Jefferson",
+        shares=np.array(shares),
+        total_allocation=2,
+        exact=True,
+    ).tolist() == [1, 1]
+
+
+def test_ha_exact_modifier_tie():
+    # 4 / 1.4 and 20 / 7 are equal, with the majority tie break favoring the larger share.
+    shares = [6, 16, 10, 4, 10, 8, 20]
+    for divisor_search in [False, True]:
+        assert highest_averages(
+            averaging_style="Jefferson",
+            shares=shares,
+            total_allocation=23,
+            modifier=1.4,
+            divisor_search=divisor_search,
+            exact=True,
+        ) == [2, 5, 3, 1, 3, 2, 7]
+
+    assert highest_averages(
+        averaging_style="Jefferson",
+        shares=np.array(shares),
+        total_allocation=23,
+        modifier=1.4,
+        exact=True,
+    ).tolist() == [2, 5, 3, 1, 3, 2, 7]
+
+
+def test_ha_adams(short_votes_list):
+    assert highest_averages(
+        averaging_style="Adams", shares=short_votes_list, total_allocation=5
+    ) == [1, 1, 1, 1, 1]
+
+
+def test_ha_imperiali_dean():
+    shares = [1000, 10, 1]
+
+    assert highest_averages(
+        averaging_style="Imperiali", shares=shares, total_allocation=5
+    ) == [5, 0, 0]
+    assert highest_averages(
+        averaging_style="Dean", shares=shares, total_allocation=5
+    ) == [3, 1, 1]
+
+
+def test_ha_register_divisor_method(long_votes_list, seats_large):
+    register_divisor_method(
+        name="Doubled Jefferson", squared_divisor=lambda a: ((2 * a + 2) ** 2, 1)
+    )
+
+    assert highest_averages(
+        averaging_style="Doubled Jefferson",
+        shares=long_votes_list,
+        total_allocation=seats_large,
+        divisor_search=True,
+    ) == highest_averages(
+        averaging_style="Jefferson",
+        shares=long_votes_list,
+        total_allocation=seats_large,
+    )
+    assert highest_averages(
+        averaging_style="Doubled Jefferson",
+        shares=long_votes_list,
+        total_allocation=10**7,
+        divisor_search=True,
+    ) == highest_averages(
+        averaging_style="Jefferson",
+        shares=long_votes_list,
+        total_allocation=10**7,
+        divisor_search=True,
+    )
+
+
+def test_ha_rng():
+    shares = [[1, 1, 1, 1, 1, 1, 1, 1]] * 20
+    results = [
+        highest_averages_batch(
+            averaging_style="Jefferson",
+            shares=shares,
+            total_allocation=3,
+            tie_break="random",
+            rng=np.random.default_rng(seed),
+        ).tolist()
+        for seed in [7, 7, 8]
+    ]
+
+    assert results[0] == results[1] != results[2]
+    assert len({tuple(r) for r in results[0]}) > 1
+    assert highest_averages(
+        shares=shares[0], total_allocation=3, tie_break="random", rng=7
+    ) == highest_averages(
+        shares=shares[0], total_allocation=3, tie_break="random", rng=7
+    )
+
+
+def test_ha_array_input(highest_averages_styles, long_votes_list, seats_large):
+    allocations = highest_averages(
+        averaging_style=highest_averages_styles,
+        shares=long_votes_list,
+        total_allocation=seats_large,
+    )
+
+    array_allocations = highest_averages(
+        averaging_style=highest_averages_styles,
+        shares=np.asarray(long_votes_list),
+        total_allocation=seats_large,
+    )
+    assert isinstance(array_allocations, np.ndarray)
+    assert array_allocations.tolist() == allocations
+
+    index = [f"party_{i}" for i in range(len(long_votes_list))]
+    series_allocations = highest_averages(
+        averaging_style=highest_averages_styles,
+        shares=pd.Series(long_votes_list, index=index, name="votes"),
+        total_allocation=seats_large,
+        majority_bonus=True,
+    )
+    assert isinstance(series_allocations, pd.Series)
+    assert series_allocations.index.tolist() == index
+    assert series_allocations.tolist() == highest_averages(
+        averaging_style=highest_averages_styles,
+        shares=long_votes_list,
+        total_allocation=seats_large,
+        majority_bonus=True,
+    )
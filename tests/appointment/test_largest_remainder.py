@@ -3,7 +3,21 @@
 Largest Remainder method tests.
 """
 
-from poli_sci_kit.appointment.methods import largest_remainder
+from array import array
+
+import numpy as np
+import pandas as pd
+
+from poli_sci_kit.appointment.methods import (
+    clear_result_cache,
+    disable_result_cache,
+    enable_result_cache,
+    highest_averages,
+    largest_remainder,
+    largest_remainder_batch,
+    largest_remainder_sweep,
+    result_cache_info,
+)
 
 
 def test_lr_sum(largest_remainder_styles, votes, seats):
@@ -223,3 +237,222 @@ def test_lr_majority(tie_votes_list):
         )
         == results
     )
+
+
+def test_lr_batch(largest_remainder_styles, long_votes_list, votes, seats_large):
+    shares = [long_votes_list[:4], votes, long_votes_list[-4:]]
+    allocations = largest_remainder_batch(
+        quota_style=largest_remainder_styles,
+        shares=shares,
+        total_allocation=[seats_large, 20, 50],
+    )
+
+    assert allocations.shape == (3, 4)
+    assert allocations.tolist() == [
+        largest_remainder(
+            quota_style=largest_remainder_styles, shares=s, total_allocation=t
+        )
+        for s, t in zip(shares, [seats_large, 20, 50])
+    ]
+
+
+def test_lr_batch_min_alloc(long_votes_list, votes):
+    shares = [long_votes_list[-4:], votes]
+    allocations = largest_remainder_batch(
+        quota_style="Hare", shares=shares, total_allocation=20, min_alloc=3
+    )
+
+    assert allocations.tolist() == [
+        largest_remainder(
+            quota_style="Hare", shares=s, total_allocation=20, min_alloc=3
+        )
+        for s in shares
+    ]
+
+
+def test_lr_sweep(largest_remainder_styles, long_votes_list):
+    allocations = largest_remainder_sweep(
+        quota_style=largest_remainder_styles,
+        shares=long_votes_list,
+        total_allocations=range(len(long_votes_list), 200),
+    )
+
+    assert allocations.shape == (200 - len(long_votes_list), len(long_votes_list))
+    assert allocations.dtype == "int32"
+    assert (allocations.sum(axis=1) == range(len(long_votes_list), 200)).all()
+    assert allocations[-1].tolist() == largest_remainder(
+        quota_style=largest_remainder_styles,
+        shares=long_votes_list,
+        total_allocation=199,
+    )
+
+
+def test_lr_majority_tie_break():
+    assert largest_remainder(
+        quota_style="Hare",
+        shares=[2, 1],
+        total_allocation=3,
+        tie_break="majority",
+    ) == [2, 1]
+
+
+def test_lr_exact(largest_remainder_styles, long_votes_list, seats_large):
+    assert largest_remainder(
+        quota_style=largest_remainder_styles,
+        shares=long_votes_list,
+        total_allocation=seats_large,
+        exact=True,
+    ) == largest_remainder(
+        quota_style=largest_remainder_styles,
+        shares=long_votes_list,
+        total_allocation=seats_large,
+    )
+
+
+def test_lr_exact_array(largest_remainder_styles, long_votes_list, seats_large):
+    assert largest_remainder(
+        quota_style=largest_remainder_styles,
+        shares=np.array(long_votes_list),
+        total_allocation=seats_large,
+        exact=True,
+    ).tolist() == largest_remainder(
+        quota_style=largest_remainder_styles,
+        shares=long_votes_list,
+        total_allocation=seats_large,
+        exact=True,
+    )
+
+    # Shares that could overflow int64 are divided as Python integers.
+    assert largest_remainder(
+        quota_style=largest_remainder_styles,
+        shares=np.array([10**18, 3 * 10**17, 5], dtype=object),
+        total_allocation=7,
+        exact=True,
+    ).tolist() == largest_remainder(
+        quota_style=largest_remainder_styles,
+        shares=[10**18, 3 * 10**17, 5],
+        total_allocation=7,
+        exact=True,
+    )
+
+
+def test_lr_result_cache(short_votes_list):
+    enable_result_cache(maxsize=1)
+    try:
+        first = largest_remainder(shares=short_votes_list, total_allocation=10)
+        first[0] = -1
+        assert largest_remainder(
+            shares=short_votes_list, total_allocation=10
+        ) == largest_remainder(
+            shares=short_votes_list, total_allocation=10, tie_break="random"
+        )
+        largest_remainder(shares=short_votes_list, total_allocation=11)
+
+        assert result_cache_info() == {
+            "hits": 1,
+            "misses": 2,
+            "maxsize": 1,
+            "currsize": 1,
+        }
+
+        clear_result_cache()
+        assert result_cache_info()["hits"] == 0
+
+    finally:
+        disable_result_cache()
+
+
+def test_lr_result_cache_generator(short_votes_list):
+    enable_result_cache(maxsize=2)
+    try:
+        for _ in range(2):
+            assert largest_remainder(
+                shares=(v for v in short_votes_list), total_allocation=10
+            ) == largest_remainder(shares=short_votes_list, total_allocation=10)
+            assert highest_averages(
+                shares=(v for v in short_votes_list), total_allocation=10
+            ) == highest_averages(shares=short_votes_list, total_allocation=10)
+
+        largest_remainder(
+            shares=short_votes_list,
+            total_allocation=10,
+            rng=np.random.default_rng(42),
+        )
+        assert result_cache_info()["hits"] == 6
+        assert result_cache_info()["misses"] == 2
+
+    finally:
+        disable_result_cache()
+
+
+def test_lr_result_cache_random_fallback():
+    enable_result_cache()
+    try:
+        # Equal shares and remainders fall back to random tie breaks.
+        largest_remainder(shares=[1, 1, 1], total_allocation=1)
+
+        assert result_cache_info()["currsize"] == 0
+
+    finally:
+        disable_result_cache()
+
+
+def test_lr_rng():
+    results = [
+        largest_remainder(
+            shares=[1] * 10, total_allocation=5, tie_break="random", rng=seed
+        )
+        for seed in range(20)
+    ]
+
+    assert results == [
+        largest_remainder(
+            shares=[1] * 10,
+            total_allocation=5,
+            tie_break="random",
+            rng=np.random.default_rng(seed),
+        )
+        for seed in range(20)
+    ]
+    assert len({tuple(r) for r in results}) > 1
+
+
+def test_lr_array_input(largest_remainder_styles, long_votes_list, seats_large):
+    allocations = largest_remainder(
+        quota_style=largest_remainder_styles,
+        shares=long_votes_list,
+        total_allocation=seats_large,
+    )
+
+    array_allocations = largest_remainder(
+        quota_style=largest_remainder_styles,
+        shares=np.asarray(long_votes_list),
+        total_allocation=seats_large,
+    )
+    assert isinstance(array_allocations, np.ndarray)
+    assert array_allocations.tolist() == allocations
+
+    index = [f"party_{i}" for i in range(len(long_votes_list))]
+    series_allocations = largest_remainder(
+        quota_style=largest_remainder_styles,
+        shares=pd.Series(long_votes_list, index=index, name="votes"),
+        total_allocation=seats_large,
+        majority_bonus=True,
+    )
+    assert isinstance(series_allocations, pd.Series)
+    assert series_allocations.index.tolist() == index
+    assert series_allocations.tolist() == largest_remainder(
+        quota_style=largest_remainder_styles,
+        shares=long_votes_list,
+        total_allocation=seats_large,
+        majority_bonus=True,
+    )
+
+    # Buffers are returned as arrays.
+    buffer_allocations = largest_remainder(
+        quota_style=largest_remainder_styles,
+        shares=array("q", long_votes_list),
+        total_allocation=seats_large,
+    )
+    assert isinstance(buffer_allocations, np.ndarray)
+    assert buffer_allocations.tolist() == allocations
@@ -3,10 +3,18 @@
 Appointment metric tests.
 """
 
+import numpy as np
+import pytest
+
 from poli_sci_kit.appointment.metrics import (
+    DisproportionalityAccumulator,
+    DiversityAccumulator,
     alloc_to_share_ratio,
+    disproportionality_batch,
     disproportionality_index,
+    disproportionality_report,
     diversity_index,
+    diversity_profile,
     effective_number_of_groups,
     ideal_share,
     representative_weight,
@@ -130,3 +138,144 @@ def test_effective_number_of_groups_not_0(short_votes_list, effective_group_metr
         )
         != 0
     )
+
+
+def test_disproportionality_report(short_votes_list, allocations):
+    report = disproportionality_report(shares=short_votes_list, allocations=allocations)
+
+    assert list(report) == [
+        "Gallagher",
+        "Loosemore–Hanby",
+        "Rose",
+        "Rae",
+        "Sainte-Laguë",
+        "d’Hondt",
+        "Cox-Shugart",
+    ]
+    for metric_type, index in report.items():
+        assert index == pytest.approx(
+            disproportionality_index(
+                shares=short_votes_list,
+                allocations=allocations,
+                metric_type=metric_type,
+            )
+        )
+
+
+def test_disproportionality_batch(short_votes_list, long_votes_list, allocations):
+    shares = [short_votes_list, long_votes_list[:5], [40, 30, 20, 0, 0]]
+    election_allocations = [allocations, [3, 6, 5, 4, 2], [4, 3, 2, 0, 0]]
+    mask = [[True] * 5, [True] * 5, [True, True, True, False, False]]
+    indexes = disproportionality_batch(
+        shares=shares, allocations=election_allocations, mask=mask
+    )
+
+    for metric_type, election_indexes in indexes.items():
+        assert election_indexes.shape == (3,)
+        assert election_indexes.tolist() == pytest.approx(
+            [
+                disproportionality_index(
+                    shares=[s for s, m in zip(sh, ms, strict=True) if m],
+                    allocations=[a for a, m in zip(al, ms, strict=True) if m],
+                    metric_type=metric_type,
+                )
+                for sh, al, ms in zip(shares, election_allocations, mask, strict=True)
+            ]
+        )
+
+    assert np.array_equal(
+        disproportionality_batch(
+            shares=shares[:2], allocations=election_allocations[:2]
+        )["Gallagher"],
+        indexes["Gallagher"][:2],
+    )
+
+
+def test_diversity_profile(short_votes_list, long_votes_list):
+    q = [0.5, 1, 2, 3, np.inf]
+    profiles = diversity_profile(shares=[short_votes_list, long_votes_list[:5]], q=q)
+
+    assert profiles.shape == (2, 5)
+    for shares, profile in zip(
+        [short_votes_list, long_votes_list[:5]], profiles, strict=True
+    ):
+        assert profile[:4].tolist() == pytest.approx(
+            [
+                diversity_index(shares=shares, q=o, metric_type="Effective")
+                for o in q[:4]
+            ]
+        )
+        # Infinite orders give the inverse of the Berger-Parker index.
+        assert profile[4] == pytest.approx(
+            1 / diversity_index(shares=shares, metric_type="Berger-Parker")
+        )
+
+    renyi_profile = diversity_profile(shares=short_votes_list, q=q, metric_type="Renyi")
+    assert renyi_profile.shape == (5,)
+    assert renyi_profile[1] == pytest.approx(
+        diversity_index(shares=short_votes_list, metric_type="Shannon")
+    )
+    assert renyi_profile[2] == pytest.approx(
+        diversity_index(shares=short_votes_list, q=2, metric_type="Renyi")
+    )
+
+    # Large orders approach the limit rather than underflowing.
+    assert diversity_profile(shares=short_votes_list, q=[1000.0])[0] == pytest.approx(
+        profiles[0, 4], rel=1e-2
+    )
+
+
+def test_diversity_accumulator(short_votes_list, diversity_index_metrics):
+    accumulator = DiversityAccumulator(shares=[0] * len(short_votes_list))
+    for i, share in enumerate(short_votes_list):
+        accumulator.update(deltas={i: share})
+
+    assert accumulator.shares == short_votes_list
+    assert accumulator.effective_number_of_groups() == pytest.approx(
+        effective_number_of_groups(shares=short_votes_list)
+    )
+    if diversity_index_metrics in ["Shannon", "Simpson", "Gini-Simpson"]:
+        assert accumulator.diversity_index(
+            metric_type=diversity_index_metrics
+        ) == pytest.approx(
+            diversity_index(
+                shares=short_votes_list, metric_type=diversity_index_metrics
+            )
+        )
+
+
+def test_disproportionality_accumulator(short_votes_list, allocations):
+    halves = [s // 2 for s in short_votes_list]
+    first_shard = DisproportionalityAccumulator(
+        shares=halves, allocations=[0] * len(allocations)
+    )
+    second_shard = DisproportionalityAccumulator(
+        shares=[s - h for s, h in zip(short_votes_list, halves, strict=True)],
+        allocations=[0] * len(allocations),
+    )
+    second_shard.update(allocation_deltas=dict(enumerate(allocations)))
+
+    accumulator = first_shard.merge(second_shard)
+    assert accumulator.shares == short_votes_list
+    assert accumulator.allocations == allocations
+    for metric_type in ["Gallagher", "Loosemore–Hanby", "Rose"]:
+        assert accumulator.disproportionality_index(
+            metric_type=metric_type
+        ) == pytest.approx(
+            disproportionality_index(
+                shares=short_votes_list,
+                allocations=allocations,
+                metric_type=metric_type,
+            )
+        )
+
+    accumulator.update(share_deltas={0: 1000}, allocation_deltas={0: 1, 1: -1})
+    assert accumulator.disproportionality_index() == pytest.approx(
+        disproportionality_index(
+            shares=[short_votes_list[0] + 1000, *short_votes_list[1:]],
+            allocations=[allocations[0] + 1, allocations[1] - 1, *allocations[2:]],
+        )
+    )
+
+    with pytest.raises(ValueError):
+        accumulator.disproportionality_index(metric_type="Rae")
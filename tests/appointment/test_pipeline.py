@@ -0,0 +1,100 @@
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Pipeline tests.
+"""
+
+import asyncio
+
+import pytest
+
+from poli_sci_kit.appointment.methods import highest_averages
+from poli_sci_kit.appointment.metrics import disproportionality_index
+from poli_sci_kit.appointment.pipeline import apportion_stream
+
+RECORDS = [
+    ("north", "A", 5000),
+    ("north", "B", 3000),
+    ("south", "A", 1000),
+    ("north", "C", 1500),
+    ("south", "B", 4000),
+    ("north", "A", -500),
+    ("south", "C", 2500),
+]
+
+
+async def queue_records(queue: asyncio.Queue):
+    """
+    Yield records from an in-memory queue until None is received.
+    """
+    while (record := await queue.get()) is not None:
+        yield record
+
+
+async def run_stream(records: list, pause_after: int | None = None, **kwargs):
+    """
+    Feed records through an in-memory queue into apportion_stream.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    projections = []
+
+    async def callback(projection):
+        projections.append(projection)
+
+    async def produce():
+        for i, record in enumerate(records):
+            await queue.put(record)
+            if i + 1 == pause_after:
+                await asyncio.sleep(0.05)
+
+        await queue.put(None)
+
+    _, final = await asyncio.gather(
+        produce(),
+        apportion_stream(records=queue_records(queue), callback=callback, **kwargs),
+    )
+
+    return projections, final
+
+
+def test_apportion_stream():
+    projections, final = asyncio.run(
+        run_stream(records=RECORDS, total_allocations={"north": 7, "south": 5})
+    )
+
+    assert projections[-1]["records"] == len(RECORDS)
+    assert final["north"]["parties"] == ["A", "B", "C"]
+    assert final["north"]["shares"] == [4500, 3000, 1500]
+    assert final["north"]["allocations"] == highest_averages(
+        shares=[4500, 3000, 1500], total_allocation=7
+    )
+    assert final["south"]["disproportionality"] == pytest.approx(
+        disproportionality_index(
+            shares=[1000, 4000, 2500],
+            allocations=final["south"]["allocations"],
+        )
+    )
+
+
+def test_apportion_stream_batches():
+    projections, _ = asyncio.run(
+        run_stream(
+            records=RECORDS,
+            pause_after=2,
+            total_allocations=5,
+            method="largest_remainder",
+            batch_interval=0.01,
+        )
+    )
+
+    assert len(projections) == 2
+    assert projections[0]["records"] == 2
+    assert list(projections[0]["regions"]) == ["north"]
+    assert set(projections[1]["regions"]) == {"north", "south"}
+
+
+def test_apportion_stream_max_batch_size():
+    projections, _ = asyncio.run(
+        run_stream(records=RECORDS, total_allocations=5, max_batch_size=3)
+    )
+
+    assert [p["records"] for p in projections] == [3, 6, 7]
@@ -0,0 +1,154 @@
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Allocation result tests.
+"""
+
+import numpy as np
+import pytest
+
+from poli_sci_kit.appointment.checks import quota_condition
+from poli_sci_kit.appointment.methods import highest_averages, largest_remainder
+from poli_sci_kit.appointment.metrics import disproportionality_index
+from poli_sci_kit.appointment.results import AllocationResult
+
+
+def test_allocation_result_sequence():
+    result = AllocationResult(shares=[30, 20, 10], allocations=[3, 2, 1])
+
+    assert result == [3, 2, 1]
+    assert list(result) == [3, 2, 1]
+    assert len(result) == 3
+    assert result[0] == 3 and result[1:] == [2, 1]
+    assert result.total_allocation == 6
+    assert result.ideal_shares.tolist() == [3.0, 2.0, 1.0]
+    assert result.tied.tolist() == []
+
+    with pytest.raises(AttributeError):
+        result.seats = [3, 2, 1]
+
+
+def test_largest_remainder_result():
+    shares = [2700, 900, 3300, 1300, 2100, 500]
+    result = largest_remainder(
+        quota_style="Hare", shares=shares, total_allocation=20, return_result=True
+    )
+
+    assert isinstance(result, AllocationResult)
+    assert result == largest_remainder(
+        quota_style="Hare", shares=shares, total_allocation=20
+    )
+    assert result.method == "largest_remainder" and result.style == "Hare"
+    assert result.quota == sum(shares) / 20
+    assert result.remainders.tolist() == pytest.approx(
+        [s / result.quota % 1 for s in shares]
+    )
+
+    tied_result = largest_remainder(
+        shares=[10, 10, 10], total_allocation=2, tie_break="random", return_result=True
+    )
+    assert tied_result.tied.tolist() == [0, 1, 2]
+
+
+def test_largest_remainder_result_majority_bonus():
+    result = largest_remainder(
+        quota_style="Hare",
+        shares=[10, 30, 20, 40],
+        total_allocation=10,
+        majority_bonus=True,
+        return_result=True,
+    )
+
+    # The quota and remainders are those of the groups other than the majority.
+    assert result == [1, 2, 2, 5]
+    assert result.quota == 60 / 5
+    assert result.remainders[:3].tolist() == pytest.approx([10 / 12, 0.5, 20 / 12 % 1])
+    assert np.isnan(result.remainders[3])
+
+
+def test_highest_averages_result():
+    shares = [2700, 900, 3300, 1300, 2100, 500]
+    result = highest_averages(
+        averaging_style="Webster",
+        shares=shares,
+        total_allocation=20,
+        return_result=True,
+    )
+
+    assert result == highest_averages(
+        averaging_style="Webster", shares=shares, total_allocation=20
+    )
+    assert result.method == "highest_averages" and result.style == "Webster"
+    assert result.quotients.tolist() == pytest.approx(
+        [s / (2 * a + 1) for s, a in zip(shares, result, strict=True)]
+    )
+    # The next quotients are all lower than the lowest quotient that received an allocation.
+    assert result.quotients.max() <= min(
+        s / (2 * a - 1) for s, a in zip(shares, result, strict=True) if a
+    )
+
+    tied_result = highest_averages(
+        shares=[10, 10, 10], total_allocation=4, tie_break="random", return_result=True
+    )
+    assert tied_result.tied.tolist() == [0, 1, 2]
+
+
+def test_result_keeps_provided_shares():
+    shares = [2700, 900, 3300, 1300, 2100, 500]
+    result = highest_averages(
+        shares=shares,
+        total_allocation=20,
+        allocation_threshold=0.1,
+        return_result=True,
+    )
+
+    assert result.shares.tolist() == shares
+    assert result.quotients[5] == 0.0
+
+
+def test_result_majority_bonus_ties():
+    # The bonus resolves the tie of the smaller groups.
+    lr_result = largest_remainder(
+        shares=[10, 10, 20, 30],
+        total_allocation=3,
+        tie_break="random",
+        majority_bonus=True,
+        return_result=True,
+    )
+    assert lr_result == [0, 0, 1, 2]
+    assert lr_result.tied.tolist() == []
+
+    # Ties of the other groups are indexed among all groups.
+    ha_result = highest_averages(
+        shares=[10, 20, 10, 10],
+        total_allocation=5,
+        tie_break="random",
+        majority_bonus=True,
+        return_result=True,
+    )
+    assert ha_result[1] == 3
+    assert ha_result.tied.tolist() == [0, 2, 3]
+
+
+@pytest.mark.parametrize(
+    "metric_type", ["Gallagher", "Loosemore–Hanby", "Rose", "Rae", "Cox-Shugart"]
+)
+def test_metrics_accept_result(metric_type):
+    shares = [2700, 900, 3300, 1300, 2100, 500]
+    result = largest_remainder(shares=shares, total_allocation=20, return_result=True)
+
+    assert disproportionality_index(
+        allocations=result, metric_type=metric_type
+    ) == pytest.approx(
+        disproportionality_index(
+            shares=shares, allocations=result.tolist(), metric_type=metric_type
+        )
+    )
+
+
+def test_checks_accept_result():
+    shares = [2700, 900, 3300, 1300, 2100, 500]
+    result = highest_averages(shares=shares, total_allocation=20, return_result=True)
+
+    assert quota_condition(seats=result) == quota_condition(
+        shares=shares, seats=result.tolist()
+    )
@@ -0,0 +1,62 @@
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Simulation tests.
+"""
+
+import numpy as np
+import pytest
+
+from poli_sci_kit.appointment.simulation import simulate_allocations
+
+
+def test_simulate_allocations(short_votes_list):
+    results = simulate_allocations(
+        method="highest_averages",
+        style="Webster",
+        shares=short_votes_list,
+        total_allocation=20,
+        num_draws=500,
+        chunk_size=128,
+        rng=0,
+    )
+
+    assert results["histograms"].shape == (len(short_votes_list), 21)
+    assert (results["histograms"].sum(axis=1) == 500).all()
+    assert results["mean_allocations"].sum() == pytest.approx(20)
+    assert (results["majority_probabilities"] == 0).all()
+
+
+def test_simulate_allocations_reproducible(short_votes_list):
+    kwargs = {
+        "method": "largest_remainder",
+        "shares": short_votes_list,
+        "total_allocation": 10,
+        "num_draws": 300,
+        "distribution": "multinomial",
+        "sample_size": 200,
+    }
+    results = simulate_allocations(rng=1, **kwargs)
+
+    assert np.array_equal(
+        results["histograms"], simulate_allocations(rng=1, **kwargs)["histograms"]
+    )
+
+
+def test_simulate_allocations_majority():
+    results = simulate_allocations(
+        shares=[0.6, 0.3, 0.1, 0.0],
+        total_allocation=10,
+        num_draws=200,
+        sample_size=100000,
+        rng=2,
+    )
+
+    assert results["majority_probabilities"].tolist() == [1.0, 0.0, 0.0, 0.0]
+    assert results["histograms"][3, 0] == 200
+
+
+def test_simulate_allocations_distribution_error(short_votes_list):
+    with pytest.raises(ValueError):
+        simulate_allocations(
+            shares=short_votes_list, total_allocation=10, distribution="normal"
+        )
@@ -100,7 +100,17 @@ def largest_remainder_styles(request):
     return request.param
 
 
-@pytest.fixture(params=["Jefferson", "Webster", "Huntington-Hill"])
+@pytest.fixture(
+    params=[
+        "Jefferson",
+        "Webster",
+        "Huntington-Hill",
+        "Adams",
+        "Dean",
+        "Danish",
+        "Imperiali",
+    ]
+)
 def highest_averages_styles(request):
     return request.param
 
@@ -0,0 +1,58 @@
+# SPDX-License-Identifier: BSD-3-Clause
+"""
+Lazy import tests.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import poli_sci_kit
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import poli_sci_kit",
+        "from poli_sci_kit.appointment.methods import highest_averages",
+        "from poli_sci_kit.appointment.metrics import disproportionality_index",
+        "from poli_sci_kit.appointment.checks import quota_condition",
+    ],
+)
+def test_heavy_dependencies_not_imported(statement):
+    # A new interpreter is used as the test session has already imported all modules.
+    loaded = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"{statement}; import sys; print(sorted(m for m in ('matplotlib', 'pandas', 'scipy', 'seaborn', 'colormath') if m in sys.modules))",
+        ],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        text=True,
+    ).stdout.strip()
+
+    assert loaded == "[]"
+
+
+def test_lazy_attributes():
+    assert poli_sci_kit.appointment.methods.highest_averages(
+        shares=[3, 2, 1], total_allocation=4
+    ) == [3, 1, 0]
+    assert callable(poli_sci_kit.plot.parliament_plot)
+    assert "appointment" in dir(poli_sci_kit)
+
+    with pytest.raises(AttributeError):
+        poli_sci_kit.not_a_module
+
+
+def test_plot_functions_after_submodule_import():
+    # Importing a submodule sets the package attribute of its name to the module.
+    import poli_sci_kit.plot.disproportionality_bar_plot
+    import poli_sci_kit.plot.parliament_plot  # noqa: F401
+
+    assert callable(poli_sci_kit.plot.parliament_plot)
+    assert callable(poli_sci_kit.plot.disproportionality_bar_plot)
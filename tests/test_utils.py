@@ -3,6 +3,9 @@
 Utilities for tests.
 """
 
+import numpy as np
+import pytest
+
 from poli_sci_kit.utils import (
     gen_faction_groups,
     gen_list_of_lists,
@@ -17,6 +20,23 @@
 
 def test_normalize():
     assert sum(normalize([1, 2, 3, 4, 5])) == 1.0
+    assert normalize([]) == []
+
+
+def test_normalize_array():
+    vals = np.array([[1, 3], [2, 2], [0, 0]])
+    out = np.empty(vals.shape)
+
+    assert normalize(vals, out=out, zero_total="zero") is out
+    assert out.tolist() == [[0.25, 0.75], [0.5, 0.5], [0.0, 0.0]]
+    assert np.isnan(normalize(vals, zero_total="nan")[2]).all()
+    assert normalize(vals, axis=0).tolist() == [[1 / 3, 0.6], [2 / 3, 0.4], [0, 0]]
+
+    assert normalize(np.array([])).shape == (0,)
+    assert normalize(np.empty((3, 0))).shape == (3, 0)
+
+    with pytest.raises(ZeroDivisionError):
+        normalize([0, 0])
 
 
 def test_gen_list_of_lists():